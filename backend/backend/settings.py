@@ -13,6 +13,8 @@ ENVIRONMENT = env('ENVIRONMENT')
 
 # Fetch the API key
 OPENAI_API_KEY = env("OPENAI_API_KEY")
+# Another OpenAI-compatible endpoint, e.g. a proxy or a local mock server. None uses api.openai.com
+OPENAI_BASE_URL = env("OPENAI_BASE_URL", default=None)
 SECRET_KEY = env("DJANGO_SECRET_KEY")
 
 
@@ -184,6 +186,85 @@ CELERY_BROKER_URL = 'redis://redis:6379/0'
 CELERY_RESULT_BACKEND = 'django-db'
 CELERY_RESULT_EXTEND = True
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
+# Summaries run on their own queue and worker (celery_summaries), so slow OpenAI calls
+# never hold up scraping. Its concurrency bounds the parallel OpenAI requests.
+CELERY_TASK_ROUTES = {
+    'jobs.tasks.summarize_jobs_task': {'queue': 'summaries'},
+}
+
+# Summaries
+# 'eager': every saved job is summarized on the summaries queue. 'lazy': save_jobs skips summaries and
+# GET /api/jobs/{id}/summary queues one on the summaries queue when a job is first viewed, so OpenAI spend
+# follows views.
+SUMMARY_MODE = 'eager'
+SUMMARY_BATCH_SIZE = 10  # jobs summarized per task and written back with one UPDATE
+SUMMARY_CACHE_TTL = 7 * 24 * 60 * 60  # seconds a summary stays in the Redis hot tier, the table keeps it
+# Per worker process, the summaries worker's --concurrency multiplies both limits. The token budget is shared
+# by every task a worker process runs.
+SUMMARY_ENGINE = {
+    'concurrency': 4,  # OpenAI requests in flight
+    'tokens_per_minute': 100_000,  # prompt + max output tokens reserved per request
+    'max_input_tokens': 3000,  # longer descriptions are truncated
+    'max_output_tokens': 700,
+    'timeout': 60,  # seconds per request, a slow response counts as a failure
+    'max_retries': 2,  # client retries of connection errors, 429s and 5xx
+    # After this many consecutive failures OpenAI is skipped for reset_timeout seconds and jobs get an
+    # extractive summary instead, see upgrade_summaries_task
+    'failure_threshold': 5,
+    'reset_timeout': 300,
+}
+
+# Scrapers
+SCRAPER_MAX_IN_FLIGHT_PER_HOST = 4
+SCRAPER_TIMEOUT = 30  # seconds
+# Jobs are saved while scraping, one transaction per batch
+SCRAPER_SAVE_BATCH_SIZE = 50
+SCRAPER_SAVE_MAX_DELAY = 10  # seconds a parsed job may wait for its batch to fill
+# Job pages fetched per scrape_jobs_task under Celery, through one fetcher and its connection pool
+SCRAPER_TASK_CHUNK_SIZE = 25
+# Requested and ArchivedPage rows are inserted in bulk every SCRAPER_REQUESTED_FLUSH_SIZE fetched pages.
+# `compact_requested` deletes Requested rows once the posting is saved as a Job or after
+# SCRAPER_REQUESTED_RETENTION_DAYS, when a failed or filtered posting may be requested again.
+SCRAPER_REQUESTED_FLUSH_SIZE = 50
+SCRAPER_REQUESTED_RETENTION_DAYS = 30
+# Per-domain token bucket (requests/second) and circuit breaker, shared by every task of a worker process.
+# The rate adapts between min_rate and max_rate.
+SCRAPER_RATE_LIMIT = {
+    'rate': 0.5,
+    'burst': 2,
+    'min_rate': 0.1,
+    'max_rate': 2.0,
+    'failure_threshold': 5,  # consecutive failures before the circuit opens
+    'reset_timeout': 300,  # seconds before a trial request is let through
+}
+SCRAPER_RETRY = {
+    'max_retries': 3,
+    'base_delay': 1.0,
+    'max_delay': 60.0,
+}
+# Keep-alive connection pool shared by all requests of a scraper run
+SCRAPER_HTTP_SESSION = {
+    'http2': False,
+    'max_connections': 20,
+    'max_keepalive_connections': 10,
+    'keepalive_expiry': 30,  # seconds
+}
+# Conditional-GET cache (ETag / Last-Modified) for listing and detail pages. Set to None to disable.
+SCRAPER_HTTP_CACHE = {
+    'path': os.path.join(BASE_DIR, 'cache', 'http_cache.sqlite3'),
+    'max_bytes': 200 * 1024 * 1024,
+}
+# Content-addressed archive of every fetched page, used by `run_scrapers --reparse-from-archive`.
+SCRAPER_ARCHIVE_DIR = os.path.join(BASE_DIR, 'archive')
+# Redis Bloom filter of canonical job URLs shared by all workers and checked before the database.
+# Sized for `capacity` URLs at `error_rate`; fill it with `manage.py seed_seen_filter`. None disables it.
+SCRAPER_SEEN_FILTER = {
+    'key': 'scraper:seen_urls',
+    'capacity': 1_000_000,
+    'error_rate': 0.001,
+}
+# BeautifulSoup tree builder: 'lxml' (fast, C), 'html5lib' (browser-grade, slow) or 'html.parser' (pure Python)
+SCRAPER_HTML_PARSER = 'lxml'
 
 # Logging
 LOG_DIR = os.path.join(BASE_DIR, 'logs')
@@ -11,9 +11,9 @@ from ninja_jwt.controller import NinjaJWTDefaultController
 from ninja_extra import NinjaExtraAPI, api_controller, route
 from ninja_jwt.authentication import JWTAuth
 from ninja_extra.pagination import paginate, PageNumberPaginationExtra, PaginatedResponseSchema
-from jobs.utils.salary_standardizer import average_salary
+from jobs.summary_cache import request_summary
 from django.utils import timezone
-from django.db.models import Exists, OuterRef, Subquery
+from django.db.models import Avg, Exists, OuterRef, Subquery
 from django.views.decorators.cache import cache_page
 from ninja.decorators import decorate_view
 
@@ -54,16 +54,15 @@ class JobController:
         last_week = today - timedelta(days=7)
         last_two_weeks = today - timedelta(days=14)
         last_month = today - timedelta(days=30)
-        jobs = Job.objects.defer('description', 'url', 'location', 'title', 'summary', 'company', 'scraped_date', )
+        jobs = Job.objects.defer('description', 'url', 'canonical_url', 'location', 'title', 'summary', 'company', 'scraped_date',
+                                 'salary', 'salary_min', 'salary_max', 'salary_currency', 'salary_period')
         jobs = filters.filter_queryset(jobs)
+        salaries = jobs.filter(salary_min__isnull=False).aggregate(avg_min=Avg('salary_min'), avg_max=Avg('salary_max'))
     
         skill_freq = {}
         exp_stats = Counter()
         source_stats = Counter()
         work_mode = Counter()
-        salary_count = 0
-        min_total = 0
-        max_total = 0
         today_jobs = 0
         last_week_jobs = 0
         last_two_weeks_jobs = 0
@@ -80,12 +79,6 @@ class JobController:
             for skill in job.skills.keys():
                 skill_freq[skill] = skill_freq.get(skill, 0) + 1
             
-            if job.salary:
-                min_value, max_value = average_salary(job.salary)
-                min_total += min_value
-                max_total += max_value
-                salary_count += 1
-            
             if job.created_at > today:
                 today_jobs +=1
             if job.created_at > last_week:
@@ -96,10 +89,8 @@ class JobController:
                 last_month_jobs +=1
                 
                 
-        if salary_count > 0:
-            avg_min = min_total / salary_count
-            avg_max = max_total / salary_count
-            salary = f"{int(avg_min)} - {int(avg_max)} PLN"
+        if salaries['avg_min'] is not None:
+            salary = f"{int(salaries['avg_min'])} - {int(salaries['avg_max'])} PLN"
         else:
             salary = ""
             
@@ -156,6 +147,19 @@ class JobController:
         return jobs
     
     
+    # Queues the summary on first view when SUMMARY_MODE is 'lazy'
+    @route.get("{job_id}/summary", response={200: JobSummarySchema, 202: JobSummarySchema, 404: Dict})
+    def get_summary(self, job_id: int):
+        try:
+            job = request_summary(job_id)
+        except Job.DoesNotExist:
+            return 404, {"success": False, "message": "Job not found"}
+        # 202 while the summaries worker generates it, the frontend polls until it is done
+        if job.summary_status == Job.SUMMARY_PENDING and job.description:
+            return 202, job
+        return 200, job
+
+
     # Light endpoint for fetching dates and top skills on jobs page
     @route.get("filter-options", response=Dict[str, Any])
     @decorate_view(cache_page(60 * 60))
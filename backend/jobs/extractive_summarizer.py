@@ -0,0 +1,116 @@
+import html
+import math
+import re
+import time
+from typing import Dict, Optional, Union
+
+from jobs.models import SKILL_LEVEL_PRIORITY
+from jobs.summarizer import Summarizer, SummaryResult
+
+SENTENCE_SPLIT = re.compile(r'\n+|(?<=[.!?;])\s+')
+WORD = re.compile(r'\w+')
+# Common English and Polish words that say nothing about the job
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it of on or our the their this to we will with you your
+    i na do w z ze się jest są oraz dla od po przy jak lub o we a nie to że który która które
+""".split())
+
+
+class ExtractiveSummarizer(Summarizer):
+    """
+    Local summaries for when OpenAI is slow or down, in milliseconds per job.
+
+    The overview is the `overview_sentences` most central sentences of the
+    description, ranked with TextRank (PageRank over a graph of sentences
+    linked by the words they share) and kept in their original order. The
+    skills lists come from the skills dict the scraper parsed, sorted by
+    level, falling back to the next ranked sentences when a board lists no
+    skills. Jobs summarized this way are saved as SUMMARY_EXTRACTIVE and
+    upgraded to an OpenAI summary once it is available again.
+    """
+
+    name = 'extractive'
+    MAX_NECESSARY = 6
+    MAX_NICE = 4
+
+    def __init__(self, overview_sentences: int = 3, damping: float = 0.85, iterations: int = 30):
+        self.overview_sentences = overview_sentences
+        self.damping = damping
+        self.iterations = iterations
+
+    def summarize_many(self, texts: list[str],
+                       skills: Optional[list[Dict[str, str]]] = None) -> list[Union[SummaryResult, Exception]]:
+        skills = skills or [{}] * len(texts)
+        results = []
+        for text, job_skills in zip(texts, skills):
+            start = time.perf_counter()
+            try:
+                summary = self.summarize(text, job_skills or {})
+            except Exception as e:
+                results.append(e)
+                continue
+            results.append(SummaryResult(summary, tokens=0, latency_ms=round((time.perf_counter() - start) * 1000)))
+        return results
+
+    def summarize(self, text: str, skills: Dict[str, str]) -> str:
+        sentences = self.split_sentences(text) or [' '.join(text.split())]
+        ranked = sorted(range(len(sentences)), key=self.rank(sentences).__getitem__, reverse=True)
+        overview = sorted(ranked[:self.overview_sentences])
+
+        sorted_skills = self.sorted_skills(skills)
+        necessary = [name for name, level in sorted_skills if level != 'nice to have']
+        nice = [name for name, level in sorted_skills if level == 'nice to have']
+        if necessary:
+            necessary_items = [f"<strong>{html.escape(name)}</strong>" for name in necessary[:self.MAX_NECESSARY]]
+        else:
+            necessary_items = [html.escape(sentences[i]) for i in ranked[self.overview_sentences:]
+                               [:self.MAX_NECESSARY]]
+
+        parts = [f"<p>{' '.join(html.escape(sentences[i]) for i in overview)}</p>"]
+        parts.append(self.section("Necessary skills", necessary_items))
+        if nice:
+            parts.append(self.section("Nice-to-have skills",
+                                      [f"<strong>{html.escape(name)}</strong>" for name in nice[:self.MAX_NICE]]))
+        return "\n".join(part for part in parts if part)
+
+    @staticmethod
+    def section(title: str, items: list[str]) -> str:
+        if not items:
+            return ""
+        return f"<strong>{title}:</strong>\n<ul>\n" + "\n".join(f"<li>{item}</li>" for item in items) + "\n</ul>"
+
+    @staticmethod
+    def split_sentences(text: str) -> list[str]:
+        """Lines and sentences of a description, bullet markers stripped and lines too short to say anything dropped."""
+        sentences = []
+        for sentence in SENTENCE_SPLIT.split(text):
+            sentence = sentence.strip(" \t-•*·–")
+            if len(WORD.findall(sentence)) >= 3:
+                sentences.append(sentence)
+        return sentences
+
+    def rank(self, sentences: list[str]) -> list[float]:
+        """TextRank score of every sentence, similarity being shared words normalized by the sentence lengths."""
+        words = [{word for word in WORD.findall(sentence.casefold()) if word not in STOPWORDS and len(word) > 1}
+                 for sentence in sentences]
+        count = len(sentences)
+        edges = [{} for _ in range(count)]
+        for i in range(count):
+            for j in range(i + 1, count):
+                if len(words[i]) > 1 and len(words[j]) > 1 and (shared := len(words[i] & words[j])):
+                    edges[i][j] = edges[j][i] = shared / (math.log(len(words[i])) + math.log(len(words[j])))
+        # Each sentence passes its score on in proportion to its edge weights
+        totals = [sum(edge.values()) for edge in edges]
+        incoming = [[(j, weight / totals[j]) for j, weight in edges[i].items()] for i in range(count)]
+
+        scores = [1.0] * count
+        for _ in range(self.iterations):
+            scores = [(1 - self.damping) + self.damping * sum(share * scores[j] for j, share in incoming[i])
+                      for i in range(count)]
+        return scores
+
+    @staticmethod
+    def sorted_skills(skills: Dict[str, str]) -> list[tuple[str, str]]:
+        """Skills from the most to the least demanding level, like Job.get_sorted_skills."""
+        return sorted(((name, (level or '').lower()) for name, level in skills.items()),
+                      key=lambda item: (-SKILL_LEVEL_PRIORITY.get(item[1], 0), item[0]))
@@ -0,0 +1,98 @@
+from typing import Dict
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from jobs.models import ApplicationNote, Job, JobApplication, Requested
+from jobs.utils.urls import canonicalize_url
+
+
+class Command(BaseCommand):
+    help = "Fill canonical_url on Job and Requested rows saved before the column existed"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--dry_run',
+            action='store_true',
+            help='Show what would be done without actually updating'
+        )
+        parser.add_argument(
+            '--batch_size',
+            type=int,
+            default=1000,
+            help='Rows updated per query'
+        )
+
+    def handle(self, *args, **options):
+        # Duplicate requests are only bookkeeping, the newest one is kept.
+        # Duplicate jobs are merged into the earliest one like remove_duplicates:
+        # their applications move to it, then they are deleted. No row is left
+        # without a canonical_url, a later save() would fill it and hit the
+        # unique constraint.
+        self.backfill(Requested, '-created_at', options)
+        self.backfill(Job, 'created_at', options)
+
+    def backfill(self, model, keep_first: str, options):
+        name = model.__name__
+        taken = dict(model.objects.filter(canonical_url__isnull=False).values_list('canonical_url', 'id'))
+        rows = model.objects.filter(canonical_url__isnull=True).order_by(keep_first, 'id').only('id', 'url')
+
+        batch = []
+        # Duplicate id -> id of the row kept for the posting
+        duplicates: Dict[int, int] = {}
+        updated_count = 0
+        for row in rows.iterator(chunk_size=options['batch_size']):
+            canonical_url = canonicalize_url(row.url)
+            if canonical_url in taken:
+                duplicates[row.id] = taken[canonical_url]
+                continue
+            taken[canonical_url] = row.id
+            row.canonical_url = canonical_url
+            batch.append(row)
+            if len(batch) >= options['batch_size']:
+                updated_count += self.save_batch(model, batch, options['dry_run'])
+                batch = []
+        if batch:
+            updated_count += self.save_batch(model, batch, options['dry_run'])
+
+        action = 'Would update' if options['dry_run'] else 'Updated'
+        self.stdout.write(self.style.SUCCESS(f'{action} {updated_count} {name} rows'))
+        if not duplicates:
+            return
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING(f'Would remove {len(duplicates)} duplicate {name} rows'))
+            return
+        if model is Job:
+            moved_count = self.merge_jobs(duplicates)
+            self.stdout.write(self.style.WARNING(
+                f'Merged {len(duplicates)} duplicate {name} rows into the earliest copy, '
+                f'{moved_count} applications moved'
+            ))
+        else:
+            model.objects.filter(id__in=duplicates).delete()
+            self.stdout.write(self.style.WARNING(f'Deleted {len(duplicates)} duplicate {name} rows'))
+
+    def merge_jobs(self, duplicates: Dict[int, int]) -> int:
+        """Moves the applications of duplicate jobs to the kept ones, then deletes the duplicates."""
+        with transaction.atomic():
+            applied = {(user_id, job_id): application_id for application_id, user_id, job_id
+                       in JobApplication.objects.filter(job_id__in=set(duplicates.values()))
+                       .values_list('id', 'user_id', 'job_id')}
+            moved = []
+            for application in JobApplication.objects.filter(job_id__in=duplicates).only('id', 'user_id', 'job_id'):
+                kept_id = duplicates[application.job_id]
+                if (key := (application.user_id, kept_id)) in applied:
+                    # Applied to both copies: one application keeps the notes of both
+                    ApplicationNote.objects.filter(application_id=application.id).update(application_id=applied[key])
+                    continue
+                application.job_id = kept_id
+                applied[key] = application.id
+                moved.append(application)
+            JobApplication.objects.bulk_update(moved, ['job'])
+            Job.objects.filter(id__in=duplicates).delete()
+        return len(moved)
+
+    def save_batch(self, model, batch, dry_run: bool) -> int:
+        if not dry_run:
+            with transaction.atomic():
+                model.objects.bulk_update(batch, ['canonical_url'])
+        return len(batch)
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandParser
+from jobs.models import Job
+from jobs.utils.salary_normalizer import SalaryNormalizer
+
+
+class Command(BaseCommand):
+    help = "Fill salary_min, salary_max, salary_currency and salary_period on jobs saved before the columns existed"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--dry_run',
+            action='store_true',
+            help='Show what would be done without actually updating'
+        )
+        parser.add_argument(
+            '--batch_size',
+            type=int,
+            default=2000,
+            help='Rows updated per query'
+        )
+
+    def handle(self, *args, **options):
+        # Saved salaries are already standardized, so history gets monthly PLN columns, except
+        # for EUR rows left over from before cleanup_salaries. Other currencies were saved as
+        # an empty text and stay without columns. Only the columns are written, cleanup_salaries
+        # also rewrites the text.
+        rows = Job.objects.filter(salary_min__isnull=True).exclude(salary__isnull=True).exclude(salary='')
+        normalizer = SalaryNormalizer('backfill_salary_columns', batch_size=options['batch_size'],
+                                      update_salary=False, dry_run=options['dry_run'])
+        stats = normalizer.run(rows)
+
+        action = 'Would update' if options['dry_run'] else 'Updated'
+        self.stdout.write(self.style.SUCCESS(f'{action} {stats.changed} jobs ({stats.rows_per_second:.0f} rows/s)'))
+        if stats.unparsed:
+            self.stdout.write(self.style.WARNING(f'{stats.unparsed} salaries could not be parsed and were left empty'))
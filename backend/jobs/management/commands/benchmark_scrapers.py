@@ -0,0 +1,99 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from jobs.scrapers.benchmark import ScraperBenchmark
+from jobs.scrapers.registry import SCRAPERS
+
+
+class Command(BaseCommand):
+    help = 'Benchmark parse throughput of every scraper against recorded pages (no network)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scrapers',
+            nargs='+',
+            type=str,
+            default=['all'],
+            help='Specify which scrapers to benchmark (jjit, nofluff, pracuj, protocol or all)'
+        )
+        parser.add_argument(
+            '--iterations',
+            type=int,
+            default=5,
+            help='How many times to repeat every stage'
+        )
+        parser.add_argument(
+            '--parser',
+            type=str,
+            help='HTML parser backend to benchmark (html.parser, lxml, html5lib). Defaults to SCRAPER_HTML_PARSER'
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Write the results as JSON to this file'
+        )
+        parser.add_argument(
+            '--compare',
+            type=str,
+            help='JSON results of a previous run; fail if any stage or field got slower than --tolerance'
+        )
+        parser.add_argument(
+            '--tolerance',
+            type=float,
+            default=0.25,
+            help='Allowed slowdown against --compare, as a fraction (0.25 = 25%%)'
+        )
+
+    def handle(self, *args, **options):
+        scrapers_to_run = options['scrapers']
+        if 'all' in scrapers_to_run:
+            scrapers_to_run = SCRAPERS.keys()
+
+        results = {}
+        for scraper_name in scrapers_to_run:
+            if scraper_name not in SCRAPERS:
+                raise CommandError(f"Unknown scraper: {scraper_name}")
+            benchmark = ScraperBenchmark(scraper_name, SCRAPERS[scraper_name], options['iterations'], options['parser'])
+            results[scraper_name] = benchmark.run()
+            self.print_results(scraper_name, results[scraper_name])
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                json.dump(results, f, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if options['compare']:
+            with open(options['compare']) as f:
+                baseline = json.load(f)
+            if regressions := self.find_regressions(baseline, results, options['tolerance']):
+                raise CommandError("Performance regressions:\n" + "\n".join(regressions))
+            self.stdout.write(self.style.SUCCESS("No performance regressions"))
+
+    def print_results(self, scraper_name, result):
+        self.stdout.write(self.style.SUCCESS(f"\n{scraper_name}"))
+        self.stdout.write(f"{'stage':<10}{'pages':>8}{'pages/s':>12}{'ms/page':>10}{'peak RSS MB':>14}")
+        for stage, stats in result['stages'].items():
+            self.stdout.write(
+                f"{stage:<10}{stats['pages']:>8}{stats['pages_per_second']:>12.1f}"
+                f"{stats['ms_per_page']:>10.2f}{stats['peak_rss_mb']:>14.1f}"
+            )
+        fields = ", ".join(f"{field} {ms:.3f}" for field, ms in result['fields'].items())
+        self.stdout.write(f"ms per field: {fields}")
+        extraction = result['extraction']
+        self.stdout.write(
+            f"extraction per page: {extraction['traversals_before']:.1f} -> {extraction['traversals_after']:.1f} "
+            f"traversals, {extraction['ms_before']:.3f} -> {extraction['ms_after']:.3f} ms"
+        )
+
+    def find_regressions(self, baseline, results, tolerance):
+        regressions = []
+        for scraper_name, result in results.items():
+            if scraper_name not in baseline:
+                continue
+            timings = {**{f"stage {k}": v['ms_per_page'] for k, v in result['stages'].items()},
+                       **{f"field {k}": v for k, v in result['fields'].items()}}
+            previous = {**{f"stage {k}": v['ms_per_page'] for k, v in baseline[scraper_name]['stages'].items()},
+                        **{f"field {k}": v for k, v in baseline[scraper_name]['fields'].items()}}
+            for name, ms in timings.items():
+                if (before := previous.get(name)) and ms > before * (1 + tolerance):
+                    regressions.append(f"{scraper_name} {name}: {before:.3f} -> {ms:.3f} ms/page")
+        return regressions
@@ -0,0 +1,71 @@
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from jobs.models import Job, Requested
+
+
+class Command(BaseCommand):
+    help = "Delete Requested rows of saved jobs and rows past the retention period, in small batches"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--dry_run',
+            action='store_true',
+            help='Show how many rows would be deleted without deleting them'
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=settings.SCRAPER_REQUESTED_RETENTION_DAYS,
+            help='Keep rows of postings not saved as jobs for this many days'
+        )
+        parser.add_argument(
+            '--batch_size',
+            type=int,
+            default=1000,
+            help='Rows deleted per transaction'
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0.1,
+            help='Seconds to wait between batches, to leave room for running scrapers'
+        )
+        parser.add_argument(
+            '--vacuum',
+            action='store_true',
+            help='Run VACUUM ANALYZE on the table afterwards (PostgreSQL only, does not block reads or writes)'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        expired = Requested.objects.filter(
+            Q(created_at__lt=cutoff)
+            | Q(canonical_url__in=Job.objects.filter(canonical_url__isnull=False).values('canonical_url'))
+        )
+
+        if options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(
+                f'Would delete {expired.count()} of {Requested.objects.count()} requested rows'
+            ))
+            return
+
+        # Short transactions on id batches keep locks brief while scrapers insert
+        deleted_count = 0
+        while ids := list(expired.values_list('id', flat=True)[:options['batch_size']]):
+            deleted, _ = Requested.objects.filter(id__in=ids).delete()
+            deleted_count += deleted
+            time.sleep(options['pause'])
+
+        if options['vacuum'] and connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'VACUUM ANALYZE {Requested._meta.db_table}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Deleted {deleted_count} requested rows, {Requested.objects.count()} left'
+        ))
@@ -1,8 +1,9 @@
 from django.core.management.base import BaseCommand
-from jobs.scrapers.justjoin_scraper import JustJoinScraper
-from jobs.scrapers.nofluffjobs import NoFluffScraper
-from jobs.scrapers.pracuj_scraper import PracujScraper
-from jobs.scrapers.protocol_scraper import TheProtocolScraper
+from django.db import connection
+from jobs.scrapers.registry import SCRAPERS
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from django.utils import timezone
 import logging
 
 class Command(BaseCommand):
@@ -22,6 +23,26 @@ class Command(BaseCommand):
             default=200,
             help='Limit number of requests per scraper'
         )
+        parser.add_argument(
+            '--parallel',
+            action='store_true',
+            help='Run the selected scrapers concurrently, one thread per job board'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='With --parallel, maximum number of boards scraped at the same time (default: all of them)'
+        )
+        parser.add_argument(
+            '--reparse-from-archive',
+            action='store_true',
+            help='Re-run company, salary and skills extraction over archived pages instead of scraping'
+        )
+        parser.add_argument(
+            '--since-days',
+            type=int,
+            help='With --reparse-from-archive, only re-parse pages fetched in the last N days'
+        )
 
     
 
@@ -30,35 +51,79 @@ class Command(BaseCommand):
         scrapers_to_run = options['scrapers']
         request_limit = options['limit']
         
-        available_scrapers = {
-            'jjit': JustJoinScraper,
-            'nofluff': NoFluffScraper,
-            'pracuj': PracujScraper,
-            'protocol': TheProtocolScraper
-        }
+        available_scrapers = SCRAPERS
 
         if 'all' in scrapers_to_run:
             scrapers_to_run = available_scrapers.keys()
 
+        if options['reparse_from_archive']:
+            return self.reparse_from_archive(available_scrapers, scrapers_to_run, options['since_days'])
+
+        unknown = [name for name in scrapers_to_run if name not in available_scrapers]
+        for scraper_name in unknown:
+            logger.error(f"Unknown scraper: {scraper_name}")
+        scrapers_to_run = [name for name in scrapers_to_run if name not in unknown]
+
+        if options['parallel']:
+            total_jobs_created = self.run_parallel(scrapers_to_run, request_limit, options['workers'])
+        else:
+            total_jobs_created = sum(self.run_scraper(name, request_limit) for name in scrapers_to_run)
+
+        logger.info(f"Scraping completed. Total new jobs created: {total_jobs_created}")
+        return str(total_jobs_created)
+
+    def run_parallel(self, scrapers_to_run, request_limit, workers=None):
+        """Scrapes every board in its own thread. Boards only share the database."""
+        logger = logging.getLogger('scraper')
+        if not scrapers_to_run:
+            return 0
+
         total_jobs_created = 0
-        
+        with ThreadPoolExecutor(max_workers=workers or len(scrapers_to_run), thread_name_prefix='scraper') as pool:
+            futures = {pool.submit(self.run_scraper_in_thread, name, request_limit): name for name in scrapers_to_run}
+            for future in as_completed(futures):
+                total_jobs_created += future.result()
+                logger.info(f"{futures[future]} scraper done, {total_jobs_created} new jobs so far")
+        return total_jobs_created
+
+    def run_scraper_in_thread(self, scraper_name, request_limit):
+        try:
+            return self.run_scraper(scraper_name, request_limit)
+        finally:
+            # Every thread opens its own database connection
+            connection.close()
+
+    def run_scraper(self, scraper_name, request_limit):
+        """Runs one scraper and returns how many jobs it created. Errors are logged, never raised."""
+        logger = logging.getLogger('scraper')
+        logger.info(f"Starting {scraper_name} scraper...")
+        try:
+            scraper = SCRAPERS[scraper_name](request_limit=request_limit)
+            jobs_created = scraper.run()
+            if jobs_created is not None:
+                logger.info(f"{scraper_name} scraper finished. Created {jobs_created} new jobs")
+                return jobs_created
+            logger.error(f"{scraper_name} scraper failed to return number of created jobs")
+        except Exception as e:
+            logger.error(f"Error running {scraper_name} scraper: {str(e)}", exc_info=True)
+        return 0
+
+    def reparse_from_archive(self, available_scrapers, scrapers_to_run, since_days):
+        logger = logging.getLogger('scraper')
+        since = timezone.now() - timedelta(days=since_days) if since_days else None
+        total_updated = 0
+
         for scraper_name in scrapers_to_run:
             if scraper_name not in available_scrapers:
                 logger.error(f"Unknown scraper: {scraper_name}")
                 continue
 
-            logger.info(f"Starting {scraper_name} scraper...")
-            scraper = available_scrapers[scraper_name](request_limit=request_limit)
-            
+            logger.info(f"Re-parsing archived pages of {scraper_name}...")
+            scraper = available_scrapers[scraper_name](request_limit=0)
             try:
-                jobs_created = scraper.run()
-                if jobs_created is not None:
-                    total_jobs_created += jobs_created
-                    logger.info(f"{scraper_name} scraper finished. Created {jobs_created} new jobs")
-                else:
-                    logger.error(f"{scraper_name} scraper failed to return number of created jobs")
+                total_updated += scraper.reparse_archive(since=since)
             except Exception as e:
-                logger.error(f"Error running {scraper_name} scraper: {str(e)}", exc_info=True)
+                logger.error(f"Error re-parsing {scraper_name} archive: {str(e)}", exc_info=True)
 
-        logger.info(f"Scraping completed. Total new jobs created: {total_jobs_created}")
-        return str(total_jobs_created)
\ No newline at end of file
+        logger.info(f"Re-parsing completed. Total jobs updated: {total_updated}")
+        return str(total_updated)
\ No newline at end of file
@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from jobs.models import Job, Requested
+from jobs.scrapers.seen_filter import SeenUrlFilter
+
+
+class Command(BaseCommand):
+    help = "Fill the shared seen-URL Bloom filter from Job and Requested and show its metrics"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Drop the filter first, e.g. after changing its capacity or error rate'
+        )
+        parser.add_argument(
+            '--stats',
+            action='store_true',
+            help='Only show the size, memory and false-positive metrics of the filter'
+        )
+        parser.add_argument(
+            '--batch_size',
+            type=int,
+            default=10000,
+            help='URLs added per Redis round trip'
+        )
+
+    def handle(self, *args, **options):
+        if (seen_filter := SeenUrlFilter.from_settings()) is None:
+            raise CommandError("SCRAPER_SEEN_FILTER is disabled or the default cache is not Redis")
+
+        if not options['stats']:
+            if options['reset']:
+                seen_filter.reset()
+            # Bits are only ever set, so URLs added by running scrapers meanwhile are kept
+            added_count = 0
+            for model in (Job, Requested):
+                urls = model.objects.filter(canonical_url__isnull=False).values_list('canonical_url', flat=True)
+                batch = []
+                for url in urls.iterator(chunk_size=options['batch_size']):
+                    batch.append(url)
+                    if len(batch) >= options['batch_size']:
+                        seen_filter.add_many(batch)
+                        added_count += len(batch)
+                        batch = []
+                if batch:
+                    seen_filter.add_many(batch)
+                    added_count += len(batch)
+            seen_filter.mark_ready()
+            self.stdout.write(self.style.SUCCESS(f'Added {added_count} URLs to the seen filter'))
+
+        self.stdout.write(
+            f'{seen_filter.size} bits, {seen_filter.hash_count} hashes: {seen_filter.stats()}'
+        )
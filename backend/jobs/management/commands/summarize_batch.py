@@ -0,0 +1,98 @@
+from django.core.cache import cache
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from jobs.models import Job
+from jobs.summary_cache import CachedSummarizer, job_summary_key
+from jobs.summarizer import SummaryEngine
+
+
+class Command(BaseCommand):
+    help = "Backfill summaries through the OpenAI Batch API: submit a batch, then collect it once completed"
+    # Descriptions whose jobs are looked up per query at collect time
+    COLLECT_CHUNK_SIZE = 500
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        group = parser.add_mutually_exclusive_group(required=True)
+        group.add_argument(
+            '--submit',
+            action='store_true',
+            help='Submit the jobs with the given summary status'
+        )
+        group.add_argument(
+            '--collect',
+            metavar='BATCH_ID',
+            help='Save the summaries of a completed batch'
+        )
+        parser.add_argument(
+            '--status',
+            # Pending jobs belong to the summaries queue, collect leaves them alone
+            choices=[Job.SUMMARY_FAILED, Job.SUMMARY_EXTRACTIVE, Job.SUMMARY_LAZY, Job.SUMMARY_DONE],
+            default=Job.SUMMARY_FAILED,
+            help='Jobs to submit, "done" re-summarizes e.g. after a PROMPT_VERSION bump'
+        )
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=10000,
+            help='Maximum number of jobs in the batch'
+        )
+
+    def handle(self, *args, **options):
+        engine = SummaryEngine()
+        if options['submit']:
+            self.submit(engine, options['status'], options['limit'])
+        else:
+            self.collect(engine, options['collect'])
+
+    def submit(self, engine: SummaryEngine, status: str, limit: int):
+        jobs = (Job.objects.filter(summary_status=status).exclude(description__isnull=True).exclude(description='')
+                .order_by('-created_at').values_list('id', 'description')[:limit])
+        # Identical descriptions are summarized once, and cached ones not at all
+        descriptions = {}
+        for job_id, description in jobs:
+            descriptions.setdefault(description, []).append(job_id)
+        cached = CachedSummarizer().lookup(descriptions)
+        # Keyed by the first job with the description, collect finds the others by its description
+        texts = {f"job-{job_ids[0]}": description for description, job_ids in descriptions.items()
+                 if description not in cached}
+        if not texts:
+            self.stdout.write(self.style.SUCCESS(f'Nothing to submit, {len(cached)} descriptions are cached'))
+            return
+
+        batch_id = engine.submit_batch(texts)
+        self.stdout.write(self.style.SUCCESS(
+            f'Submitted batch {batch_id} with {len(texts)} descriptions. '
+            f'Collect it with: manage.py summarize_batch --collect {batch_id}'
+        ))
+
+    def collect(self, engine: SummaryEngine, batch_id: str):
+        status, results = engine.collect_batch(batch_id)
+        if status != 'completed':
+            raise CommandError(f'Batch {batch_id} is {status}, try again later')
+
+        summarizer = CachedSummarizer()
+        submitted = Job.objects.only('id', 'description', 'summary_status').in_bulk(
+            [self.job_id(custom_id) for custom_id in results]
+        )
+        summaries = {}
+        for custom_id, result in results.items():
+            if job := submitted.get(self.job_id(custom_id)):
+                summarizer.store(job.description, result)
+                summaries[job.description] = result.summary
+
+        # Every job sharing a summarized description and the status it was submitted with
+        statuses = {job.summary_status for job in submitted.values()} - {Job.SUMMARY_PENDING}
+        descriptions = list(summaries)
+        updated = []
+        for start in range(0, len(descriptions), self.COLLECT_CHUNK_SIZE):
+            updated.extend(Job.objects.filter(description__in=descriptions[start:start + self.COLLECT_CHUNK_SIZE],
+                                              summary_status__in=statuses).only('id', 'description'))
+        for job in updated:
+            job.summary = summaries[job.description]
+            job.summary_status = Job.SUMMARY_DONE
+        Job.objects.bulk_update(updated, ['summary', 'summary_status'], batch_size=500)
+        cache.delete_many([job_summary_key(job.id) for job in updated])
+        self.stdout.write(self.style.SUCCESS(f'Saved {len(results)} summaries to {len(updated)} jobs'))
+
+    @staticmethod
+    def job_id(custom_id: str) -> int:
+        return int(custom_id.removeprefix('job-'))
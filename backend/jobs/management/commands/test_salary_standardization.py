@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
-from jobs.models import Job
-from jobs.utils.salary_standardizer import standardize_salary
+from jobs.utils.salary_normalizer import SalaryNormalizer
+
 
 class Command(BaseCommand):
     help = 'Test salary standardization on existing database entries'
@@ -16,37 +16,29 @@ class Command(BaseCommand):
             type=int,
             help='Limit the number of records to process'
         )
+        parser.add_argument(
+            '--batch_size',
+            type=int,
+            default=2000,
+            help='Rows parsed and updated per transaction'
+        )
 
     def handle(self, *args, **options):
-        jobs = Job.objects.exclude(salary__isnull=True).exclude(salary='')
-        
-        if options['limit']:
-            jobs = jobs[:options['limit']]
-            
-        total = jobs.count()
-        changes = 0
-        
-        self.stdout.write(f"Processing {total} jobs with salary information")
+        self.stdout.write("Processing jobs with salary information")
         self.stdout.write("-" * 50)
 
-        for job in jobs:
-            old_salary = job.salary.replace('\xa0', ' ')
-            new_salary = standardize_salary(old_salary)
-            
-            if old_salary != new_salary:
-                changes += 1
-                self.stdout.write(
-                    f"Job ID: {job.id}\n"
-                    f"Title: {job.title}\n"
-                    f"Old salary: {old_salary}\n"
-                    f"New salary: {new_salary}\n"
-                    f"{'-' * 30}"
-                )
-                
-                if options['apply']:
-                    job.salary = new_salary
-                    job.save()
-        
+        def show_change(job, old_salary):
+            self.stdout.write(
+                f"Job ID: {job.id}\n"
+                f"Old salary: {old_salary}\n"
+                f"New salary: {job.salary} ({job.salary_currency}, per {job.salary_period})\n"
+                f"{'-' * 30}"
+            )
+
+        normalizer = SalaryNormalizer('test_salary_standardization', batch_size=options['batch_size'],
+                                      dry_run=not options['apply'])
+        stats = normalizer.run(limit=options['limit'], on_change=show_change)
+
         if options['apply']:
             action = "Updated"
         else:
@@ -54,6 +46,7 @@ class Command(BaseCommand):
             
         self.stdout.write(self.style.SUCCESS(
             f"\nSummary:\n"
-            f"Total jobs processed: {total}\n"
-            f"{action} {changes} salaries"
-        ))
\ No newline at end of file
+            f"Total jobs processed: {stats.rows}\n"
+            f"{action} {stats.changed} salaries\n"
+            f"Throughput: {stats.rows_per_second:.0f} rows/s"
+        ))
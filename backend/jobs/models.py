@@ -1,25 +1,78 @@
 from django.db import models
 from django.utils import timezone
 from django.contrib.auth.models import User
+from typing import Optional
+from jobs.utils.salary_standardizer import CURRENCY_CHOICES, PERIOD_CHOICES, format_salary, parse_salary
+from jobs.utils.urls import canonicalize_url
 
+# Skill levels from the most to the least demanding, for sorting skills
+SKILL_LEVEL_PRIORITY = {
+    'master': 6,
+    'advanced': 5,
+    'senior': 4,
+    'regular': 3,
+    'junior': 2,
+    'nice to have': 1
+}
 
 class Job(models.Model):
+    SUMMARY_PENDING = 'pending'
+    SUMMARY_DONE = 'done'
+    SUMMARY_FAILED = 'failed'
+    # Summarized locally while OpenAI was unavailable, upgraded by upgrade_summaries_task
+    SUMMARY_EXTRACTIVE = 'extractive'
+    # SUMMARY_MODE 'lazy': summarized when first viewed, see request_summary
+    SUMMARY_LAZY = 'lazy'
+
     title = models.CharField(max_length=255)
     company = models.CharField(max_length=255, null=True, blank=True)
     location = models.CharField(max_length=255, null=True, blank=True)
     operating_mode = models.CharField(max_length=15, null=True, blank=True)
     salary = models.CharField(max_length=25, blank=True, null=True)
+    # Monthly PLN amounts of `salary` for filtering and sorting in SQL, and what the offer was given in
+    salary_min = models.PositiveIntegerField(null=True, blank=True)
+    salary_max = models.PositiveIntegerField(null=True, blank=True)
+    salary_currency = models.CharField(max_length=3, choices=CURRENCY_CHOICES, null=True, blank=True)
+    salary_period = models.CharField(max_length=5, choices=PERIOD_CHOICES, null=True, blank=True)
     experience = models.CharField(max_length=25)
     skills = models.JSONField()
     description = models.TextField(null=True, blank=True)
     url = models.URLField(max_length=350)
+    # Posting identity, see canonicalize_url. Unique, so a posting can only be saved once
+    canonical_url = models.URLField(max_length=350, unique=True, null=True, blank=True)
     scraped_date = models.DateTimeField(auto_now=timezone.now)
     summary = models.TextField(null=True, blank=True)
+    # Jobs are saved right away and summarized on the `summaries` Celery queue
+    summary_status = models.CharField(
+        max_length=10,
+        choices=[(SUMMARY_PENDING, 'Pending'), (SUMMARY_DONE, 'Done'), (SUMMARY_FAILED, 'Failed'),
+                 (SUMMARY_EXTRACTIVE, 'Extractive'), (SUMMARY_LAZY, 'Lazy')],
+        default=SUMMARY_DONE,
+    )
     source = models.CharField(max_length=20, null=True)
     created_at = models.DateTimeField(default=timezone.now)
 
     def __str__(self):
         return f"ID: {self.id} - Title: {self.title}"
+
+    def save(self, *args, **kwargs):
+        if not self.canonical_url and self.url:
+            self.canonical_url = canonicalize_url(self.url)
+        super().save(*args, **kwargs)
+
+    def set_salary(self, raw_salary: Optional[str]):
+        """
+        Sets the salary text and the numeric columns from one parse of the
+        salary text of a posting, so the salary shown is the one filtered and
+        sorted on. Other currencies are shown converted to PLN, like
+        cleanup_salaries does.
+        """
+        parsed = parse_salary(raw_salary)
+        self.salary = format_salary(parsed.min, parsed.max) if parsed else None
+        self.salary_min = parsed.min if parsed else None
+        self.salary_max = parsed.max if parsed else None
+        self.salary_currency = parsed.currency if parsed else None
+        self.salary_period = parsed.period if parsed else None
     
     class Meta:
         ordering = ['-scraped_date']
@@ -28,8 +81,15 @@ class Job(models.Model):
             models.Index(fields=['operating_mode']),
             models.Index(fields=['experience']),
             models.Index(fields=['source']),
+            # Salary range filters and sorting
+            models.Index(fields=['salary_min']),
+            models.Index(fields=['salary_max']),
             # Composite indexes for common filter combinations
             models.Index(fields=['operating_mode', 'experience', '-scraped_date']),
+            # Only the jobs still waiting for an OpenAI summary, for summarize_pending_jobs_task
+            # and upgrade_summaries_task
+            models.Index(fields=['summary_status', 'created_at'], name='job_summary_todo_idx',
+                         condition=models.Q(summary_status__in=['pending', 'extractive'])),
         ]
         
     def get_sorted_skills(self):
@@ -37,22 +97,13 @@ class Job(models.Model):
         Returns skills sorted by level priority and then alphabetically.
         Format: {skill: level}
         """
-        level_priority = {
-            'master': 6,
-            'advanced': 5,
-            'senior': 4,
-            'regular': 3,
-            'junior': 2,
-            'nice to have': 1
-        }
-        
         # Convert skills dict to list of tuples for sorting
         skills_list = list(self.skills.items())
         
         # Sort first by level priority (descending) then by skill name (ascending)
         sorted_skills = sorted(
             skills_list,
-            key=lambda x: (-level_priority.get(x[1].lower(), 0), x[0])
+            key=lambda x: (-SKILL_LEVEL_PRIORITY.get(x[1].lower(), 0), x[0])
         )
         
         return dict(sorted_skills)
@@ -60,14 +111,61 @@ class Job(models.Model):
     
 class Requested(models.Model):
     url = models.URLField(max_length=350)
+    canonical_url = models.URLField(max_length=350, unique=True, null=True, blank=True)
     title = models.CharField(max_length=255, null=True, blank=True)
     created_at = models.DateTimeField(auto_now=timezone.now)
     
     
     def __str__(self):
         return f"ID: {self.id} - Title: {self.title} - {self.created_at.strftime('%d/%m/%Y %H:%M')} - Source: {self.url.replace('www.', '').replace('https://', '').split('.')[0]}"
+
+    def save(self, *args, **kwargs):
+        if not self.canonical_url and self.url:
+            self.canonical_url = canonicalize_url(self.url)
+        super().save(*args, **kwargs)
+
+    class Meta:
+        indexes = [
+            # Retention scans of compact_requested
+            models.Index(fields=['created_at']),
+        ]
+
+
+class ArchivedPage(models.Model):
+    """A fetched page kept in the raw HTML archive, body stored on disk by content hash."""
+    LISTING = 'listing'
+    DETAIL = 'detail'
+
+    scraper = models.CharField(max_length=50)
+    url = models.URLField(max_length=350)
+    kind = models.CharField(max_length=10, choices=[(LISTING, 'Listing'), (DETAIL, 'Detail')], default=DETAIL)
+    content_hash = models.CharField(max_length=64)
+    fetched_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"ID: {self.id} - {self.url} - {self.fetched_at.strftime('%d/%m/%Y %H:%M')}"
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['scraper', 'kind', '-fetched_at']),
+            models.Index(fields=['url', '-fetched_at']),
+        ]
     
-    
+class SummaryCache(models.Model):
+    """A generated summary, keyed by the hash of the normalized description and the prompt version."""
+    description_hash = models.CharField(max_length=64, unique=True)
+    prompt_version = models.PositiveIntegerField()
+    summary = models.TextField()
+    # What generating it cost, i.e. what every cache hit saves
+    tokens = models.PositiveIntegerField(default=0)
+    latency_ms = models.PositiveIntegerField(default=0)
+    hits = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+    last_hit_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"ID: {self.id} - v{self.prompt_version} - {self.hits} hits"
+
 class JobApplication(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     job = models.ForeignKey(Job, on_delete=models.CASCADE)
@@ -1,6 +1,6 @@
 from ninja import Schema, FilterSchema
-from typing import Optional, List
-from django.db.models import Q
+from typing import Literal, Optional, List
+from django.db.models import F, Q
 from datetime import datetime, date
 
 
@@ -19,11 +19,16 @@ class JobSchema(Schema):
     location: Optional[str]
     operating_mode: Optional[str]
     salary: Optional[str]
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    salary_currency: Optional[str] = None
+    salary_period: Optional[str] = None
     experience: Optional[str]
     skills: dict 
     url: str
     scraped_date: datetime
     summary: Optional[str]
+    summary_status: str
     source: Optional[str]
     has_applied: bool = False
     application_id: Optional[int] = None
@@ -33,6 +38,12 @@ class JobSchema(Schema):
         return obj.get_sorted_skills()
     
 
+class JobSummarySchema(Schema):
+    id: int
+    summary: Optional[str]
+    summary_status: str
+
+
 class JobFilterSchema(FilterSchema):
     title: Optional[str] = None
     company: Optional[str] = None
@@ -40,9 +51,13 @@ class JobFilterSchema(FilterSchema):
     scraped_date: Optional[date] = None
     experience: Optional[str] = None
     operating_mode: Optional[str] = None
-    salary: Optional[str] = None
+    # Monthly PLN, see Job.salary_min
+    salary_min__gte: Optional[int] = None
+    salary_max__lte: Optional[int] = None
     skills: Optional[List[str]] = None
     source: Optional[str] = None
+    # Highest or lowest paying first, jobs without a salary last
+    ordering: Optional[Literal['salary', '-salary']] = None
 
     def filter_queryset(self, queryset):
         filters = {
@@ -51,7 +66,9 @@ class JobFilterSchema(FilterSchema):
             'scraped_date__gt': self.scraped_date,
             'experience__exact': self.experience,
             'operating_mode__exact': self.operating_mode,
-            'source__exact': self.source
+            'source__exact': self.source,
+            'salary_min__gte': self.salary_min__gte,
+            'salary_max__lte': self.salary_max__lte,
         }
         # Remove None values
         filters = {k: v for k, v in filters.items() if v is not None}
@@ -63,6 +80,11 @@ class JobFilterSchema(FilterSchema):
             for skill in self.skills:
                 skills_query &= Q(skills__has_key=skill)
             queryset = queryset.filter(skills_query)
+
+        if self.ordering == '-salary':
+            queryset = queryset.order_by(F('salary_max').desc(nulls_last=True), '-scraped_date')
+        elif self.ordering == 'salary':
+            queryset = queryset.order_by(F('salary_min').asc(nulls_last=True), '-scraped_date')
         
         return queryset
     
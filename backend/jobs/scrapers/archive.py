@@ -0,0 +1,78 @@
+import hashlib
+import os
+from datetime import datetime
+from typing import Iterator, Optional, Tuple
+
+import zstandard
+from django.utils import timezone
+
+from jobs.models import ArchivedPage
+
+
+class PageArchive:
+    """
+    Content-addressed, zstd-compressed store of every fetched page.
+
+    Page bodies are written once per distinct content under
+    `<root>/objects/<hash[:2]>/<hash>.zst`, so refetching an unchanged page
+    costs one database row and no disk. `ArchivedPage` rows map URL and fetch
+    time to the content hash, which lets extraction be re-run over history
+    without touching the network.
+    """
+
+    def __init__(self, root: str, level: int = 10):
+        self.root = root
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def store(self, scraper: str, url: str, html: str, kind: str = ArchivedPage.DETAIL,
+              fetched_at: Optional[datetime] = None) -> ArchivedPage:
+        """Writes the page body if its content is new and records the fetch."""
+        page = self.record(scraper, url, html, kind, fetched_at)
+        page.save()
+        return page
+
+    def record(self, scraper: str, url: str, html: str, kind: str = ArchivedPage.DETAIL,
+               fetched_at: Optional[datetime] = None) -> ArchivedPage:
+        """
+        Writes the page body if its content is new and returns the unsaved
+        row recording the fetch, for callers that insert the rows in bulk.
+        """
+        content = html.encode('utf-8')
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = self._path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(self._compressor.compress(content))
+            os.replace(tmp_path, path)
+
+        return ArchivedPage(
+            scraper=scraper,
+            url=url,
+            kind=kind,
+            content_hash=content_hash,
+            fetched_at=fetched_at or timezone.now(),
+        )
+
+    def load(self, content_hash: str) -> str:
+        with open(self._path(content_hash), 'rb') as f:
+            return self._decompressor.decompress(f.read()).decode('utf-8')
+
+    def iter_latest(self, scraper: str, kind: str = ArchivedPage.DETAIL,
+                    since: Optional[datetime] = None) -> Iterator[Tuple[ArchivedPage, str]]:
+        """Yields the newest archived version of every page fetched by `scraper`."""
+        pages = ArchivedPage.objects.filter(scraper=scraper, kind=kind).order_by('-fetched_at')
+        if since:
+            pages = pages.filter(fetched_at__gte=since)
+
+        seen = set()
+        for page in pages.iterator(chunk_size=500):
+            if page.url in seen:
+                continue
+            seen.add(page.url)
+            yield page, self.load(page.content_hash)
+
+    def _path(self, content_hash: str) -> str:
+        return os.path.join(self.root, 'objects', content_hash[:2], f"{content_hash}.zst")
@@ -1,18 +1,42 @@
 from abc import ABC, abstractmethod
-import requests
-from bs4 import BeautifulSoup
-from jobs.models import Job, Requested
-import time
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+import httpx
+import json
+import re
+from jobs.models import ArchivedPage, Job, Requested
 import logging
-from typing import Dict, Optional
-from django.db import transaction
-from jobs.summarizer import summarize_text
-from random import randint
-from jobs.utils.salary_standardizer import standardize_salary
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from jobs.summary_cache import CachedSummarizer
+from jobs.utils.query_counter import QueryCounter
+from jobs.utils.urls import canonicalize_url
 from datetime import datetime, timedelta, timezone
+from .archive import PageArchive
+from .extraction import AnchoredSoup, ExtractionPlan, compile_selector
+from .fetcher import AsyncFetcher, FetchResult
+from .http_cache import HttpCache
+from .http_session import HttpSession
+from .rate_limiter import RateLimiter, RetryPolicy
+from .seen_filter import SeenUrlFilter
 
 class WebScraper(ABC):
     """Base scraper class for job websites."""
+
+    # Selectors every detail field's extractor looks up from the page root,
+    # compiled into `extraction_plan` when the subclass is defined
+    FIELD_SPEC: Dict[str, list[Dict]] = {}
+    extraction_plan = ExtractionPlan({})
+    # Listings checked per known-job query, below SQLite's bound parameter limit
+    PRECHECK_CHUNK_SIZE = 200
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.extraction_plan = ExtractionPlan(cls.FIELD_SPEC)
     
     def __init__(self, base_url: str, filter_urls: list[str], request_limit: int):
         self.base_url = base_url
@@ -21,48 +45,147 @@ class WebScraper(ABC):
         self.request_limit = request_limit
         self.request_count = 0
         self.updated_count = 0
+        self.saved_count = 0
+        self.query_counter = QueryCounter()
+        self.precheck_counter = QueryCounter()
+        self.listing_pages_count = 0
+        self.fetcher: Optional[AsyncFetcher] = None
+        self.transport: Optional[httpx.AsyncBaseTransport] = None
+        self.archive = PageArchive(settings.SCRAPER_ARCHIVE_DIR) if settings.SCRAPER_ARCHIVE_DIR else None
+        self.parser = self.resolve_parser(settings.SCRAPER_HTML_PARSER)
+        self.seen_filter = SeenUrlFilter.from_settings()
+        self.requested_buffer: list[Requested] = []
+        self.archive_buffer: list[ArchivedPage] = []
+        self.summarizer = CachedSummarizer()
 
     # Main Flow Methods
     # --------------------------------------------------
     def run(self) -> int:
-        """Main entry point for the scraper."""
+        """
+        Main entry point for the scraper.
+
+        Every stage is a generator: listing pages are parsed as they arrive,
+        their jobs are fetched and extracted as they complete and saved in
+        small batches while the rest of the run is still in flight. Only the
+        pages in the fetch window and one batch of jobs are held in memory.
+        """
         try:
-            html = self.get_main_html()
-            job_listings = self.get_job_listings(html)
-            jobs_data = self.process_job_listings(job_listings)
-            return self.save_jobs(jobs_data)
+            with connection.execute_wrapper(self.query_counter), self.create_fetcher() as self.fetcher:
+                job_listings = self.iter_job_listings(self.iter_main_html())
+                jobs = self.iter_job_details(self.iter_jobs_to_fetch(job_listings))
+                self.save_jobs_in_batches(jobs)
+            self.logger.info(f"HTTP session: {self.fetcher.session.stats}")
+            self.logger.info(
+                f"Database: {self.query_counter.count} queries, {self.precheck_counter.count} of them "
+                f"to check known jobs on {self.listing_pages_count} listing pages"
+            )
+            if self.seen_filter is not None:
+                self.logger.info(f"Seen filter: {self.seen_filter.stats()}")
+            self.logger.info(f"Summary cache: {self.summarizer.stats}")
         except Exception as e:
             self.logger.error(f"Error in scraping process: {e}")
-            return 0
+        return self.saved_count
+
+    def create_fetcher(self) -> AsyncFetcher:
+        """
+        Creates the concurrent fetch engine used for listing and detail pages.
+        Its per-domain rate limits and circuit breakers are shared by every
+        fetcher of the process.
+        """
+        return AsyncFetcher(
+            session=self.create_session(),
+            max_in_flight_per_host=settings.SCRAPER_MAX_IN_FLIGHT_PER_HOST,
+            rate_limiter=RateLimiter.shared(**settings.SCRAPER_RATE_LIMIT),
+            retry_policy=RetryPolicy(**settings.SCRAPER_RETRY),
+        )
+
+    def create_session(self) -> HttpSession:
+        """Creates the pooled keep-alive session shared by all requests of a run."""
+        cache = HttpCache(**settings.SCRAPER_HTTP_CACHE) if settings.SCRAPER_HTTP_CACHE else None
+        return HttpSession(
+            headers=self.get_request_headers(),
+            timeout=settings.SCRAPER_TIMEOUT,
+            cache=cache,
+            transport=self.transport,
+            **settings.SCRAPER_HTTP_SESSION,
+        )
+
+    def get_request_headers(self) -> Dict[str, str]:
+        """Headers sent with every request to the job board."""
+        return {'User-Agent': "Mozilla/5.0 (X11; Linux x86_64; rv:132.0) Gecko/20100101 Firefox/132.0"}
 
     def get_main_html(self) -> list[str]:
-        """Fetches HTML from the main job listings page."""
-        pages = []
-        headers = {
-                'User-Agent': "Mozilla/5.0 (X11; Linux x86_64; rv:132.0) Gecko/20100101 Firefox/132.0"
-            }
+        """Fetches HTML from the main job listings pages concurrently."""
+        return list(self.iter_main_html())
+
+    def iter_main_html(self) -> Iterator[str]:
+        """Fetches the main job listings pages concurrently, yielding them in order."""
+        futures = []
         for url in self.filter_urls:
             self.logger.info(f"Fetching main page from: {url}")
-            res = requests.get(url, headers=headers)
-            res.raise_for_status()
-            pages.append(res.text)
-            self.logger.debug("Successfully fetched main page")
-        return pages
-
-    def get_job_listings(self, html_pages: list[str]) -> Dict[str, Dict[str, str]]:
-        """Extracts basic job information (title, link) from the main listings page."""
-        page_listings = []
+            futures.append(self.fetcher.submit(url))
+
+        try:
+            for future in futures:
+                result = future.result()
+                result.raise_for_status()
+                self._archive_page(result, ArchivedPage.LISTING)
+                self.logger.debug("Successfully fetched main page")
+                yield result.text
+        finally:
+            self.flush_archive()
+
+    def make_soup(self, html: str, selectors: Optional[list[Dict]] = None) -> BeautifulSoup:
+        """
+        Parses a page with the configured parser backend.
+
+        With `selectors`, only the subtrees of elements matching one of them are
+        built, everything else on the page is skipped by the tree builder.
+        html5lib does not support partial parsing and always builds the full tree.
+        """
+        if selectors and self.parser != 'html5lib':
+            return BeautifulSoup(html, self.parser, parse_only=self.build_strainer(selectors))
+        return BeautifulSoup(html, self.parser)
+
+    @staticmethod
+    def build_strainer(selectors: list[Dict]) -> SoupStrainer:
+        """
+        Builds a SoupStrainer keeping every element matched by one of the selector dicts.
+
+        SoupStrainer compares raw attribute strings while parsing, so
+        {'class': 'list-container'} would miss class="list-container ng-star-inserted".
+        Classes are matched per token here, the same way `find` matches them.
+        """
+        predicates = [compile_selector(selector) for selector in selectors]
+        return SoupStrainer(lambda name, attrs: any(matches(name, attrs) for matches in predicates))
+
+    def resolve_parser(self, parser: str) -> str:
+        """Returns `parser` if its library is installed, otherwise falls back to the built-in html.parser."""
+        if builder_registry.lookup(parser) is None:
+            self.logger.warning(f"HTML parser '{parser}' is not available, falling back to html.parser")
+            return 'html.parser'
+        return parser
+
+    def get_job_listings(self, html_pages: list[str]) -> list[Dict[str, Dict[str, str]]]:
+        """Extracts basic job information (title, link) from the main listings pages."""
+        return list(self.iter_job_listings(html_pages))
+
+    def iter_job_listings(self, html_pages: Iterable[str]) -> Iterator[Dict[str, Dict[str, str]]]:
+        """Yields the listings of each page as soon as it is parsed, releasing its tree right after."""
         for html in html_pages:
-            soup = BeautifulSoup(html, 'html.parser')
-            containers = soup.find_all(**self.get_jobs_container_selector())
-            
-            if not containers:
-                self.logger.warning("No job listings found on the page")
-                return {}
-            page_listing = self._extract_listings_from_containers(containers)
-            page_listings.append(page_listing)
-            
-        return page_listings
+            soup = self.make_soup(html, self.get_listing_parse_selectors())
+            try:
+                yield self.extract_page_listings(soup)
+            finally:
+                soup.decompose()
+
+    def extract_page_listings(self, soup: BeautifulSoup) -> Dict[str, Dict[str, str]]:
+        """Extracts the job listings of one parsed listings page."""
+        containers = soup.find_all(**self.get_jobs_container_selector())
+        if not containers:
+            self.logger.warning("No job listings found on the page")
+            return {}
+        return self._extract_listings_from_containers(containers)
 
     def _extract_listings_from_containers(self, containers) -> Dict[str, Dict[str, str]]:
         """Processes each container to extract job listings."""
@@ -82,81 +205,340 @@ class WebScraper(ABC):
     # --------------------------------------------------
     def process_job_listings(self, page_listings: list[Dict]) -> Dict:
         """Processes each job listing to get detailed information."""
-        detailed_jobs = {}
+        return dict(self.iter_job_details(self.iter_jobs_to_fetch(page_listings)))
+
+    def iter_job_details(self, jobs: Iterable[Tuple[str, str]]) -> Iterator[Tuple[str, Dict]]:
+        """Fetches the given job pages and yields (title, job details) as each page is parsed."""
+        for result in self._fetch_job_pages(jobs):
+            title = result.context
+            if job_details := self._process_single_job(title, result):
+                self.logger.debug(f"Successfully processed job: {title}")
+                yield title, job_details
+                
+        self.logger.info(f"Completed processing. Updated {self.updated_count}. Requested {(self.request_count)} jobs")
+
+    def select_jobs_to_fetch(self, page_listings: Iterable[Dict]) -> list[Tuple[str, str]]:
+        """Returns (title, link) of every listed job whose page still needs to be requested."""
+        return list(self.iter_jobs_to_fetch(page_listings))
+
+    def iter_jobs_to_fetch(self, page_listings: Iterable[Dict]) -> Iterator[Tuple[str, str]]:
+        """Yields (title, link) of listed jobs whose page still needs to be requested, once per job."""
+        seen = set()
         for listings in page_listings:
             self.logger.info(f"Starting to process {len(listings)} job listings")
+            self.listing_pages_count += 1
             
+            candidates = {}
             for title, data in listings.items():
                 self.logger.debug(f"Processing job: {title}")
-                if job_details := self._process_single_job(title, data["link"]):
-                    detailed_jobs[title] = job_details
-                    self.logger.debug(f"Successfully processed job: {title}")
-                
-        self.logger.info(f"Completed processing. Updated {self.updated_count}. Requested {(self.request_count)} jobs")
-        return detailed_jobs
+                canonical_url = canonicalize_url(data["link"])
+                if canonical_url not in seen and canonical_url not in candidates:
+                    candidates[canonical_url] = (title, data["link"])
+            seen.update(candidates)
 
-    def _process_single_job(self, title: str, link: str) -> Optional[Dict]:
-        """Processes a single job listing."""
+            with connection.execute_wrapper(self.precheck_counter):
+                to_fetch = self._filter_known_jobs(candidates)
+            for canonical_url in to_fetch:
+                yield candidates[canonical_url]
+
+    def scrape_jobs(self, jobs: Iterable[Tuple[str, str]]) -> int:
+        """
+        Fetches the given job pages on one fetcher and saves them in batches
+        as they are parsed, for callers outside of `run`. Returns the number saved.
+        """
+        with self.create_fetcher() as self.fetcher:
+            return self.save_jobs_in_batches(self.iter_job_details(jobs))
+
+    def _filter_known_jobs(self, candidates: Dict[str, Tuple[str, str]]) -> list[str]:
+        """
+        Checks the listings of one page against the database with one index
+        lookup on canonical_url for Job and one for Requested, and returns the
+        canonical URLs still to request. Jobs scraped over 14 days ago get
+        their date refreshed instead. With the seen filter, only the URLs it
+        reports as possibly seen go to the database.
+        """
+        if not candidates:
+            return []
+        to_check = list(candidates)
+        if self.seen_filter is not None and (maybe_seen := self.seen_filter.contains_many(to_check)) is not None:
+            to_check = [canonical_url for canonical_url, seen in zip(to_check, maybe_seen) if seen]
+        else:
+            maybe_seen = None
         try:
             today = datetime.now(timezone.utc)
-            
-            base_link = link.split('?')[0]
-            
-            
-            if job := Job.objects.filter(url__startswith=base_link):
-                job = job.get()
-                self.logger.debug(f"Job already exists in database: {title} : scraped on: {job.scraped_date}")
-                two_weeks_later = job.scraped_date + timedelta(days=14)
-                if two_weeks_later < today:
-                    job.scraped_date = today
-                    job.save()
-                    self.updated_count +=1
+            known_jobs = {canonical_url: (job_id, scraped_date) for canonical_url, job_id, scraped_date
+                          in self._query_by_canonical_url(Job, to_check, 'id', 'scraped_date')}
+            requested = {canonical_url for canonical_url, in self._query_by_canonical_url(Requested, to_check)}
+        except Exception as e:
+            self.logger.error(f"Error checking known jobs: {e}")
+            return []
+        if maybe_seen is not None:
+            false_positives = len(set(to_check) - known_jobs.keys() - requested)
+            self.seen_filter.record_lookups(len(candidates), len(to_check), false_positives)
+
+        to_fetch = []
+        stale_ids = []
+        for canonical_url, (title, _) in candidates.items():
+            if job := known_jobs.get(canonical_url):
+                # Requested rows of saved jobs are compacted away, the job itself is the record
+                job_id, scraped_date = job
+                if scraped_date + timedelta(days=14) < today:
+                    stale_ids.append(job_id)
+                    self.updated_count += 1
                     self.logger.info(f"Scraped over 14 days ago, updating date for: {title}")
-                    return None
-                    
-            if Requested.objects.filter(url__startswith=base_link).exists():
+                else:
+                    self.logger.debug(f"Job already exists in database: {title}")
+                continue
+            if canonical_url in requested:
                 self.logger.debug(f"Request already exists in database: {title}")
-                return None
-                
-            
-            if soup := self._get_job_page(link, title):
-                experience = self.extract_experience_level(soup)
-                return {
-                    "company": self.extract_company(soup),
-                    "location": self.extract_location(soup),
-                    "operating_mode": self.extract_operating_mode(soup),
-                    "experience": experience,
-                    "salary": self.extract_salary(soup),
-                    "description": self.extract_description(soup),
-                    "skills": self.process_skills(soup, experience),
-                    "link": link
-                }
+                continue
+            to_fetch.append(canonical_url)
+
+        if stale_ids:
+            Job.objects.filter(id__in=stale_ids).update(scraped_date=today)
+        return to_fetch
+
+    def _query_by_canonical_url(self, model, canonical_urls: Iterable[str], *fields: str) -> list[Tuple]:
+        """(canonical_url, *fields) rows of `model` for the given canonical URLs."""
+        canonical_urls = list(canonical_urls)
+        if not canonical_urls:
+            return []
+        rows = []
+        for start in range(0, len(canonical_urls), self.PRECHECK_CHUNK_SIZE):
+            chunk = canonical_urls[start:start + self.PRECHECK_CHUNK_SIZE]
+            rows.extend(model.objects.filter(canonical_url__in=chunk).values_list('canonical_url', *fields))
+        return rows
+
+    def _fetch_job_pages(self, jobs: Iterable[Tuple[str, str]]) -> Iterator[FetchResult]:
+        """
+        Fetches job pages concurrently, yielding them as they complete within
+        the request limit. Requested and archive rows are buffered and written
+        in bulk.
+        """
+        pending = iter(jobs)
+        in_flight = set()
+        window = self.fetcher.max_in_flight_per_host * 2
+        try:
+            while True:
+                while len(in_flight) < window and self.request_count + len(in_flight) < self.request_limit:
+                    try:
+                        title, link = next(pending)
+                    except StopIteration:
+                        break
+                    in_flight.add(self.fetcher.submit(link, context=title))
+                if not in_flight:
+                    return
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                results = [future.result() for future in done]
+                saved = self._saved_urls(result.url for result in results if result.ok and result.not_modified)
+                for result in results:
+                    if not result.ok:
+                        self.logger.error(f"Failed to request {result.context}: {result.error}")
+                        continue
+                    self.request_count += 1
+                    self._buffer_requested(result)
+                    self.logger.info(f"Requested: {result.context}")
+                    self._archive_page(result, ArchivedPage.DETAIL)
+                    if result.not_modified and canonicalize_url(result.url) in saved:
+                        self.logger.debug(f"Not modified since last fetch, skipping: {result.context}")
+                        continue
+                    yield result
+        finally:
+            self.flush_requested()
+            self.flush_archive()
+
+    def _saved_urls(self, urls: Iterable[str]) -> set[str]:
+        """
+        The canonical URLs of `urls` already saved as a Job, with one query per
+        window of completed pages. An unchanged page is only skipped then, the
+        cached body of a page whose job was never saved (a parse or save
+        failure, or only a Requested row) is parsed again.
+        """
+        try:
+            return {canonical_url for canonical_url, in
+                    self._query_by_canonical_url(Job, {canonicalize_url(url) for url in urls})}
+        except Exception as e:
+            self.logger.error(f"Error checking which unchanged pages are saved: {e}")
+            return set()
+
+    def _buffer_requested(self, result: FetchResult):
+        self.requested_buffer.append(
+            Requested(url=result.url, canonical_url=canonicalize_url(result.url), title=result.context)
+        )
+        if len(self.requested_buffer) >= settings.SCRAPER_REQUESTED_FLUSH_SIZE:
+            self.flush_requested()
+
+    def flush_requested(self):
+        """Writes the buffered Requested rows in one INSERT, skipping URLs another worker requested meanwhile."""
+        if not self.requested_buffer:
+            return
+        buffer, self.requested_buffer = self.requested_buffer, []
+        try:
+            Requested.objects.bulk_create(buffer, ignore_conflicts=True)
+        except Exception as e:
+            self.logger.error(f"Error saving {len(buffer)} requested pages: {e}")
+            return
+        if self.seen_filter is not None:
+            self.seen_filter.add_many(requested.canonical_url for requested in buffer)
+
+    def _archive_page(self, result: FetchResult, kind: str):
+        """Keeps the raw page in the archive so extraction can be re-run without refetching."""
+        if self.archive is None:
+            return
+        try:
+            self.archive_buffer.append(self.archive.record(self.__class__.__name__, result.url, result.text, kind))
+        except Exception as e:
+            self.logger.error(f"Error archiving {result.url}: {e}")
+            return
+        if len(self.archive_buffer) >= settings.SCRAPER_REQUESTED_FLUSH_SIZE:
+            self.flush_archive()
+
+    def flush_archive(self):
+        """Writes the buffered ArchivedPage rows in one INSERT, their bodies are already on disk."""
+        if not self.archive_buffer:
+            return
+        buffer, self.archive_buffer = self.archive_buffer, []
+        try:
+            ArchivedPage.objects.bulk_create(buffer)
+        except Exception as e:
+            self.logger.error(f"Error saving {len(buffer)} archived pages: {e}")
+
+    def _process_single_job(self, title: str, result: FetchResult) -> Optional[Dict]:
+        """Parses a fetched job posting page into job details."""
+        try:
+            job_details = self.parse_job_page(result.text)
+            job_details["link"] = result.url
+            return job_details
         except Exception as e:
             self.logger.error(f"Error processing job {title}: {e}")
         return None
 
-    def _get_job_page(self, link: str, title: str) -> Optional[BeautifulSoup]:
-        """Fetches and parses individual job posting page with request limit."""
-        if self.request_count >= self.request_limit:
+    def parse_job_page(self, html: str) -> Dict:
+        """Extracts job details from the page's embedded JSON state, falling back to the DOM extractors."""
+        if (job_details := self.parse_embedded_json(html)) is not None:
+            return job_details
+
+        soup = self.make_detail_soup(html)
+        try:
+            return self.extract_job_details(soup)
+        finally:
+            soup.decompose()
+
+    def extract_job_details(self, soup: BeautifulSoup) -> Dict:
+        """Runs the DOM extractors over a parsed job page."""
+        experience = self.extract_experience_level(soup)
+        return {
+            "company": self.extract_company(soup),
+            "location": self.extract_location(soup),
+            "operating_mode": self.extract_operating_mode(soup),
+            "experience": experience,
+            "salary": self.extract_salary(soup),
+            "description": self.extract_description(soup),
+            "skills": self.process_skills(soup, experience),
+        }
+
+    def make_detail_soup(self, html: str) -> AnchoredSoup:
+        """Parses a job page and locates every FIELD_SPEC anchor in one traversal."""
+        return self.extraction_plan.run(self.make_soup(html, self.get_detail_parse_selectors()))
+
+    # Embedded JSON Extraction
+    # --------------------------------------------------
+    def get_embedded_json_script_id(self) -> Optional[str]:
+        """
+        Id of the <script> tag holding the page state the board's frontend is
+        rendered from (Next.js __NEXT_DATA__, Angular transfer state).
+        None disables the embedded JSON path.
+        """
+        return None
+
+    def parse_embedded_json(self, html: str) -> Optional[Dict]:
+        """Maps the embedded JSON state of a job page to job details, or returns None when it is absent or unknown."""
+        if (data := self.extract_embedded_json(html)) is None:
             return None
-        
         try:
-            headers = {'User-Agent': "Mozilla/5.0 (X11; Linux x86_64; rv:132.0) Gecko/20100101 Firefox/132.0"}
-            
-            if 'justjoin' in link:
-                headers = {'User-Agent': "Mozilla/5.0 (X11; Linux x86_64; rv:132.0) Gecko/20100101 Firefox/132.0",
-                           'cookie': 'userCurrency=pln'}
-            response = requests.get(link, headers=headers)
-            self.request_count += 1
-            time.sleep(randint(1, 5))
-            
-            Requested.objects.create(url=link, title=title)
-            self.logger.info(f"Requested: {title}")
-            
-            return BeautifulSoup(response.text, "html.parser")
-        except requests.RequestException as e:
-            self.logger.error(f"Failed to request {title}: {e}")
+            return self.map_embedded_json(data)
+        except (KeyError, IndexError, TypeError, ValueError, AttributeError) as e:
+            self.logger.debug(f"Unexpected embedded JSON structure, using DOM extractors: {e}")
+        return None
+
+    def extract_embedded_json(self, html: str) -> Optional[Any]:
+        """Finds the state script in the raw page with a regex, without building a DOM."""
+        if not (script_id := self.get_embedded_json_script_id()):
             return None
+        pattern = rf'<script[^>]*\bid=["\']{re.escape(script_id)}["\'][^>]*>(.*?)</script>'
+        if not (match := re.search(pattern, html, re.DOTALL)):
+            return None
+        try:
+            return self.decode_embedded_json(match.group(1))
+        except ValueError as e:
+            self.logger.debug(f"Invalid embedded JSON, using DOM extractors: {e}")
+        return None
+
+    def decode_embedded_json(self, raw: str) -> Any:
+        return json.loads(raw)
+
+    def map_embedded_json(self, data: Any) -> Optional[Dict]:
+        """
+        Maps the decoded page state to the same job details the DOM extractors
+        return (company, location, operating_mode, experience, salary,
+        description, skills). Lookup errors fall back to the DOM.
+        """
+        return None
+
+    def html_to_text(self, html: str) -> str:
+        """Plain text of an HTML fragment from the page state, formatted like the DOM description extractors."""
+        return BeautifulSoup(html, self.parser).get_text(separator='\n', strip=True)
+
+    @staticmethod
+    def format_salary_range(low: Optional[float], high: Optional[float], currency: str) -> str:
+        """Formats a salary range like the boards display it ("12 000 - 18 000 PLN")."""
+        amounts = [f"{amount:,.0f}".replace(',', ' ') for amount in (low, high) if amount]
+        return f"{' - '.join(amounts)} {currency.upper()}" if amounts else ""
+
+    # Archive Re-parsing
+    # --------------------------------------------------
+    def reparse_archive(self, since: Optional[datetime] = None, batch_size: int = 500) -> int:
+        """Re-runs company, salary and skills extraction over archived detail pages and updates matching jobs."""
+        if self.archive is None:
+            self.logger.error("Page archive is disabled, nothing to re-parse")
+            return 0
+
+        updated_count = 0
+        batch = []
+        for page, html in self.archive.iter_latest(self.__class__.__name__, since=since):
+            batch.append((page.url, html))
+            if len(batch) >= batch_size:
+                updated_count += self._reparse_batch(batch)
+                batch = []
+        if batch:
+            updated_count += self._reparse_batch(batch)
+
+        self.logger.info(f"Re-parsed archive. Updated {updated_count} jobs")
+        return updated_count
+
+    def _reparse_batch(self, pages: list[Tuple[str, str]]) -> int:
+        """Updates the jobs of one batch of archived pages with a single query and a bulk update."""
+        canonical_urls = [canonicalize_url(url) for url, _ in pages]
+        jobs = {job.canonical_url: job for job in Job.objects.filter(canonical_url__in=canonical_urls)}
+        changed = []
+        for (url, html), canonical_url in zip(pages, canonical_urls):
+            if not (job := jobs.get(canonical_url)):
+                continue
+            try:
+                job_details = self.parse_job_page(html)
+                job.company = job_details["company"]
+                job.set_salary(job_details["salary"])
+                job.skills = job_details["skills"]
+                changed.append(job)
+            except Exception as e:
+                self.logger.error(f"Error re-parsing {url}: {e}")
+
+        if changed:
+            with transaction.atomic():
+                Job.objects.bulk_update(changed, ['company', 'salary', 'salary_min', 'salary_max', 'salary_currency',
+                                                  'salary_period', 'skills'])
+        return len(changed)
 
     # Skills Processing
     # --------------------------------------------------
@@ -224,69 +606,193 @@ class WebScraper(ABC):
 
     # Database Operations
     # --------------------------------------------------
-    @transaction.atomic
+    def save_jobs_in_batches(self, jobs: Iterable[Tuple[str, Dict]]) -> int:
+        """
+        Saves jobs as they come in, one transaction per batch, so they show up
+        in the API during the run. A batch is flushed when it reaches
+        SCRAPER_SAVE_BATCH_SIZE jobs or when a job arrives more than
+        SCRAPER_SAVE_MAX_DELAY seconds after the batch was started.
+        """
+        batch = {}
+        started_at = None
+        for title, job_details in jobs:
+            batch[title] = job_details
+            started_at = started_at or time.monotonic()
+            if (len(batch) >= settings.SCRAPER_SAVE_BATCH_SIZE
+                    or time.monotonic() - started_at >= settings.SCRAPER_SAVE_MAX_DELAY):
+                self.saved_count += self.save_jobs(batch)
+                batch, started_at = {}, None
+        if batch:
+            self.saved_count += self.save_jobs(batch)
+        return self.saved_count
+
     def save_jobs(self, jobs_data: Dict) -> int:
-        """Saves processed jobs to the database."""
-        saved_count = 0
+        """
+        Saves a batch of processed jobs in a few queries: one to find the jobs
+        already in the database (same canonical URL, or same company and
+        title), one upsert for the new ones with a lookup of the ids it
+        returned, and one UPDATE refreshing the scraped date of the existing
+        ones. Only the jobs actually inserted are counted. New jobs whose description was
+        summarized before get that summary, the others are saved with a
+        pending summary and queued for the summaries worker. With SUMMARY_MODE
+        'lazy' no summary is looked up or queued, jobs are summarized when
+        first viewed.
+        """
+        jobs = self._build_jobs(jobs_data)
+        if not jobs:
+            return 0
+        try:
+            jobs, existing_ids = self._split_existing_jobs(jobs)
+        except Exception as e:
+            self.logger.error(f"Error checking existing jobs: {e}")
+            return 0
+        self._apply_cached_summaries(jobs)
+
+        try:
+            with transaction.atomic():
+                if jobs:
+                    # A posting inserted concurrently by another worker only gets its date refreshed
+                    Job.objects.bulk_create(jobs, update_conflicts=True, unique_fields=['canonical_url'],
+                                            update_fields=['scraped_date'])
+                    jobs = self._drop_concurrent_inserts(jobs)
+                if existing_ids:
+                    Job.objects.filter(id__in=existing_ids).update(scraped_date=datetime.now(timezone.utc))
+        except Exception as e:
+            self.logger.error(f"Error saving {len(jobs)} jobs: {e}")
+            return 0
+        if self.seen_filter is not None:
+            self.seen_filter.add_many(job.canonical_url for job in jobs)
+        if pending_ids := [job.pk for job in jobs if job.summary_status == Job.SUMMARY_PENDING and job.pk]:
+            transaction.on_commit(lambda: self._enqueue_summaries(pending_ids))
+
+        for job in jobs:
+            self.logger.info(f"Created job: {job.title}")
+        return len(jobs)
+
+    def _build_jobs(self, jobs_data: Dict) -> list[Job]:
+        """Unsaved Job instances for a batch, without the summary and without duplicates within the batch."""
+        jobs = []
+        seen_urls, seen_postings = set(), set()
+        to_summarize = Job.SUMMARY_LAZY if settings.SUMMARY_MODE == 'lazy' else Job.SUMMARY_PENDING
         for title, data in jobs_data.items():
             try:
-                description = data.get("description", "")
-                summary = summarize_text(description) if description else ""
- 
-                
-                if not self._is_duplicate_job(title, data):
-                    url = data.get("link")
-                    if 'pracuj.pl' in url:
-                        source = "Pracuj.pl"
-                    elif 'nofluffjobs.com' in url:
-                        source = "NoFluffJobs"
-                    elif 'justjoin.it' in url:
-                        source = "JustJoinIt"
-                    elif 'theprotocol.it' in url:
-                        source = "TheProtocol"
-                    
-                    # Standardize salary before saving
-                    raw_salary = data.get("salary")
-                    standardized_salary = standardize_salary(raw_salary) if raw_salary else None
-                    
-                    Job.objects.create(
-                        title=title,
-                        company=data.get("company"),
-                        location=data.get("location"),
-                        operating_mode=data.get("operating_mode"),
-                        experience=data.get("experience"),
-                        salary=standardized_salary,
-                        description=description,
-                        skills=data.get("skills"),
-                        summary=summary,
-                        url=url,
-                        source=source
-                    )
-                    saved_count += 1
-                    self.logger.info(f"Created job: {title}")
-                else:
-                    self.logger.info(f"Skipping {title} already exists in database")
+                url = data.get("link")
+                if not (source := self.get_job_source(url)):
+                    self.logger.error(f"Error saving job {title}: unknown job board {url}")
+                    continue
+                canonical_url = canonicalize_url(url)
+                company = data.get("company")
+                if canonical_url in seen_urls or (company, title) in seen_postings:
+                    self.logger.info(f"Skipping {title} already in this batch")
+                    continue
+                seen_urls.add(canonical_url)
+                seen_postings.add((company, title))
+
+                job = Job(
+                    title=title,
+                    company=company,
+                    location=data.get("location"),
+                    operating_mode=data.get("operating_mode"),
+                    experience=data.get("experience"),
+                    description=data.get("description", ""),
+                    summary="",
+                    summary_status=to_summarize if data.get("description") else Job.SUMMARY_DONE,
+                    skills=data.get("skills"),
+                    url=url,
+                    canonical_url=canonical_url,
+                    source=source,
+                )
+                # Standardize salary before saving
+                job.set_salary(data.get("salary"))
+                jobs.append(job)
             except Exception as e:
                 self.logger.error(f"Error saving job {title}: {e}")
-        return saved_count
-
-    def _is_duplicate_job(self, title: str, data: Dict) -> bool:
-        """Checks if a job already exists in the database."""
-        
-        # Check for duplicate URL
-        if Job.objects.filter(url=data.get("link")).exists():
-            self.logger.debug(f"Duplicate found by URL: {data.get('link')}")
-            return True
-        
-        # Check for exact company and title match
-        company = data.get("company")
-        if Job.objects.filter(company=company, title=title).exists():
-            self.logger.debug(f"Duplicate found by company/title match: {company} - {title}")
-            return True
-            
-        return False
+        return jobs
+
+    def _split_existing_jobs(self, jobs: list[Job]) -> Tuple[list[Job], list[int]]:
+        """Splits a batch into the jobs to insert and the ids of jobs already in the database, in one query."""
+        companies = {job.company for job in jobs}
+        same_company = Q(company__in=companies - {None})
+        if None in companies:
+            same_company |= Q(company__isnull=True)
+        existing = Job.objects.filter(
+            Q(canonical_url__in=[job.canonical_url for job in jobs])
+            | Q(same_company, title__in={job.title for job in jobs})
+        ).values_list('id', 'canonical_url', 'company', 'title')
+
+        ids_by_url, ids_by_posting = {}, {}
+        for job_id, canonical_url, company, title in existing:
+            ids_by_url[canonical_url] = job_id
+            ids_by_posting[(company, title)] = job_id
+
+        new_jobs, existing_ids = [], []
+        for job in jobs:
+            if (job_id := ids_by_url.get(job.canonical_url, ids_by_posting.get((job.company, job.title)))):
+                self.logger.info(f"Skipping {job.title} already exists in database")
+                existing_ids.append(job_id)
+            else:
+                new_jobs.append(job)
+        return new_jobs, existing_ids
+
+    def _drop_concurrent_inserts(self, jobs: list[Job]) -> list[Job]:
+        """
+        The upserted jobs this batch actually inserted. The upsert returns the
+        id of a posting another worker inserted after the existence check,
+        which kept its own created_at: it is neither counted, nor logged as
+        created, nor queued for a summary again.
+        """
+        created_at = dict(Job.objects.filter(pk__in=[job.pk for job in jobs]).values_list('id', 'created_at'))
+        inserted = []
+        for job in jobs:
+            if created_at.get(job.pk) == job.created_at:
+                inserted.append(job)
+            else:
+                self.logger.info(f"Skipping {job.title} saved meanwhile by another worker")
+        return inserted
+
+    def _apply_cached_summaries(self, jobs: list[Job]):
+        pending = [job for job in jobs if job.summary_status == Job.SUMMARY_PENDING]
+        if not pending:
+            return
+        try:
+            cached = self.summarizer.lookup(job.description for job in pending)
+        except Exception as e:
+            self.logger.error(f"Error looking up cached summaries: {e}")
+            return
+        for job in pending:
+            if (summary := cached.get(job.description)) is not None:
+                job.summary = summary
+                job.summary_status = Job.SUMMARY_DONE
+
+    def _enqueue_summaries(self, job_ids: list[int]):
+        # Imported here, jobs.tasks imports the scrapers
+        from jobs.tasks import enqueue_summaries
+        try:
+            enqueue_summaries(job_ids)
+        except Exception as e:
+            self.logger.error(f"Error queueing {len(job_ids)} summaries, left for summarize_pending_jobs_task: {e}")
+
+    @staticmethod
+    def get_job_source(url: str) -> Optional[str]:
+        if 'pracuj.pl' in url:
+            return "Pracuj.pl"
+        if 'nofluffjobs.com' in url:
+            return "NoFluffJobs"
+        if 'justjoin.it' in url:
+            return "JustJoinIt"
+        if 'theprotocol.it' in url:
+            return "TheProtocol"
+        return None
 
+    # Partial Parsing
+    # --------------------------------------------------
+    def get_listing_parse_selectors(self) -> list[Dict]:
+        """Elements of a listing page whose subtrees are parsed, the rest of the page is skipped."""
+        return [self.get_jobs_container_selector()]
 
+    def get_detail_parse_selectors(self) -> list[Dict]:
+        """Elements of a job page whose subtrees are parsed: the FIELD_SPEC anchors. An empty list parses the whole page."""
+        return self.extraction_plan.selectors
 
     # Abstract Methods That Need Implementation
     # -----------------------------------------------
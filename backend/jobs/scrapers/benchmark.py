@@ -0,0 +1,193 @@
+import os
+import resource
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional, Type
+
+from django.db import transaction
+
+from jobs.utils.salary_standardizer import standardize_salary
+from .base_scraper import WebScraper
+from .extraction import AnchoredSoup
+from .fetcher import AsyncFetcher
+from .http_session import HttpSession
+from .rate_limiter import RateLimiter
+from .replay import ReplayTransport
+
+
+class RssSampler:
+    """Polls the resident set size in a background thread and keeps the peak."""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def __enter__(self) -> "RssSampler":
+        self.peak = current_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+
+def current_rss() -> int:
+    """Current RSS in bytes, falling back to the process peak where /proc is not available."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class StageStats:
+    def __init__(self):
+        self.pages = 0
+        self.seconds = 0.0
+        self.peak_rss = 0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            'pages': self.pages,
+            'pages_per_second': self.pages / self.seconds if self.seconds else 0.0,
+            'ms_per_page': self.seconds * 1000 / self.pages if self.pages else 0.0,
+            'peak_rss_mb': self.peak_rss / (1024 * 1024),
+        }
+
+
+class ScraperBenchmark:
+    """
+    Runs a scraper end to end against its recorded pages and times every stage.
+
+    Pages are fetched once through the regular fetch engine with the network
+    replaced by `ReplayTransport`, then the listing parse, detail parse,
+    embedded JSON, skills, salary and save stages are repeated `iterations`
+    times. The detail stage always times the DOM extractors; the json stage
+    counts only pages whose embedded state could be mapped. Saving happens in
+    a transaction that is rolled back.
+
+    `extraction` compares the DOM extractors on a plain soup, where every
+    lookup walks the document, with the scraper's compiled extraction plan.
+    """
+
+    STAGES = ('listing', 'detail', 'json', 'skills', 'salary', 'save')
+    DETAIL_EXTRACTORS = {
+        'company': 'extract_company',
+        'location': 'extract_location',
+        'operating_mode': 'extract_operating_mode',
+        'experience': 'extract_experience_level',
+        'description': 'extract_description',
+    }
+
+    def __init__(self, name: str, scraper_class: Type[WebScraper], iterations: int = 5,
+                 parser: Optional[str] = None):
+        self.name = name
+        self.scraper = scraper_class(request_limit=10 ** 6)
+        self.scraper.archive = None
+        if parser:
+            self.scraper.parser = self.scraper.resolve_parser(parser)
+        self.iterations = iterations
+        self.stages = {stage: StageStats() for stage in self.STAGES}
+        self.fields = {field: 0.0 for field in [*self.DETAIL_EXTRACTORS, 'salary', 'skills']}
+        self.detail_pages_parsed = 0
+
+    def run(self) -> Dict:
+        listing_pages, detail_pages = self._fetch_recordings()
+        extraction = self._compare_extraction(detail_pages)
+        for _ in range(self.iterations):
+            with self._stage('listing', len(listing_pages)):
+                self.scraper.get_job_listings(listing_pages)
+            jobs_data = self._parse_details(detail_pages)
+            with self._stage('save', len(jobs_data)):
+                self._save(jobs_data)
+
+        return {
+            'stages': {stage: stats.to_dict() for stage, stats in self.stages.items()},
+            'fields': {field: seconds * 1000 / self.detail_pages_parsed
+                       for field, seconds in self.fields.items()},
+            'extraction': extraction,
+        }
+
+    def _fetch_recordings(self):
+        """Fetches listing and detail pages through the fetch engine from the replay transport."""
+        unlimited = RateLimiter(rate=1e9, burst=1e9, min_rate=1e9, max_rate=1e9)
+        session = HttpSession(self.scraper.get_request_headers(), transport=ReplayTransport(self.name))
+        with AsyncFetcher(session, rate_limiter=unlimited) as self.scraper.fetcher:
+            listing_pages = self.scraper.get_main_html()
+            titles = {data['link']: title for listings in self.scraper.get_job_listings(listing_pages)
+                      for title, data in listings.items()}
+            futures = [self.scraper.fetcher.submit(link, context=title) for link, title in titles.items()]
+            results = [future.result() for future in futures]
+        return listing_pages, [(r.context, r.url, r.text) for r in results if r.ok]
+
+    def _parse_details(self, detail_pages) -> Dict:
+        jobs_data = {}
+        for title, url, html in detail_pages:
+            with self._stage('detail', 1):
+                soup = self.scraper.make_detail_soup(html)
+                job = {field: self._timed(field, getattr(self.scraper, extractor), soup)
+                       for field, extractor in self.DETAIL_EXTRACTORS.items()}
+            with self._stage('skills', 1):
+                job['skills'] = self._timed('skills', self.scraper.process_skills, soup, job['experience'])
+            with self._stage('salary', 1):
+                job['salary'] = self._timed('salary', self.scraper.extract_salary, soup)
+                if job['salary']:
+                    standardize_salary(job['salary'])
+            with self._stage('json', 0):
+                embedded = self.scraper.parse_embedded_json(html)
+            if embedded is not None:
+                self.stages['json'].pages += 1
+            job['link'] = url
+            jobs_data[title] = job
+            self.detail_pages_parsed += 1
+        return jobs_data
+
+    def _compare_extraction(self, detail_pages) -> Dict[str, float]:
+        """Traversals and time per page of the DOM extractors without and with the extraction plan."""
+        soups = [self.scraper.make_soup(html, self.scraper.get_detail_parse_selectors())
+                 for _, _, html in detail_pages]
+        result = {}
+        for label, anchor in (('before', lambda soup: AnchoredSoup(soup, {})),
+                              ('after', self.scraper.extraction_plan.run)):
+            traversals = 0
+            start = time.perf_counter()
+            for _ in range(self.iterations):
+                for soup in soups:
+                    anchored = anchor(soup)
+                    self.scraper.extract_job_details(anchored)
+                    traversals += anchored.traversals
+            runs = self.iterations * len(soups) or 1
+            result[f'traversals_{label}'] = traversals / runs
+            result[f'ms_{label}'] = (time.perf_counter() - start) * 1000 / runs
+        return result
+
+    def _save(self, jobs_data: Dict):
+        # Rolled back before commit, so no summaries are queued
+        with transaction.atomic():
+            self.scraper.save_jobs(jobs_data)
+            transaction.set_rollback(True)
+
+    def _timed(self, field: str, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.fields[field] += time.perf_counter() - start
+        return result
+
+    @contextmanager
+    def _stage(self, stage: str, pages: int):
+        stats = self.stages[stage]
+        with RssSampler() as sampler:
+            start = time.perf_counter()
+            yield
+            stats.seconds += time.perf_counter() - start
+        stats.pages += pages
+        stats.peak_rss = max(stats.peak_rss, sampler.peak)
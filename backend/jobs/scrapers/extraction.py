@@ -0,0 +1,129 @@
+from typing import Callable, Dict, Hashable, Iterable, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, Tag
+
+AttrValue = Union[str, list, None]
+SelectorKey = Tuple[Optional[str], Tuple[Tuple[str, Hashable], ...]]
+
+
+def attr_matches(key: str, value: AttrValue, expected) -> bool:
+    """
+    Matches one attribute the way `find` does. `value` is the raw string seen
+    while parsing or the list bs4 keeps for multi-valued attributes like class.
+    """
+    if expected is True:
+        return value is not None
+    if value is None:
+        return False
+    if isinstance(value, list):
+        return expected in value or ' '.join(value) == expected
+    return value == expected or (key == 'class' and expected in value.split())
+
+
+def compile_selector(selector: Dict) -> Callable[[str, Dict[str, AttrValue]], bool]:
+    """Turns a {'name': ..., 'attrs': {...}} selector dict into a (name, attrs) predicate."""
+    name = selector.get('name')
+    attrs = list((selector.get('attrs') or {}).items())
+
+    def matches(tag_name: str, tag_attrs: Dict[str, AttrValue]) -> bool:
+        return (not name or name == tag_name) and all(
+            attr_matches(key, tag_attrs.get(key), expected) for key, expected in attrs
+        )
+    return matches
+
+
+def selector_key(name: Optional[str], attrs: Optional[Dict]) -> SelectorKey:
+    return name or None, tuple(sorted((attrs or {}).items()))
+
+
+class ExtractionPlan:
+    """
+    Compiled form of a scraper's FIELD_SPEC.
+
+    FIELD_SPEC maps every detail field to the selectors its extractor looks
+    up from the page root. The plan merges them into one set of anchors,
+    indexed by tag name, and `run` collects every anchor in a single walk
+    over the document. Extractors then receive an `AnchoredSoup`, where those
+    lookups are dictionary hits instead of one more traversal each.
+    """
+
+    def __init__(self, field_spec: Dict[str, Iterable[Dict]]):
+        self.field_spec = field_spec
+        self.selectors: list[Dict] = []
+        by_name: Dict[Optional[str], list[Tuple[SelectorKey, Callable]]] = {}
+        seen = set()
+        for selectors in field_spec.values():
+            for selector in selectors:
+                key = selector_key(selector.get('name'), selector.get('attrs'))
+                if key in seen:
+                    continue
+                seen.add(key)
+                self.selectors.append(selector)
+                by_name.setdefault(key[0], []).append((key, compile_selector(selector)))
+
+        # Anchors without a tag name are candidates for every tag
+        self._wildcard = by_name.pop(None, [])
+        self._candidates = {name: anchors + self._wildcard for name, anchors in by_name.items()}
+        self._keys = [key for key, _ in self._wildcard] + [key for anchors in by_name.values() for key, _ in anchors]
+
+    def run(self, soup: BeautifulSoup) -> "AnchoredSoup":
+        found: Dict[SelectorKey, list[Tag]] = {key: [] for key in self._keys}
+        if found:
+            for tag in soup.find_all(True):
+                for key, matches in self._candidates.get(tag.name, self._wildcard):
+                    if matches(tag.name, tag.attrs):
+                        found[key].append(tag)
+        return AnchoredSoup(soup, found, traversals=1 if found else 0)
+
+
+class AnchoredSoup:
+    """
+    A parsed page with the anchors of an `ExtractionPlan` already located.
+
+    `find` / `find_all` for a selector in the plan are answered from the
+    collected anchors in document order. Anything else is delegated to the
+    soup and counted in `traversals`, which keeps lookups missing from
+    FIELD_SPEC visible in the extraction benchmark.
+    """
+
+    def __init__(self, soup: BeautifulSoup, anchors: Dict[SelectorKey, list[Tag]], traversals: int = 0):
+        self.soup = soup
+        self.anchors = anchors
+        self.traversals = traversals
+
+    def find(self, name=None, attrs={}, recursive=True, string=None, **kwargs) -> Optional[Tag]:
+        if (key := self._anchor_key(name, attrs, recursive, string, kwargs)) is not None:
+            return next(iter(self.anchors[key]), None)
+        self.traversals += 1
+        return self.soup.find(name, attrs, recursive, string, **kwargs)
+
+    def find_all(self, name=None, attrs={}, recursive=True, string=None, limit=None, **kwargs) -> list[Tag]:
+        if limit is None and (key := self._anchor_key(name, attrs, recursive, string, kwargs)) is not None:
+            return list(self.anchors[key])
+        self.traversals += 1
+        return self.soup.find_all(name, attrs, recursive, string, limit, **kwargs)
+
+    findAll = findChildren = find_all
+
+    def select_one(self, selector: str, *args, **kwargs) -> Optional[Tag]:
+        self.traversals += 1
+        return self.soup.select_one(selector, *args, **kwargs)
+
+    def select(self, selector: str, *args, **kwargs) -> list[Tag]:
+        self.traversals += 1
+        return self.soup.select(selector, *args, **kwargs)
+
+    def __getattr__(self, attr):
+        return getattr(self.soup, attr)
+
+    def _anchor_key(self, name, attrs, recursive, string, kwargs) -> Optional[SelectorKey]:
+        if not recursive or string is not None or not (name is None or isinstance(name, str)):
+            return None
+        attrs = {'class': attrs} if isinstance(attrs, str) else dict(attrs or {})
+        for keyword, value in kwargs.items():
+            attrs['class' if keyword == 'class_' else keyword] = value
+        try:
+            key = selector_key(name, attrs)
+            return key if key in self.anchors else None
+        except TypeError:
+            return None
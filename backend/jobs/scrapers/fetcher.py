@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from .http_session import HttpSession
+from .rate_limiter import CircuitOpenError, RateLimiter, RetryPolicy
+
+
+class FetchError(Exception):
+    """Raised when a fetched page came back with an error status."""
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a single page fetch."""
+    url: str
+    context: Any = None
+    text: Optional[str] = None
+    status_code: Optional[int] = None
+    error: Optional[Exception] = None
+    not_modified: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.text is not None
+
+    def raise_for_status(self):
+        """Raises the transport error or an error for 4xx/5xx responses."""
+        if self.error is not None:
+            raise self.error
+        if self.status_code >= 400:
+            raise FetchError(f"HTTP {self.status_code} for url: {self.url}")
+
+
+class AsyncFetcher:
+    """
+    Fetches pages concurrently on a background asyncio loop.
+
+    Each host gets a bounded in-flight window and every request goes through
+    the per-domain rate limiter, so several boards can be crawled at once
+    without hammering any of them. Throttled (429), failed (5xx) and timed out
+    requests are retried with backoff. Callers stay synchronous: `submit`
+    returns a `concurrent.futures.Future` that resolves to a `FetchResult`.
+    """
+
+    def __init__(self, session: HttpSession, max_in_flight_per_host: int = 4,
+                 rate_limiter: Optional[RateLimiter] = None, retry_policy: Optional[RetryPolicy] = None):
+        self.session = session
+        self.max_in_flight_per_host = max_in_flight_per_host
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.logger = logging.getLogger('scraper.fetcher')
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="scraper-fetcher", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "AsyncFetcher":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def submit(self, url: str, context: Any = None) -> Future:
+        """Schedules a fetch and returns a future resolving to a FetchResult."""
+        return asyncio.run_coroutine_threadsafe(self._fetch(url, context), self._loop)
+
+    def fetch(self, url: str) -> FetchResult:
+        """Fetches a single page, blocking until it completes."""
+        return self.submit(url).result()
+
+    def close(self):
+        """Closes the HTTP session and stops the background loop."""
+        if self._loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self.session.aclose(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    async def _fetch(self, url: str, context: Any) -> FetchResult:
+        limiter = self.rate_limiter.for_url(url)
+        result = None
+        for attempt in range(self.retry_policy.max_retries + 1):
+            if not limiter.breaker.allow():
+                return FetchResult(url=url, context=context, error=CircuitOpenError(f"Circuit open for {limiter.domain}"))
+
+            retry_after = None
+            async with self._get_host(url):
+                await asyncio.sleep(limiter.bucket.reserve())
+                try:
+                    response = await self.session.get(url)
+                    result = FetchResult(url=url, context=context, text=response.text, status_code=response.status_code,
+                                         not_modified=response.extensions.get('not_modified', False))
+                except httpx.HTTPError as e:
+                    result = FetchResult(url=url, context=context, error=e)
+
+            if result.error is None and not self.retry_policy.should_retry(result.status_code):
+                limiter.bucket.on_success()
+                limiter.breaker.record_success()
+                return result
+
+            limiter.breaker.record_failure()
+            if result.status_code == 429:
+                limiter.bucket.on_throttle()
+                retry_after = self.retry_policy.parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is not None:
+                    limiter.bucket.pause(retry_after)
+
+            if attempt < self.retry_policy.max_retries:
+                delay = max(retry_after or 0, self.retry_policy.backoff(attempt))
+                self.logger.warning(f"Retrying {url} in {delay:.1f}s after {result.error or result.status_code}")
+                await asyncio.sleep(delay)
+
+        if result.error is None:
+            result.error = FetchError(f"HTTP {result.status_code} for url: {url}")
+        return result
+
+    def _get_host(self, url: str) -> asyncio.Semaphore:
+        netloc = urlsplit(url).netloc
+        if netloc not in self._hosts:
+            self._hosts[netloc] = asyncio.Semaphore(self.max_in_flight_per_host)
+        return self._hosts[netloc]
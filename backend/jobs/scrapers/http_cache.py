@@ -0,0 +1,123 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: bytes
+    content_type: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+class HttpCache:
+    """
+    On-disk cache of page bodies and their validators for conditional GETs.
+
+    Each URL keeps its last body together with the ETag / Last-Modified the
+    server sent. The next request for that URL sends If-None-Match /
+    If-Modified-Since, and a 304 is answered from the stored body. Bodies are
+    zlib-compressed in a single SQLite file which is kept under `max_bytes` by
+    evicting the least recently used entries. Reads only note the access
+    time, the times are written with the next store, before any eviction, or
+    every TOUCH_FLUSH_SIZE reads. The methods block on disk, async callers
+    run them in a thread.
+    """
+
+    TOUCH_FLUSH_SIZE = 100
+
+    def __init__(self, path: str, max_bytes: int = 200 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._touched: Dict[str, float] = {}
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self._db.commit()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, content_type, etag, last_modified FROM entries WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[url] = time.time()
+            if len(self._touched) >= self.TOUCH_FLUSH_SIZE:
+                self._flush_touched()
+                self._db.commit()
+        body, content_type, etag, last_modified = row
+        return CacheEntry(url, zlib.decompress(body), content_type, etag, last_modified)
+
+    def store(self, url: str, response: httpx.Response):
+        """Stores the response body if the server sent a validator we can revalidate with."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+
+        body = zlib.compress(response.content)
+        with self._lock:
+            self._db.execute(
+                "REPLACE INTO entries (url, body, content_type, etag, last_modified, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, response.headers.get('Content-Type', ''), etag, last_modified, len(body), time.time()),
+            )
+            self._touched.pop(url, None)
+            self._flush_touched()
+            self._evict()
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._flush_touched()
+            self._db.commit()
+            self._db.close()
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        headers = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def _flush_touched(self):
+        if self._touched:
+            self._db.executemany("UPDATE entries SET last_access = ? WHERE url = ?",
+                                 [(accessed_at, url) for url, accessed_at in self._touched.items()])
+            self._touched = {}
+
+    def _evict(self):
+        """Drops least recently used entries until the cache fits in `max_bytes`."""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self._db.execute("SELECT url, size FROM entries ORDER BY last_access").fetchall():
+            self._db.execute("DELETE FROM entries WHERE url = ?", (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
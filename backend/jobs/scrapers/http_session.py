@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import httpx
+
+from .http_cache import HttpCache
+
+
+@dataclass
+class SessionStats:
+    """Counts connection reuse and conditional-GET savings of a session."""
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+    not_modified: int = 0
+    bytes_saved: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        return max(self.requests - self.connections_opened, 0)
+
+    def __str__(self) -> str:
+        return (f"{self.requests} requests, {self.connections_opened} connections opened, "
+                f"{self.connections_reused} reused, {self.tls_handshakes} TLS handshakes, "
+                f"{self.not_modified} not modified ({self.bytes_saved} bytes saved)")
+
+
+class HttpSession:
+    """
+    Pooled keep-alive HTTP transport shared by every request of a scraper run.
+
+    Connections are pooled per host and kept alive between requests, headers
+    are built once, responses are negotiated with gzip/brotli compression and
+    HTTP/2 is used when enabled and available. With a `cache`, requests are
+    sent as conditional GETs and a 304 is answered from the cached body.
+    """
+
+    def __init__(self, headers: Dict[str, str], timeout: float = 30.0, http2: bool = False,
+                 max_connections: int = 20, max_keepalive_connections: int = 10, keepalive_expiry: float = 30.0,
+                 cache: Optional[HttpCache] = None, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.headers = headers
+        self.cache = cache
+        self.transport = transport
+        self.timeout = timeout
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.stats = SessionStats()
+        self.logger = logging.getLogger('scraper.session')
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def get(self, url: str) -> httpx.Response:
+        """GETs a page. Responses answered from the cache carry `extensions['not_modified']`."""
+        # The cache is an SQLite file, its reads and writes run off the event loop
+        entry = await asyncio.to_thread(self.cache.get, url) if self.cache else None
+        response = await self._get_client().get(
+            url, headers=HttpCache.conditional_headers(entry), extensions={'trace': self._trace}
+        )
+        self.stats.requests += 1
+
+        if response.status_code == 304 and entry is not None:
+            self.stats.not_modified += 1
+            self.stats.bytes_saved += len(entry.body)
+            return httpx.Response(
+                200,
+                content=entry.body,
+                headers={'Content-Type': entry.content_type},
+                request=response.request,
+                extensions={'not_modified': True},
+            )
+        if self.cache:
+            await asyncio.to_thread(self.cache.store, url, response)
+        return response
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self.cache is not None:
+            await asyncio.to_thread(self.cache.close)
+
+    async def _trace(self, event_name: str, info: Dict):
+        if event_name == 'connection.connect_tcp.complete':
+            self.stats.connections_opened += 1
+        elif event_name == 'connection.start_tls.complete':
+            self.stats.tls_handshakes += 1
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        options = dict(headers=self.headers, timeout=self.timeout, limits=self.limits, follow_redirects=True,
+                       transport=self.transport)
+        if self.http2:
+            try:
+                return httpx.AsyncClient(http2=True, **options)
+            except ImportError:
+                self.logger.warning("HTTP/2 requested but the h2 package is not installed, using HTTP/1.1")
+        return httpx.AsyncClient(**options)
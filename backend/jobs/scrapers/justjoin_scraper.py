@@ -1,10 +1,25 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from bs4 import BeautifulSoup
 
+from jobs.utils.salary_standardizer import PLN_RATES
 from .base_scraper import WebScraper
 
 
 class JustJoinScraper(WebScraper):
+    SKILL_LEVELS = {1: "Nice To Have", 2: "Junior", 3: "Regular", 4: "Advanced", 5: "Master"}
+    EXPERIENCE_LEVELS = {"junior": "Junior", "mid": "Mid", "senior": "Senior", "c_level": "Expert"}
+    OFFER_FACTS = {'name': 'div', 'attrs': {'class': 'MuiBox-root css-pretdm'}}
+    # Salary units other than the monthly default, written so parse_salary finds the period
+    SALARY_UNITS = {"hour": "/h", "day": "/day", "year": "/year"}
+    FIELD_SPEC = {
+        'company': [{'name': 'div', 'attrs': {'class': 'MuiBox-root css-yd5zxy'}}],
+        'location': [{'name': 'div', 'attrs': {'class': 'MuiBox-root css-yd5zxy'}}],
+        'operating_mode': [OFFER_FACTS],
+        'experience': [OFFER_FACTS],
+        'salary': [{'name': 'span', 'attrs': {'class': 'css-1pavfqb'}}],
+        'description': [{'name': 'div', 'attrs': {'class': 'MuiBox-root css-tbycqp'}}],
+        'skills': [{'name': 'div', 'attrs': {'class': 'MuiStack-root css-6r2fzw'}}],
+    }
     
     def __init__(self, request_limit: int):
         super().__init__(
@@ -14,6 +29,10 @@ class JustJoinScraper(WebScraper):
             request_limit=request_limit
         )
 
+    def get_request_headers(self) -> Dict[str, str]:
+        headers = super().get_request_headers()
+        headers['cookie'] = 'userCurrency=pln'
+        return headers
     
     def get_jobs_container_selector(self) -> Dict[str, Any]:
         return {
@@ -21,19 +40,14 @@ class JustJoinScraper(WebScraper):
             'attrs': {'id': 'up-offers-list'}
         }
         
-    def get_job_listings(self, html_pages: list[str]) -> Dict[str, Dict[str, str]]:
-        """Extracts basic job information (title, link) from the main listings page."""
-        page_listings = []
-        for html in html_pages:
-            soup = BeautifulSoup(html, 'html.parser')
-            containers = soup.find_all(**self.get_jobs_container_selector())
-            
-            if not containers:
-                containers = soup.find_all('div', attrs={'data-test-id' : 'virtuoso-item-list'})
-            page_listing = self._extract_listings_from_containers(containers)
-            page_listings.append(page_listing)
-            
-        return page_listings
+    def get_listing_parse_selectors(self) -> list[Dict]:
+        return [*super().get_listing_parse_selectors(), {'name': 'div', 'attrs': {'data-test-id': 'virtuoso-item-list'}}]
+
+    def extract_page_listings(self, soup: BeautifulSoup) -> Dict[str, Dict[str, str]]:
+        containers = soup.find_all(**self.get_jobs_container_selector())
+        if not containers:
+            containers = soup.find_all('div', attrs={'data-test-id' : 'virtuoso-item-list'})
+        return self._extract_listings_from_containers(containers)
     
     def _extract_listings_from_containers(self, containers) -> Dict[str, Dict[str, str]]:
         """Processes each container to extract job listings."""
@@ -68,6 +82,43 @@ class JustJoinScraper(WebScraper):
     def extract_job_link(self, job_listing: BeautifulSoup) -> str:
         return f"{self.base_url}{job_listing.a['href']}?targetCurrency=pln"
     
+    def get_embedded_json_script_id(self) -> Optional[str]:
+        return "__NEXT_DATA__"
+
+    def map_embedded_json(self, data: Any) -> Optional[Dict]:
+        offer = data["props"]["pageProps"]["offer"]
+        experience = self.EXPERIENCE_LEVELS.get(offer["experienceLevel"], offer["experienceLevel"].capitalize())
+        salary = next((salary for e in offer.get("employmentTypes", []) if (salary := self.map_salary(e))), "")
+
+        skills = {skill["name"]: self.SKILL_LEVELS.get(skill.get("level"), "Regular")
+                  for skill in offer.get("requiredSkills", [])}
+        skills.update({skill["name"]: self.SKILL_LEVELS[1] for skill in offer.get("niceToHaveSkills") or []})
+        return {
+            "company": offer["companyName"],
+            "location": offer.get("city", ""),
+            "operating_mode": offer["workplaceType"].capitalize(),
+            "experience": experience,
+            "salary": salary,
+            "description": self.html_to_text(offer.get("body", "")),
+            "skills": skills,
+        }
+
+    def map_salary(self, employment_type: Dict) -> str:
+        """
+        The salary of an employment type in PLN, as the DOM shows it with the
+        userCurrency=pln cookie, with its unit unless it is monthly. Uses the
+        board's PLN amounts, or converts the original ones when they are missing.
+        """
+        if not employment_type.get("from"):
+            return ""
+        low, high = employment_type.get("fromPln"), employment_type.get("toPln")
+        if low is None:
+            if (rate := PLN_RATES.get(employment_type["currency"].upper())) is None:
+                return ""
+            low, high = employment_type["from"] * rate, (employment_type.get("to") or 0) * rate
+        salary = self.format_salary_range(low, high, "PLN")
+        return f"{salary}{self.SALARY_UNITS.get(employment_type.get('unit'), '')}"
+
     def extract_company(self, soup: BeautifulSoup) -> str:
         div_elements = soup.find("div", {"class": "MuiBox-root css-yd5zxy"})
         return div_elements.h2.text.strip() if div_elements else ""
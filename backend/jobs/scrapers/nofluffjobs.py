@@ -1,8 +1,35 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from bs4 import BeautifulSoup
+import json
 from .base_scraper import WebScraper
 
 class NoFluffScraper(WebScraper):
+    # Angular escapes the transfer state so it can be inlined into the page
+    TRANSFER_STATE_ESCAPES = {'&q;': '"', '&s;': "'", '&l;': '<', '&g;': '>', '&a;': '&'}
+    LOCATION_PINS = [
+        {'name': 'span', 'attrs': {'data-cy': 'location_mobile_pin'}},
+        {'name': 'span', 'attrs': {'data-cy': 'location_pin'}},
+    ]
+    FIELD_SPEC = {
+        'company': [
+            {'name': 'p', 'attrs': {'class': 'd-flex align-items-center mb-0'}},
+            {'name': 'a', 'attrs': {'id': 'postingCompanyUrl'}},
+        ],
+        'location': LOCATION_PINS,
+        'operating_mode': [
+            {'name': 'div', 'attrs': {'data-cy': 'location_remote'}},
+            {'name': 'div', 'attrs': {'data-cy': 'location_mobile_remote'}},
+            *LOCATION_PINS,
+        ],
+        'experience': [{'attrs': {'id': 'posting-seniority'}}],
+        'salary': [{'name': 'div', 'attrs': {'class': 'salary'}}],
+        'description': [
+            {'name': 'section', 'attrs': {'data-cy-section': section_id}}
+            for section_id in ['JobOffer_Requirements', 'JobOffer_Project', 'JobOffer_DailyTasks']
+        ],
+        'skills': [{'name': 'div', 'attrs': {'id': 'posting-requirements'}}],
+    }
+
     def __init__(self, request_limit: int):
         super().__init__(
             base_url= "https://nofluffjobs.com",
@@ -31,6 +58,51 @@ class NoFluffScraper(WebScraper):
     def extract_job_link(self, job_listing: BeautifulSoup) -> str:
         return f"{self.base_url}{job_listing['href']}"
 
+    def get_embedded_json_script_id(self) -> Optional[str]:
+        return "serverApp-state"
+
+    def decode_embedded_json(self, raw: str) -> Any:
+        for escaped, char in self.TRANSFER_STATE_ESCAPES.items():
+            raw = raw.replace(escaped, char)
+        return json.loads(raw)
+
+    def map_embedded_json(self, data: Any) -> Optional[Dict]:
+        # The posting is one of the cached HTTP responses, stored as {"b": body, "s": status, ...}
+        responses = (entry.get("b", entry) for entry in data.values() if isinstance(entry, dict))
+        if not (posting := next((r for r in responses if isinstance(r, dict) and "requirements" in r), None)):
+            return None
+
+        location = posting["location"]
+        if location.get("fullyRemote"):
+            operating_mode = "Remote"
+        elif location.get("hybridDesc"):
+            operating_mode = "Hybrid"
+        else:
+            operating_mode = "Office"
+
+        salary = posting["essentials"]["originalSalary"]
+        salary_range = next(iter(salary["types"].values()))["range"]
+        experience = posting["basics"]["seniority"][0]
+
+        requirements = posting["requirements"]
+        skills = {skill["value"]: self.get_standardized_skill_level(experience) for skill in requirements["musts"]}
+        skills.update({skill["value"]: "nice to have" for skill in requirements.get("nices", [])})
+
+        description_parts = [
+            self.html_to_text(requirements.get("description", "")),
+            self.html_to_text(posting.get("details", {}).get("description", "")),
+            "\n".join(posting.get("specs", {}).get("dailyTasks", [])),
+        ]
+        return {
+            "company": posting["company"]["name"],
+            "location": next((place["city"] for place in location["places"] if place.get("city")), ""),
+            "operating_mode": operating_mode,
+            "experience": experience,
+            "salary": self.format_salary_range(*salary_range, salary["currency"]),
+            "description": "\n\n".join(part for part in description_parts if part),
+            "skills": skills,
+        }
+
     def extract_company(self, soup: BeautifulSoup) -> str:
         element = soup.find('p', {'class': 'd-flex align-items-center mb-0'})
         if not element:
@@ -78,11 +150,13 @@ class NoFluffScraper(WebScraper):
 
         
     def extract_experience_level(self, soup: BeautifulSoup) -> str:
-        span = soup.select_one('#posting-seniority span')
+        seniority = soup.find(attrs={'id': 'posting-seniority'})
+        span = seniority.find('span') if seniority else None
         return span.get_text(strip=True) if span else ""
 
     def extract_salary(self, soup: BeautifulSoup) -> str:
-        h4 = soup.select_one('div.salary > h4.tw-mb-0')
+        salary = soup.find('div', {'class': 'salary'})
+        h4 = salary.find('h4', {'class': 'tw-mb-0'}, recursive=False) if salary else None
         if h4:
             return h4.text.strip().replace('–', '-')
         else:
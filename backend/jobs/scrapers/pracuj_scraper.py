@@ -3,6 +3,19 @@ from bs4 import BeautifulSoup
 from .base_scraper import WebScraper
 
 class PracujScraper(WebScraper):
+    FIELD_SPEC = {
+        'company': [{'name': 'h2', 'attrs': {'data-test': 'text-employerName'}}],
+        'location': [{'name': 'li', 'attrs': {'data-test': 'sections-benefit-workplaces'}}],
+        'operating_mode': [{'name': 'li', 'attrs': {'data-scroll-id': 'work-modes'}}],
+        'experience': [{'name': 'li', 'attrs': {'data-scroll-id': 'position-levels'}}],
+        'salary': [{'name': 'div', 'attrs': {'data-test': 'text-earningAmount'}}],
+        'description': [
+            {'name': 'section', 'attrs': {'data-test': 'section-about-project'}},
+            {'name': 'li', 'attrs': {'class': 'tkzmjn3'}},
+        ],
+        'skills': [{'name': 'section', 'attrs': {'data-test': 'section-technologies'}}],
+    }
+
     def __init__(self, request_limit: int):
         super().__init__(
             base_url="https://it.pracuj.pl/praca",
@@ -6,6 +6,19 @@ import inspect
 
 
 class TheProtocolScraper(WebScraper):
+    FIELD_SPEC = {
+        'company': [{'name': 'h2', 'attrs': {'data-test': 'text-offerEmployer'}}],
+        'location': [{'name': 'div', 'attrs': {'data-test': 'text-workplaceAddress'}}],
+        'operating_mode': [{'name': 'div', 'attrs': {'data-test': 'section-workModes'}}],
+        'experience': [{'name': 'div', 'attrs': {'data-test': 'section-positionLevels'}}],
+        'salary': [{'name': 'p', 'attrs': {'data-test': 'text-contractSalary'}}],
+        'description': [
+            {'name': 'div', 'attrs': {'id': 'TECHNOLOGY_AND_POSITION'}},
+            {'name': 'div', 'attrs': {'id': 'ABOUT_US'}},
+        ],
+        'skills': [{'name': 'div', 'attrs': {'data-test': 'section-technologies'}}],
+    }
+
     def __init__(self, request_limit: int):
         super().__init__(
             base_url= "https://theprotocol.it",
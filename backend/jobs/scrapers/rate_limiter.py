@@ -0,0 +1,200 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import ClassVar, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class CircuitOpenError(Exception):
+    """Raised when requests to a domain are suspended by its circuit breaker."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket with additive-increase / multiplicative-decrease rate.
+
+    `reserve` hands out tokens on credit, so concurrent callers each get their
+    own slot instead of racing for the same refill. The rate creeps up while
+    requests succeed and is halved whenever the server throttles us, which
+    converges on the fastest rate a board tolerates without manual tuning.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1, min_rate: Optional[float] = None,
+                 max_rate: Optional[float] = None, increase_step: float = 0.05):
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate or rate
+        self.max_rate = max_rate or rate
+        self.increase_step = increase_step
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1) -> float:
+        """Takes `amount` tokens and returns how many seconds the caller must wait before using them."""
+        with self._lock:
+            self._refill()
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def acquire(self, amount: float = 1):
+        """Blocking variant of `reserve` for synchronous callers."""
+        if wait := self.reserve(amount):
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Stops handing out tokens for `seconds` (used for Retry-After)."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_throttle(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a failing domain.
+
+    After `failure_threshold` consecutive failures the circuit opens and every
+    request is refused for `reset_timeout` seconds. Then a single trial
+    request is let through: success closes the circuit, failure re-opens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 300):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return self.state == self.CLOSED
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, honoring Retry-After when the server sends one."""
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 60.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, status_code: int) -> bool:
+        return status_code in self.RETRY_STATUSES
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parses a Retry-After header given either in seconds or as an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class DomainLimiter:
+    """Token bucket and circuit breaker for a single domain."""
+
+    def __init__(self, domain: str, bucket: TokenBucket, breaker: CircuitBreaker):
+        self.domain = domain
+        self.bucket = bucket
+        self.breaker = breaker
+
+
+class RateLimiter:
+    """
+    Registry of per-domain limiters shared by every request going through it.
+
+    `shared` returns one registry per configuration for the whole process, so
+    every fetcher of a worker process, e.g. the chunk tasks of a board, draws
+    from the same token bucket and trips the same circuit breaker per domain.
+    """
+
+    registries: ClassVar[Dict[Tuple, "RateLimiter"]] = {}
+    _registries_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, rate: float = 0.5, burst: float = 2, min_rate: float = 0.1, max_rate: float = 2.0,
+                 failure_threshold: int = 5, reset_timeout: float = 300):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._domains: Dict[str, DomainLimiter] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, **config) -> "RateLimiter":
+        """The process-wide registry for `config`, created on first use."""
+        key = tuple(sorted(config.items()))
+        with cls._registries_lock:
+            if key not in cls.registries:
+                cls.registries[key] = cls(**config)
+            return cls.registries[key]
+
+    def for_url(self, url: str) -> DomainLimiter:
+        domain = self.get_domain(url)
+        with self._lock:
+            if domain not in self._domains:
+                self._domains[domain] = DomainLimiter(
+                    domain,
+                    TokenBucket(self.rate, self.burst, self.min_rate, self.max_rate),
+                    CircuitBreaker(self.failure_threshold, self.reset_timeout),
+                )
+            return self._domains[domain]
+
+    @staticmethod
+    def get_domain(url: str) -> str:
+        """Groups subdomains of a board together (it.pracuj.pl and www.pracuj.pl share a limit)."""
+        hostname = urlsplit(url).hostname or ''
+        if hostname.replace('.', '').isdigit():
+            return hostname
+        return '.'.join(hostname.split('.')[-2:])
@@ -0,0 +1,12 @@
+from .justjoin_scraper import JustJoinScraper
+from .nofluffjobs import NoFluffScraper
+from .pracuj_scraper import PracujScraper
+from .protocol_scraper import TheProtocolScraper
+
+# Scrapers by the name used on the command line and in the recordings directory
+SCRAPERS = {
+    'jjit': JustJoinScraper,
+    'nofluff': NoFluffScraper,
+    'pracuj': PracujScraper,
+    'protocol': TheProtocolScraper
+}
@@ -0,0 +1,39 @@
+import json
+import os
+
+import httpx
+
+RECORDINGS_DIR = os.path.join(os.path.dirname(__file__), 'recordings')
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serves recorded pages instead of going to the network.
+
+    Each scraper has a directory under `recordings/` with the HTML files and a
+    `manifest.json` mapping request URLs to them. Unknown URLs get a 404.
+    """
+
+    def __init__(self, scraper_name: str, recordings_dir: str = RECORDINGS_DIR):
+        self.directory = os.path.join(recordings_dir, scraper_name)
+        with open(os.path.join(self.directory, 'manifest.json')) as f:
+            self.manifest = json.load(f)
+        self.requested = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        self.requested.append(url)
+        if (filename := self.manifest.get(url)) is None:
+            return httpx.Response(404, request=request)
+        with open(os.path.join(self.directory, filename), 'rb') as f:
+            return httpx.Response(200, content=f.read(), headers={'Content-Type': 'text/html; charset=utf-8'},
+                                  request=request)
+
+    def pages(self, kind: str = 'detail') -> list[str]:
+        """Returns the HTML of the recorded `listing` or `detail` pages."""
+        pages = []
+        for filename in sorted(set(self.manifest.values())):
+            if filename.startswith(kind):
+                with open(os.path.join(self.directory, filename), encoding='utf-8') as f:
+                    pages.append(f.read())
+        return pages
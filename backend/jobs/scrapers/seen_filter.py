@@ -0,0 +1,153 @@
+import hashlib
+import logging
+import math
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django_redis import get_redis_connection
+
+
+@dataclass
+class SeenFilterStats:
+    """Size and accuracy of a `SeenUrlFilter`, shared by every worker using it."""
+    size_bits: int
+    hash_count: int
+    bits_set: int
+    memory_bytes: int
+    lookups: int = 0
+    positives: int = 0
+    false_positives: int = 0
+
+    @property
+    def fill_ratio(self) -> float:
+        return self.bits_set / self.size_bits
+
+    @property
+    def estimated_items(self) -> int:
+        if self.bits_set >= self.size_bits:
+            return 0
+        return round(-self.size_bits / self.hash_count * math.log(1 - self.fill_ratio))
+
+    @property
+    def estimated_fp_rate(self) -> float:
+        """False-positive rate the filter's current fill implies."""
+        return self.fill_ratio ** self.hash_count
+
+    @property
+    def observed_fp_rate(self) -> float:
+        """Share of URLs not in the database that the filter still reported as seen."""
+        negatives = self.lookups - (self.positives - self.false_positives)
+        return self.false_positives / negatives if negatives else 0.0
+
+    def __str__(self) -> str:
+        return (f"~{self.estimated_items} URLs in {self.memory_bytes / 1024:.0f} KiB, "
+                f"fill {self.fill_ratio:.2%}, estimated FP rate {self.estimated_fp_rate:.4%}, "
+                f"{self.lookups} lookups, {self.positives} positive, "
+                f"{self.false_positives} false positives (observed FP rate {self.observed_fp_rate:.4%})")
+
+
+class SeenUrlFilter:
+    """
+    Bloom filter of canonical job URLs in a Redis bitmap, shared by every
+    scraper worker.
+
+    Scrapers look the listings of a page up here before checking the
+    database, and only the positives go to the database for an exact answer:
+    a negative is certain as long as every inserted URL was added. The filter
+    is only used once `seed_seen_filter` has filled it from Job and Requested
+    and marked it ready; until then, or when Redis is unavailable, lookups
+    return None and every URL is checked in the database.
+    """
+
+    def __init__(self, client, key: str = 'scraper:seen_urls', capacity: int = 1_000_000,
+                 error_rate: float = 0.001):
+        self.client = client
+        self.key = key
+        self.stats_key = f"{key}:stats"
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.logger = logging.getLogger('scraper.seen_filter')
+
+    @classmethod
+    def from_settings(cls) -> Optional["SeenUrlFilter"]:
+        """The filter configured in SCRAPER_SEEN_FILTER, or None when disabled or the cache is not Redis."""
+        if not (config := settings.SCRAPER_SEEN_FILTER):
+            return None
+        try:
+            return cls(get_redis_connection('default'), **config)
+        except NotImplementedError:
+            return None
+
+    def positions(self, url: str) -> list[int]:
+        """Bit positions of a URL, from two 64-bit halves of one hash (Kirsch-Mitzenmacher double hashing)."""
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add_many(self, urls: Iterable[str]):
+        """Sets the bits of every URL in one round trip."""
+        pipe = self.client.pipeline(transaction=False)
+        for url in urls:
+            for position in self.positions(url):
+                pipe.setbit(self.key, position, 1)
+        try:
+            pipe.execute()
+        except Exception as e:
+            self.logger.error(f"Error adding URLs to the seen filter: {e}")
+
+    def contains_many(self, urls: list[str]) -> Optional[list[bool]]:
+        """
+        Whether each URL may have been seen, in one round trip. None when the
+        filter is not seeded yet or Redis fails: every URL needs the database.
+        """
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hget(self.stats_key, 'ready')
+        for url in urls:
+            for position in self.positions(url):
+                pipe.getbit(self.key, position)
+        try:
+            ready, *bits = pipe.execute()
+        except Exception as e:
+            self.logger.error(f"Error reading the seen filter, checking the database instead: {e}")
+            return None
+        if not ready:
+            return None
+
+        k = self.hash_count
+        return [all(bits[i * k:(i + 1) * k]) for i in range(len(urls))]
+
+    def record_lookups(self, lookups: int, positives: int, false_positives: int):
+        """Counts lookups and the positives the database did not confirm, for the observed FP rate."""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hincrby(self.stats_key, 'lookups', lookups)
+        pipe.hincrby(self.stats_key, 'positives', positives)
+        pipe.hincrby(self.stats_key, 'false_positives', false_positives)
+        try:
+            pipe.execute()
+        except Exception as e:
+            self.logger.error(f"Error recording seen filter metrics: {e}")
+
+    def mark_ready(self):
+        self.client.hset(self.stats_key, 'ready', 1)
+
+    def reset(self):
+        """Drops the bitmap and its counters. Lookups fall back to the database until the next seed."""
+        self.client.delete(self.key, self.stats_key)
+
+    def stats(self) -> SeenFilterStats:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.bitcount(self.key)
+        pipe.strlen(self.key)
+        pipe.hgetall(self.stats_key)
+        bits_set, memory_bytes, counters = pipe.execute()
+        counters = {(k.decode() if isinstance(k, bytes) else k): int(v) for k, v in counters.items()}
+        return SeenFilterStats(
+            size_bits=self.size,
+            hash_count=self.hash_count,
+            bits_set=bits_set,
+            memory_bytes=memory_bytes,
+            lookups=counters.get('lookups', 0),
+            positives=counters.get('positives', 0),
+            false_positives=counters.get('false_positives', 0),
+        )
@@ -1,17 +1,27 @@
-from openai import OpenAI
+import asyncio
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Optional, Tuple, Union
+
+from openai import AsyncOpenAI, OpenAI
 from django.conf import settings
 
-# Use the API key
-api_key = settings.OPENAI_API_KEY
+from jobs.scrapers.rate_limiter import CircuitBreaker, CircuitOpenError, TokenBucket
+
+try:
+    import tiktoken
+except ImportError:  # optional, token counts are estimated from the text length without it
+    tiktoken = None
 
-client = OpenAI()
+MODEL = "gpt-4o-mini"
+# Bump whenever SYSTEM_PROMPT or the request parameters change, cached summaries of older versions are not reused
+PROMPT_VERSION = 2
 
-def summarize_text(text: str) -> str:
-    try:
-        completion = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": """
+SYSTEM_PROMPT = """
                     Create concise job summaries (max 250 words) with the following structure:
 
                     1. A brief overview paragraph (<p>) explaining core responsibilities (2-3 sentences).
@@ -48,17 +58,200 @@ def summarize_text(text: str) -> str:
                         - "Senior Java Developer wanted. Szukamy do naszego zespołu."
                         → Response in English (more English words)
                     """
-                },
-                {
-                    "role": "user",
-                    "content": text
-                }
+
+
+@dataclass
+class SummaryResult:
+    summary: str
+    tokens: int
+    latency_ms: int
+
+
+class Summarizer(ABC):
+    """
+    A summarizer backend: turns job descriptions into the HTML summaries of
+    SYSTEM_PROMPT (an overview paragraph, then the necessary and
+    nice-to-have skills).
+    """
+
+    name = ''
+
+    @abstractmethod
+    def summarize_many(self, texts: list[str],
+                       skills: Optional[list[Dict[str, str]]] = None) -> list[Union[SummaryResult, Exception]]:
+        """
+        Summaries in the order of `texts`, `skills` being the parsed skills
+        dict of each job when known. A failed text gives its exception
+        instead of failing the rest.
+        """
+
+
+class TokenCounter:
+    """Counts tokens with the model's tiktoken encoding, or estimates them from the length when it is unavailable."""
+
+    CHARS_PER_TOKEN = 4
+
+    def __init__(self, model: str = MODEL):
+        self.encoding = None
+        if tiktoken is not None:
+            try:
+                self.encoding = tiktoken.encoding_for_model(model)
+            except Exception as e:  # unknown model, or the encoding could not be downloaded
+                logging.getLogger('scraper.summarizer').warning(f"No tiktoken encoding for {model}, estimating: {e}")
+
+    def count(self, text: str) -> int:
+        if self.encoding is not None:
+            return len(self.encoding.encode(text))
+        return -(-len(text) // self.CHARS_PER_TOKEN)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if self.encoding is not None:
+            tokens = self.encoding.encode(text)
+            return text if len(tokens) <= max_tokens else self.encoding.decode(tokens[:max_tokens])
+        return text[:max_tokens * self.CHARS_PER_TOKEN]
+
+
+class SummaryEngine(Summarizer):
+    """
+    Summarizes job descriptions with OpenAI, with bounded concurrency and a
+    token budget.
+
+    Requests go out concurrently through AsyncOpenAI, at most `concurrency`
+    at a time, and each one first reserves its prompt plus `max_output_tokens`
+    from a tokens-per-minute bucket. Every engine of the process with the same
+    `tokens_per_minute` draws from the same bucket, so back-to-back tasks do
+    not each start with a fresh minute of budget. Descriptions longer than
+    `max_input_tokens` are truncated up front, the requirements that matter
+    for the summary come first in postings. Backfills can go through the
+    provider's Batch API instead (`submit_batch` / `collect_batch`), which is
+    cheaper and has its own limits. OPENAI_BASE_URL points the engine at
+    another endpoint, e.g. a local mock server.
+
+    Failures and timeouts feed a circuit breaker shared by every engine of the
+    process: once it opens, requests fail right away with CircuitOpenError
+    until `reset_timeout` has passed and a trial request succeeds.
+    """
+
+    name = 'openai'
+    breaker: ClassVar[Optional[CircuitBreaker]] = None
+    budgets: ClassVar[Dict[int, TokenBucket]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, concurrency: Optional[int] = None, tokens_per_minute: Optional[int] = None,
+                 max_input_tokens: Optional[int] = None, max_output_tokens: Optional[int] = None,
+                 base_url: Optional[str] = None):
+        config = settings.SUMMARY_ENGINE
+        self.concurrency = concurrency or config['concurrency']
+        self.tokens_per_minute = tokens_per_minute or config['tokens_per_minute']
+        self.max_input_tokens = max_input_tokens or config['max_input_tokens']
+        self.max_output_tokens = max_output_tokens or config['max_output_tokens']
+        self.base_url = base_url or settings.OPENAI_BASE_URL
+        self.timeout = config['timeout']
+        self.max_retries = config['max_retries']
+        with SummaryEngine._lock:
+            if SummaryEngine.breaker is None:
+                SummaryEngine.breaker = CircuitBreaker(config['failure_threshold'], config['reset_timeout'])
+            if self.tokens_per_minute not in SummaryEngine.budgets:
+                SummaryEngine.budgets[self.tokens_per_minute] = TokenBucket(rate=self.tokens_per_minute / 60,
+                                                                            capacity=self.tokens_per_minute)
+        self.budget = SummaryEngine.budgets[self.tokens_per_minute]
+        self.counter = TokenCounter(MODEL)
+        self.system_tokens = self.counter.count(SYSTEM_PROMPT)
+        self.logger = logging.getLogger('scraper.summarizer')
+
+    def prepare(self, text: str) -> Tuple[str, int]:
+        """The description cut to `max_input_tokens`, and the tokens the request may use in total."""
+        if (tokens := self.counter.count(text)) > self.max_input_tokens:
+            self.logger.info(f"Truncating a description of {tokens} tokens to {self.max_input_tokens}")
+            text = self.counter.truncate(text, self.max_input_tokens)
+            tokens = self.max_input_tokens
+        return text, self.system_tokens + tokens + self.max_output_tokens
+
+    def request_body(self, text: str) -> Dict:
+        return {
+            "model": MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": text},
             ],
-            max_tokens=2000, 
-            temperature=0.7,
+            "max_tokens": self.max_output_tokens,
+            "temperature": 0.7,
+        }
+
+    def summarize_many(self, texts: list[str],
+                       skills: Optional[list[Dict[str, str]]] = None) -> list[Union[SummaryResult, Exception]]:
+        if not texts:
+            return []
+        return asyncio.run(self._summarize_many(texts))
+
+    async def _summarize_many(self, texts: list[str]) -> list[Union[SummaryResult, Exception]]:
+        client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, base_url=self.base_url,
+                             timeout=self.timeout, max_retries=self.max_retries)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        try:
+            return await asyncio.gather(*(self._summarize(client, semaphore, text) for text in texts),
+                                        return_exceptions=True)
+        finally:
+            await client.close()
+
+    async def _summarize(self, client: AsyncOpenAI, semaphore: asyncio.Semaphore, text: str) -> SummaryResult:
+        text, budget = self.prepare(text)
+        async with semaphore:
+            if not self.breaker.allow():
+                raise CircuitOpenError("OpenAI requests are suspended after repeated failures")
+            if wait := self.budget.reserve(budget):
+                await asyncio.sleep(wait)
+            start = time.perf_counter()
+            try:
+                completion = await client.chat.completions.create(**self.request_body(text))
+            except Exception:
+                self.breaker.record_failure()
+                raise
+            self.breaker.record_success()
+        return SummaryResult(
+            summary=completion.choices[0].message.content,
+            tokens=completion.usage.total_tokens if completion.usage else budget,
+            latency_ms=round((time.perf_counter() - start) * 1000),
         )
-        summary = completion.choices[0].message.content
-        return summary
-    except Exception as e:
-        print(f"Error summarizing text: {e}")
-        return "Summary could not be generated"
\ No newline at end of file
+
+    # Batch API
+    # --------------------------------------------------
+    def submit_batch(self, texts: Dict[str, str]) -> str:
+        """Uploads one chat completion request per text, keyed by custom id, and returns the batch id."""
+        lines = []
+        for custom_id, text in texts.items():
+            text, _ = self.prepare(text)
+            lines.append(json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions",
+                                     "body": self.request_body(text)}))
+        client = self._client()
+        batch_file = client.files.create(file=("summaries.jsonl", "\n".join(lines).encode('utf-8')), purpose="batch")
+        batch = client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions",
+                                      completion_window="24h")
+        return batch.id
+
+    def collect_batch(self, batch_id: str) -> Tuple[str, Dict[str, SummaryResult]]:
+        """The status of a batch and, once it is completed, the summaries of its successful requests by custom id."""
+        client = self._client()
+        batch = client.batches.retrieve(batch_id)
+        if batch.status != "completed" or not batch.output_file_id:
+            return batch.status, {}
+
+        results = {}
+        for line in client.files.content(batch.output_file_id).text.splitlines():
+            row = json.loads(line)
+            response = row.get("response") or {}
+            if response.get("status_code") != 200:
+                self.logger.error(f"Batch request {row.get('custom_id')} failed: {row.get('error') or response}")
+                continue
+            body = response["body"]
+            results[row["custom_id"]] = SummaryResult(
+                summary=body["choices"][0]["message"]["content"],
+                tokens=body.get("usage", {}).get("total_tokens", 0),
+                latency_ms=0,
+            )
+        return batch.status, results
+
+    def _client(self) -> OpenAI:
+        return OpenAI(api_key=settings.OPENAI_API_KEY, base_url=self.base_url,
+                      timeout=self.timeout, max_retries=self.max_retries)
+
@@ -0,0 +1,194 @@
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+
+from jobs.extractive_summarizer import ExtractiveSummarizer
+from jobs.models import Job, SummaryCache
+from jobs.summarizer import MODEL, PROMPT_VERSION, SummaryEngine, SummaryResult
+
+# (summary, tokens, latency_ms) as kept in the hot tier
+CachedSummary = Tuple[str, int, int]
+
+
+def description_hash(description: str) -> str:
+    """Hash of a description with whitespace and case normalized, for the current model and prompt version."""
+    normalized = ' '.join(description.split()).casefold()
+    return hashlib.sha256(f"{MODEL}:{PROMPT_VERSION}:{normalized}".encode('utf-8')).hexdigest()
+
+
+@dataclass
+class SummaryCacheStats:
+    """Hits and misses of a `CachedSummarizer`, and what the hits saved."""
+    hits: int = 0
+    misses: int = 0
+    tokens_saved: int = 0
+    latency_saved_ms: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.hits} hits, {self.misses} misses ({self.hit_ratio:.0%} hit ratio), "
+                f"{self.tokens_saved} tokens and {self.latency_saved_ms / 1000:.1f}s saved")
+
+
+class CachedSummarizer:
+    """
+    Summaries shared between identical descriptions.
+
+    Reposted offers and the same posting on several boards share their
+    description, so a summary is looked up by `description_hash` before
+    asking the model: first in the Redis hot tier, then in the SummaryCache
+    table, which also keeps the tokens and latency every hit saves. Bumping
+    PROMPT_VERSION changes every hash, so older summaries are not reused.
+    """
+
+    KEY_PREFIX = 'summary:'
+
+    def __init__(self, engine: Optional[SummaryEngine] = None):
+        self.engine = engine
+        self.stats = SummaryCacheStats()
+        self.logger = logging.getLogger('scraper.summary_cache')
+
+    def lookup(self, descriptions: Iterable[str]) -> Dict[str, str]:
+        """Cached summaries by description, from one hot tier round trip and at most one query."""
+        hashes = {description: description_hash(description) for description in descriptions}
+        found = self._get_hot(set(hashes.values()))
+        if missing := [h for h in set(hashes.values()) if h not in found]:
+            from_db = {h: (summary, tokens, latency_ms) for h, summary, tokens, latency_ms
+                       in SummaryCache.objects.filter(description_hash__in=missing)
+                       .values_list('description_hash', 'summary', 'tokens', 'latency_ms')}
+            self._set_hot(from_db)
+            found.update(from_db)
+        if found:
+            SummaryCache.objects.filter(description_hash__in=found).update(
+                hits=F('hits') + 1, last_hit_at=timezone.now()
+            )
+
+        summaries = {}
+        for description, h in hashes.items():
+            if h in found:
+                summaries[description], tokens, latency_ms = found[h]
+                self.stats.hits += 1
+                self.stats.tokens_saved += tokens
+                self.stats.latency_saved_ms += latency_ms
+            else:
+                self.stats.misses += 1
+        return summaries
+
+    def summarize_many(self, descriptions: Iterable[str]) -> Dict[str, Union[str, Exception]]:
+        """
+        Summaries by description: cached ones first, the rest generated
+        concurrently by the engine and cached. A failed request gives its
+        exception for that description.
+        """
+        descriptions = list(descriptions)
+        summaries: Dict[str, Union[str, Exception]] = dict(self.lookup(descriptions))
+        missing = list(dict.fromkeys(d for d in descriptions if d not in summaries))
+        if not missing:
+            return summaries
+
+        self.engine = self.engine or SummaryEngine()
+        for description, result in zip(missing, self.engine.summarize_many(missing)):
+            if isinstance(result, Exception):
+                summaries[description] = result
+                continue
+            self.store(description, result)
+            summaries[description] = result.summary
+        return summaries
+
+    def store(self, description: str, result: SummaryResult):
+        h = description_hash(description)
+        SummaryCache.objects.bulk_create([SummaryCache(
+            description_hash=h,
+            prompt_version=PROMPT_VERSION,
+            summary=result.summary,
+            tokens=result.tokens,
+            latency_ms=result.latency_ms,
+        )], ignore_conflicts=True)
+        self._set_hot({h: (result.summary, result.tokens, result.latency_ms)})
+
+    def _get_hot(self, hashes: Iterable[str]) -> Dict[str, CachedSummary]:
+        try:
+            cached = cache.get_many([self.KEY_PREFIX + h for h in hashes])
+        except Exception as e:
+            self.logger.error(f"Error reading cached summaries, using the database: {e}")
+            return {}
+        return {key[len(self.KEY_PREFIX):]: tuple(value) for key, value in cached.items()}
+
+    def _set_hot(self, entries: Dict[str, CachedSummary]):
+        if not entries:
+            return
+        try:
+            cache.set_many({self.KEY_PREFIX + h: entry for h, entry in entries.items()},
+                           timeout=settings.SUMMARY_CACHE_TTL)
+        except Exception as e:
+            self.logger.error(f"Error caching summaries: {e}")
+
+
+def summarize_jobs(jobs: list[Job], summarizer: CachedSummarizer) -> list[Job]:
+    """
+    Sets the summary and summary status of jobs waiting for one and returns
+    the jobs to save. Jobs OpenAI fails on get an extractive summary instead,
+    jobs that already have one keep it until OpenAI succeeds.
+    """
+    summaries = summarizer.summarize_many([job.description for job in jobs])
+    updated = []
+    failed = []
+    for job in jobs:
+        if not isinstance(summary := summaries[job.description], Exception):
+            job.summary = summary
+            job.summary_status = Job.SUMMARY_DONE
+            updated.append(job)
+        elif job.summary_status != Job.SUMMARY_EXTRACTIVE:
+            summarizer.logger.error(f"Error summarizing job {job.id}, using an extractive summary: {summary}")
+            failed.append(job)
+
+    for job, result in zip(failed, ExtractiveSummarizer().summarize_many([job.description for job in failed],
+                                                                          [job.skills for job in failed])):
+        if isinstance(result, Exception):
+            summarizer.logger.error(f"Error summarizing job {job.id} locally: {result}")
+            job.summary_status = Job.SUMMARY_FAILED
+        else:
+            job.summary = result.summary
+            job.summary_status = Job.SUMMARY_EXTRACTIVE
+        updated.append(job)
+    return updated
+
+
+def job_summary_key(job_id: int) -> str:
+    return f"job_summary:{job_id}"
+
+
+def request_summary(job_id: int) -> Job:
+    """
+    The job with its summary, or queued for one on the summaries queue if it
+    has none yet (SUMMARY_MODE 'lazy'), without waiting for it: the caller
+    answers 202 and the viewer polls. The LAZY -> PENDING update is
+    conditional, so concurrent viewers queue a job once, and pending jobs
+    (eager mode, or already requested) are left to the task that has them.
+    Finished summaries are cached per job, so later views skip the database.
+
+    Raises Job.DoesNotExist for an unknown job.
+    """
+    from jobs.tasks import enqueue_summaries
+
+    if (cached := cache.get(job_summary_key(job_id))) is not None:
+        return Job(id=job_id, summary=cached, summary_status=Job.SUMMARY_DONE)
+
+    job = Job.objects.only('id', 'description', 'summary', 'summary_status').get(id=job_id)
+    if job.summary_status == Job.SUMMARY_DONE:
+        cache.set(job_summary_key(job_id), job.summary or "", timeout=settings.SUMMARY_CACHE_TTL)
+    elif job.summary_status == Job.SUMMARY_LAZY and job.description:
+        if Job.objects.filter(id=job_id, summary_status=Job.SUMMARY_LAZY).update(summary_status=Job.SUMMARY_PENDING):
+            enqueue_summaries([job_id])
+        job.summary_status = Job.SUMMARY_PENDING
+    return job
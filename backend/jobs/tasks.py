@@ -1,21 +1,152 @@
-from django.core.management import call_command
-from celery import shared_task
-import time
+from celery import chord, group, shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from datetime import timedelta
+from jobs.models import Job
+from jobs.scrapers.registry import SCRAPERS
+from jobs.summary_cache import CachedSummarizer, summarize_jobs
+
+logger = get_task_logger(__name__)
+
+
+@shared_task
+def run_scrapers_task(request_limit=200):
+    """
+    Scrapes every job board as a fan-out of small tasks:
+
+    scrape_listings_task (one per board)
+        -> chord(scrape_jobs_task per SCRAPER_TASK_CHUNK_SIZE detail pages)
+            -> finish_scrape_task (one per board)
+
+    A failing chunk or board only loses its own unsaved pages, and the detail
+    pages can be spread over as many workers as are running.
+    """
+    result = group(scrape_listings_task.s(name, request_limit) for name in SCRAPERS).apply_async()
+    return result.id
+
 
 @shared_task
-def run_scrapers_task():
-    result = call_command("run_scrapers")
-    
-    ## Clear cache
-    time.sleep(300)
+def scrape_listings_task(scraper_name, request_limit=200):
+    """Fetches the listing pages of a board and fans out one task per chunk of job pages still to request."""
+    scraper = SCRAPERS[scraper_name](request_limit=request_limit)
+    with scraper.create_fetcher() as scraper.fetcher:
+        listing_pages = scraper.get_main_html()
+    to_fetch = scraper.select_jobs_to_fetch(scraper.get_job_listings(listing_pages))[:request_limit]
+    logger.info(f"{scraper_name}: {len(to_fetch)} job pages to fetch, {scraper.updated_count} refreshed")
+    if not to_fetch:
+        return 0
+
+    chunk_size = settings.SCRAPER_TASK_CHUNK_SIZE
+    chunks = [to_fetch[start:start + chunk_size] for start in range(0, len(to_fetch), chunk_size)]
+    chord(scrape_jobs_task.s(scraper_name, chunk) for chunk in chunks)(finish_scrape_task.s(scraper_name))
+    return len(to_fetch)
+
+
+@shared_task
+def scrape_jobs_task(scraper_name, jobs):
+    """
+    Fetches a chunk of job pages through one fetcher, so they share its
+    keep-alive connections, per-domain rate limit and circuit breaker. Jobs
+    are saved in batches as they are parsed and the cached API views dropped
+    after the chunk, so they show up while the rest of the board is still
+    being scraped. Only the number saved goes to the result backend, and a
+    failing chunk returns what it saved before the failure, so it never fails
+    the board's chord.
+    """
+    scraper = SCRAPERS[scraper_name](request_limit=len(jobs))
+    try:
+        saved_count = scraper.scrape_jobs(jobs)
+    except Exception as e:
+        logger.error(f"Error scraping {len(jobs)} {scraper_name} job pages: {e}", exc_info=True)
+        saved_count = scraper.saved_count
+    else:
+        logger.info(f"{scraper_name}: saved {saved_count} jobs from {scraper.request_count} of {len(jobs)} pages, "
+                    f"summary cache: {scraper.summarizer.stats}")
+    if saved_count:
+        clear_view_cache()
+    return saved_count
+
+
+@shared_task
+def finish_scrape_task(saved_counts, scraper_name):
+    """Chord callback: logs what the chunks of a board saved."""
+    saved_count = sum(saved_counts)
+    logger.info(f"{scraper_name}: saved {saved_count} jobs in {len(saved_counts)} tasks")
+    return saved_count
+
+
+def enqueue_summaries(job_ids):
+    """Queues pending jobs for summarization on the summaries queue, SUMMARY_BATCH_SIZE per task."""
+    batch_size = settings.SUMMARY_BATCH_SIZE
+    for start in range(0, len(job_ids), batch_size):
+        summarize_jobs_task.delay(job_ids[start:start + batch_size])
+
+
+@shared_task
+def summarize_jobs_task(job_ids):
+    """
+    Summarizes a batch of pending jobs and writes the summaries back with a
+    single UPDATE. The OpenAI requests run concurrently within the engine's
+    limits, no transaction is open meanwhile, and descriptions summarized
+    before are served from the summary cache.
+
+    Jobs OpenAI fails on get an extractive summary instead and are upgraded
+    later by upgrade_summaries_task. Extractive jobs passed again keep their
+    summary until OpenAI succeeds.
+    """
+    jobs = list(Job.objects.filter(id__in=job_ids, summary_status__in=[Job.SUMMARY_PENDING, Job.SUMMARY_EXTRACTIVE])
+                .only('id', 'description', 'skills', 'summary_status'))
+    summarizer = CachedSummarizer()
+    updated = summarize_jobs(jobs, summarizer)
+
+    if updated:
+        Job.objects.bulk_update(updated, ['summary', 'summary_status'])
+        clear_view_cache()
+    logger.info(f"Summarized {sum(job.summary_status == Job.SUMMARY_DONE for job in jobs)} of {len(jobs)} jobs, "
+                f"{sum(job.summary_status == Job.SUMMARY_EXTRACTIVE for job in updated)} extractive, "
+                f"summary cache: {summarizer.stats}")
+    return len(jobs)
+
+
+@shared_task
+def summarize_pending_jobs_task(older_than_minutes=15, limit=500):
+    """
+    Re-queues jobs left pending, e.g. after a lost task or a broker outage.
+    Meant to be scheduled in celery beat.
+    """
+    created_before = timezone.now() - timedelta(minutes=older_than_minutes)
+    job_ids = list(Job.objects.filter(summary_status=Job.SUMMARY_PENDING, created_at__lt=created_before)
+                   .order_by('created_at').values_list('id', flat=True)[:limit])
+    enqueue_summaries(job_ids)
+    return len(job_ids)
+
+
+@shared_task
+def upgrade_summaries_task(limit=200):
+    """
+    Re-queues jobs with an extractive summary for an OpenAI one, newest first.
+    Meant to be scheduled in celery beat. While OpenAI is still failing the
+    summaries worker's circuit breaker refuses them without a request, and
+    they keep their extractive summary until a later pass.
+    """
+    job_ids = list(Job.objects.filter(summary_status=Job.SUMMARY_EXTRACTIVE)
+                   .order_by('-created_at').values_list('id', flat=True)[:limit])
+    enqueue_summaries(job_ids)
+    return len(job_ids)
+
+
+@shared_task
+def compact_requested_task():
+    """Applies the Requested retention policy, meant to be scheduled daily in celery beat."""
+    call_command('compact_requested')
+
+
+def clear_view_cache():
     redis_client = cache.client.get_client()
     cache_keys = redis_client.keys('*views.decorators.cache*')
-    
+
     if cache_keys:
         redis_client.delete(*cache_keys)
-            
-    return result
-    
-    
-        
\ No newline at end of file
@@ -73,4 +73,1406 @@ class TestSalaryStandardizer(TestCase):
         for input_salary, expected in test_cases:
             with self.subTest(input_salary=input_salary):
                 result = standardize_salary(input_salary)
-                self.assertEqual(result, expected)
\ No newline at end of file
+                self.assertEqual(result, expected)
+
+import json
+import os
+import tempfile
+import time
+import re
+import socket
+import threading
+import httpx
+from bs4 import BeautifulSoup
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import wait
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from io import StringIO
+from django.db import IntegrityError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from datetime import timedelta
+from jobs.models import ApplicationNote, ArchivedPage, JobApplication, Requested
+from jobs.scrapers.archive import PageArchive
+from jobs.scrapers.base_scraper import WebScraper
+from jobs.scrapers.benchmark import ScraperBenchmark
+from jobs.scrapers.extraction import ExtractionPlan
+from jobs.scrapers.fetcher import FetchResult
+from jobs.scrapers.http_cache import HttpCache
+from jobs.scrapers.justjoin_scraper import JustJoinScraper
+from jobs.scrapers.nofluffjobs import NoFluffScraper
+from jobs.scrapers.pracuj_scraper import PracujScraper
+from jobs.scrapers.registry import SCRAPERS
+from jobs.scrapers.replay import ReplayTransport
+from jobs.scrapers.rate_limiter import CircuitBreaker, CircuitOpenError, RateLimiter, RetryPolicy, TokenBucket
+from jobs.scrapers.seen_filter import SeenUrlFilter
+from jobs.extractive_summarizer import ExtractiveSummarizer
+from jobs.summarizer import Summarizer, SummaryEngine, SummaryResult
+from jobs.summary_cache import CachedSummarizer, description_hash
+from jobs.models import SummaryCache
+from jobs.tasks import (run_scrapers_task, scrape_jobs_task, summarize_jobs_task, summarize_pending_jobs_task,
+                        upgrade_summaries_task)
+from jobs.utils.urls import canonicalize_url
+from jobs.utils.salary_standardizer import SalaryRange, parse_salary
+from jobs.utils.salary_normalizer import SalaryNormalizer
+from backend.celery import app as celery_app
+
+
+FAST_RATE_LIMIT = {'rate': 1000, 'burst': 1000, 'min_rate': 1000, 'max_rate': 1000,
+                   'failure_threshold': 3, 'reset_timeout': 300}
+FAST_RETRY = {'max_retries': 3, 'base_delay': 0, 'max_delay': 0}
+
+
+class StubJobBoardHandler(BaseHTTPRequestHandler):
+    """
+    Serves a tiny HTML page for every path.
+    /throttled answers 429 twice, /down always 503 and /etag revalidates with a 304.
+    """
+    protocol_version = "HTTP/1.1"
+    hits = {}
+
+    def do_GET(self):
+        hits = self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        status = 200
+        if self.path == "/throttled" and hits <= 2:
+            status = 429
+        elif self.path == "/down":
+            status = 503
+        elif self.path.startswith("/etag") and self.headers.get("If-None-Match") == '"v1"':
+            status = 304
+
+        body = f"<html><body><h1>{self.path}</h1></body></html>".encode() if status != 304 else b""
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        if self.path.startswith("/etag"):
+            self.send_header("ETag", '"v1"')
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@override_settings(SCRAPER_RATE_LIMIT=FAST_RATE_LIMIT, SCRAPER_RETRY=FAST_RETRY, SCRAPER_HTTP_CACHE=None,
+                   SCRAPER_ARCHIVE_DIR=None)
+@mock.patch.dict(RateLimiter.registries, clear=True)
+class TestConcurrentFetch(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubJobBoardHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def test_request_limit_and_bookkeeping(self):
+        """Concurrent fetching never exceeds the request limit and records every request"""
+        scraper = NoFluffScraper(request_limit=3)
+        listings = [{f"Job {i}": {"link": f"{self.base}/job-{i}"} for i in range(6)}]
+
+        with scraper.create_fetcher() as scraper.fetcher:
+            scraper.process_job_listings(listings)
+
+        self.assertEqual(scraper.request_count, 3)
+        self.assertEqual(Requested.objects.count(), 3)
+
+    def test_listing_pages_fetched_in_order(self):
+        scraper = NoFluffScraper(request_limit=3)
+        scraper.filter_urls = [f"{self.base}/python", f"{self.base}/javascript"]
+
+        with scraper.create_fetcher() as scraper.fetcher:
+            pages = scraper.get_main_html()
+
+        self.assertIn("/python", pages[0])
+        self.assertIn("/javascript", pages[1])
+
+    def test_session_reuses_connections(self):
+        scraper = NoFluffScraper(request_limit=3)
+
+        with scraper.create_fetcher() as fetcher:
+            for i in range(3):
+                fetcher.fetch(f"{self.base}/keep-alive-{i}")
+            stats = fetcher.session.stats
+
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.connections_opened, 1)
+        self.assertEqual(stats.connections_reused, 2)
+
+    def test_throttled_request_is_retried(self):
+        """A 429 with Retry-After is retried instead of losing the job"""
+        scraper = NoFluffScraper(request_limit=3)
+
+        with scraper.create_fetcher() as fetcher:
+            result = fetcher.fetch(f"{self.base}/throttled")
+
+        self.assertTrue(result.ok)
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(StubJobBoardHandler.hits["/throttled"], 3)
+
+    def test_circuit_breaker_stops_requests_to_failing_board(self):
+        scraper = NoFluffScraper(request_limit=3)
+
+        with scraper.create_fetcher() as fetcher:
+            first = fetcher.fetch(f"{self.base}/down")
+            second = fetcher.fetch(f"{self.base}/down")
+
+        self.assertFalse(first.ok)
+        self.assertIsInstance(second.error, CircuitOpenError)
+        self.assertEqual(StubJobBoardHandler.hits["/down"], 3)
+
+    def test_conditional_get_served_from_cache(self):
+        scraper = NoFluffScraper(request_limit=3)
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_settings = {'path': os.path.join(cache_dir, 'http_cache.sqlite3'), 'max_bytes': 1024 * 1024}
+            with override_settings(SCRAPER_HTTP_CACHE=cache_settings), scraper.create_fetcher() as fetcher:
+                first = fetcher.fetch(f"{self.base}/etag")
+                second = fetcher.fetch(f"{self.base}/etag")
+                stats = fetcher.session.stats
+
+        self.assertFalse(first.not_modified)
+        self.assertTrue(second.not_modified)
+        self.assertEqual(second.text, first.text)
+        self.assertEqual(stats.not_modified, 1)
+
+    def test_unchanged_page_skipped_only_once_saved(self):
+        scraper = NoFluffScraper(request_limit=10)
+        url = f"{self.base}/etag"
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_settings = {'path': os.path.join(cache_dir, 'http_cache.sqlite3'), 'max_bytes': 1024 * 1024}
+            with override_settings(SCRAPER_HTTP_CACHE=cache_settings), scraper.create_fetcher() as scraper.fetcher:
+                fetched = list(scraper._fetch_job_pages([("Etag Job", url)]))
+                # The job was never saved, e.g. its parse failed: the cached body is parsed again
+                not_saved = list(scraper._fetch_job_pages([("Etag Job", url)]))
+                Job.objects.create(title="Etag Job", experience="Mid", skills={}, url=url)
+                saved = list(scraper._fetch_job_pages([("Etag Job", url)]))
+
+        self.assertFalse(fetched[0].not_modified)
+        self.assertTrue(not_saved[0].not_modified)
+        self.assertEqual(not_saved[0].text, fetched[0].text)
+        self.assertEqual(saved, [])
+
+    def test_unchanged_pages_checked_in_one_query(self):
+        scraper = NoFluffScraper(request_limit=10)
+        jobs = [(f"Etag Job {i}", f"{self.base}/etag-{i}") for i in range(3)]
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache_settings = {'path': os.path.join(cache_dir, 'http_cache.sqlite3'), 'max_bytes': 1024 * 1024}
+            with override_settings(SCRAPER_HTTP_CACHE=cache_settings), scraper.create_fetcher() as scraper.fetcher:
+                list(scraper._fetch_job_pages(jobs))
+                for title, url in jobs:
+                    Job.objects.create(title=title, experience="Mid", skills={}, url=url)
+                # All three pages complete in one window
+                with mock.patch('jobs.scrapers.base_scraper.wait', side_effect=lambda fs, return_when: wait(fs)), \
+                        CaptureQueriesContext(connection) as queries:
+                    skipped = list(scraper._fetch_job_pages(jobs))
+
+        self.assertEqual(skipped, [])
+        self.assertEqual(len([q for q in queries if q['sql'].startswith('SELECT') and '"jobs_job"' in q['sql']]), 1)
+
+
+class TestHttpCache(TestCase):
+    def test_lru_eviction_keeps_cache_under_max_bytes(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = HttpCache(os.path.join(cache_dir, 'http_cache.sqlite3'), max_bytes=1500)
+            for i in range(3):
+                body = os.urandom(600)
+                cache.store(f"https://example.com/{i}", httpx.Response(200, content=body, headers={"ETag": str(i)}))
+                cache.get("https://example.com/0")
+
+            self.assertIsNotNone(cache.get("https://example.com/0"))
+            self.assertIsNone(cache.get("https://example.com/1"))
+            self.assertIsNotNone(cache.get("https://example.com/2"))
+            cache.close()
+
+
+NOFLUFF_DETAIL_HTML = """
+<html><body>
+<p class="d-flex align-items-center mb-0">Acme</p>
+<div id="posting-seniority"><span>Mid</span></div>
+<div class="salary"><h4 class="tw-mb-0">10 000 – 15 000 PLN</h4></div>
+<div id="posting-requirements">
+  <section branch="musts"><ul><li><span>Python</span></li></ul></section>
+  <section id="posting-nice-to-have"><ul><li><span>Docker</span></li></ul></section>
+</div>
+</body></html>
+"""
+
+
+class TestPageArchive(TestCase):
+    def test_identical_pages_share_one_blob(self):
+        with tempfile.TemporaryDirectory() as archive_dir:
+            archive = PageArchive(archive_dir)
+            first = archive.store("NoFluffScraper", "https://nofluffjobs.com/pl/job/a", NOFLUFF_DETAIL_HTML)
+            second = archive.store("NoFluffScraper", "https://nofluffjobs.com/pl/job/b", NOFLUFF_DETAIL_HTML)
+
+            self.assertEqual(first.content_hash, second.content_hash)
+            self.assertEqual(archive.load(first.content_hash), NOFLUFF_DETAIL_HTML)
+            blobs = [f for _, _, files in os.walk(archive_dir) for f in files]
+            self.assertEqual(len(blobs), 1)
+
+    @override_settings(SCRAPER_REQUESTED_FLUSH_SIZE=3)
+    def test_scraper_archives_pages_in_bulk(self):
+        with tempfile.TemporaryDirectory() as archive_dir, override_settings(SCRAPER_ARCHIVE_DIR=archive_dir):
+            scraper = NoFluffScraper(request_limit=0)
+            with CaptureQueriesContext(connection) as queries:
+                for i in range(4):
+                    result = FetchResult(url=f"https://nofluffjobs.com/pl/job/{i}", text=NOFLUFF_DETAIL_HTML)
+                    scraper._archive_page(result, ArchivedPage.DETAIL)
+                self.assertEqual(ArchivedPage.objects.count(), 3)
+                scraper.flush_archive()
+
+        inserts = [q for q in queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(ArchivedPage.objects.count(), 4)
+
+    def test_reparse_updates_jobs_without_network(self):
+        url = "https://nofluffjobs.com/pl/job/python-developer"
+        job = Job.objects.create(title="Python Developer", company="", experience="Mid", skills={}, url=url)
+
+        with tempfile.TemporaryDirectory() as archive_dir, override_settings(SCRAPER_ARCHIVE_DIR=archive_dir):
+            scraper = NoFluffScraper(request_limit=0)
+            scraper.archive.store("NoFluffScraper", url, NOFLUFF_DETAIL_HTML)
+            updated = scraper.reparse_archive()
+
+        job.refresh_from_db()
+        self.assertEqual(updated, 1)
+        self.assertEqual(job.company, "Acme")
+        self.assertEqual(job.salary, "10 000 - 15 000 PLN")
+        self.assertEqual(job.skills, {"Python": "regular", "Docker": "nice to have"})
+
+
+@override_settings(SCRAPER_RATE_LIMIT=FAST_RATE_LIMIT, SCRAPER_RETRY=FAST_RETRY, SCRAPER_HTTP_CACHE=None,
+                   SCRAPER_ARCHIVE_DIR=None)
+@mock.patch.dict(RateLimiter.registries, clear=True)
+class TestReplayScrapers(TestCase):
+    """Runs every scraper end to end against the recorded pages."""
+
+    def test_scrapers_create_jobs_from_recordings(self):
+        for name, scraper_class in SCRAPERS.items():
+            with self.subTest(scraper=name):
+                # The same postings are recorded on every board
+                Job.objects.all().delete()
+                scraper = scraper_class(request_limit=10)
+                scraper.transport = ReplayTransport(name)
+
+                created = scraper.run()
+
+                self.assertEqual(created, 5)
+                job = Job.objects.get(title="Python Developer")
+                self.assertEqual(job.company, "Acme")
+                self.assertEqual(job.salary, "12 000 - 18 000 PLN")
+                self.assertEqual(job.skills["Python"].lower(), "regular")
+                self.assertEqual(job.skills["Docker"].lower(), "nice to have")
+                self.assertTrue(job.description)
+
+    def test_benchmark_reports_every_stage(self):
+        result = ScraperBenchmark('nofluff', SCRAPERS['nofluff'], iterations=1).run()
+
+        self.assertEqual(set(result['stages']), set(ScraperBenchmark.STAGES))
+        self.assertEqual(result['stages']['detail']['pages'], 5)
+        self.assertEqual(result['stages']['listing']['pages'], 2)
+        self.assertGreater(result['stages']['save']['pages_per_second'], 0)
+        self.assertIn('skills', result['fields'])
+        self.assertEqual(result['extraction']['traversals_after'], 1)
+        self.assertGreater(result['extraction']['traversals_before'], 1)
+        self.assertEqual(Job.objects.count(), 0)
+
+
+@override_settings(SCRAPER_RATE_LIMIT=FAST_RATE_LIMIT, SCRAPER_RETRY=FAST_RETRY, SCRAPER_HTTP_CACHE=None,
+                   SCRAPER_ARCHIVE_DIR=None, SCRAPER_SAVE_BATCH_SIZE=2, SCRAPER_SAVE_MAX_DELAY=60)
+@mock.patch.dict(RateLimiter.registries, clear=True)
+class TestStreamingPipeline(TestCase):
+    def test_jobs_saved_in_batches_while_scraping(self):
+        scraper = NoFluffScraper(request_limit=10)
+        scraper.transport = ReplayTransport('nofluff')
+        saves = []
+        save_jobs = scraper.save_jobs
+
+        def record_save(batch):
+            saves.append((len(batch), scraper.request_count))
+            return save_jobs(batch)
+
+        with mock.patch.object(scraper, 'save_jobs', side_effect=record_save):
+            created = scraper.run()
+
+        self.assertEqual(created, 5)
+        # (jobs in the batch, pages requested so far): batches are saved before the last page is fetched
+        self.assertEqual(saves, [(2, 2), (2, 4), (1, 5)])
+        self.assertEqual(Job.objects.count(), 5)
+
+    def test_batch_flushed_after_max_delay(self):
+        scraper = NoFluffScraper(request_limit=0)
+        jobs = [(f"Job {i}", {"link": f"https://nofluffjobs.com/pl/job/{i}", "company": f"Company {i}"})
+                for i in range(3)]
+        with override_settings(SCRAPER_SAVE_BATCH_SIZE=10, SCRAPER_SAVE_MAX_DELAY=0), \
+                mock.patch.object(scraper, 'save_jobs', return_value=1) as save_jobs:
+            self.assertEqual(scraper.save_jobs_in_batches(jobs), 3)
+        self.assertEqual(save_jobs.call_count, 3)
+
+
+class TestCanonicalUrl(TestCase):
+    URL = "https://justjoin.it/job-offer/acme-python-developer"
+
+    def create_job(self, url, title="Python Developer"):
+        return Job.objects.create(title=title, experience="Mid", skills={}, url=url)
+
+    def test_canonicalize_url(self):
+        self.assertEqual(canonicalize_url(f"{self.URL}?targetCurrency=pln#apply"), self.URL)
+        self.assertEqual(canonicalize_url("HTTPS://JustJoin.it/job-offer/acme-python-developer/"), self.URL)
+        self.assertNotEqual(canonicalize_url(f"{self.URL}-senior"), self.URL)
+
+    def test_same_posting_saved_once(self):
+        self.assertEqual(self.create_job(f"{self.URL}?targetCurrency=pln").canonical_url, self.URL)
+        with self.assertRaises(IntegrityError):
+            self.create_job(self.URL)
+
+    def test_save_jobs_skips_posting_with_other_query_string(self):
+        self.create_job(f"{self.URL}?targetCurrency=pln")
+        scraper = JustJoinScraper(request_limit=1)
+        saved = scraper.save_jobs({"Renamed Developer": {"link": f"{self.URL}?targetCurrency=eur", "experience": "Mid",
+                                                         "skills": {}, "description": ""}})
+        self.assertEqual(saved, 0)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_backfill_fills_rows_and_resolves_duplicates(self):
+        # Rows saved before the column existed, bulk_create skips save()
+        now = timezone.now()
+        kept, duplicate = Job.objects.bulk_create([
+            Job(title="Python Developer", experience="Mid", skills={}, url=f"{self.URL}?targetCurrency=pln",
+                created_at=now),
+            Job(title="Python Developer (EUR)", experience="Mid", skills={}, url=f"{self.URL}?targetCurrency=eur",
+                created_at=now + timedelta(minutes=1)),
+        ])
+        Requested.objects.bulk_create([Requested(url=f"{self.URL}?a=1", title="old"),
+                                       Requested(url=f"{self.URL}?a=2", title="new")])
+        Requested.objects.filter(title="old").update(created_at=now - timedelta(days=1))
+        user = User.objects.create_user("applicant")
+        application = JobApplication.objects.create(user=user, job=duplicate)
+        ApplicationNote.objects.create(application=application, content="Called back")
+
+        out = StringIO()
+        call_command('backfill_canonical_urls', stdout=out)
+
+        self.assertEqual(list(Job.objects.values_list('id', 'canonical_url')), [(kept.pk, self.URL)])
+        self.assertEqual(JobApplication.objects.get().job_id, kept.pk)
+        self.assertEqual(ApplicationNote.objects.get().application_id, application.pk)
+        self.assertIn("Merged 1 duplicate Job rows into the earliest copy, 1 applications moved", out.getvalue())
+        self.assertEqual(list(Requested.objects.values_list('title', 'canonical_url')), [("new", self.URL)])
+
+        # Saving a backfilled row keeps its canonical_url
+        job = Job.objects.get(pk=kept.pk)
+        job.source = "JustJoinIt"
+        job.save()
+        self.assertEqual(Job.objects.get(pk=kept.pk).canonical_url, self.URL)
+
+
+class TestSaveJobsUpsert(TestCase):
+    BASE = "https://justjoin.it/job-offer"
+
+    def job_data(self, slug, company="Acme"):
+        return {"link": f"{self.BASE}/{slug}?targetCurrency=pln", "company": company, "experience": "Mid",
+                "skills": {"Python": "regular"}, "description": f"About {slug}", "salary": "10 000 - 12 000 PLN"}
+
+    @mock.patch('jobs.tasks.enqueue_summaries')
+    def test_batch_saved_in_one_select_one_upsert_and_one_update(self, enqueue_summaries):
+        old_date = timezone.now() - timedelta(days=3)
+        same_url = Job.objects.create(title="Old Title", experience="Mid", skills={}, url=f"{self.BASE}/same-url")
+        reposted = Job.objects.create(title="Reposted", company="Acme", experience="Mid", skills={},
+                                      url=f"{self.BASE}/reposted-old")
+        Job.objects.update(scraped_date=old_date)
+
+        scraper = JustJoinScraper(request_limit=1)
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            saved = scraper.save_jobs({
+                "New One": self.job_data("new-one"),
+                "New Two": {**self.job_data("new-two", company=None), "description": ""},
+                "Same Url": self.job_data("same-url"),
+                "Reposted": self.job_data("reposted-new"),
+                "Unknown Board": {**self.job_data("x"), "link": "https://example.com/x"},
+            })
+
+        statements = [q['sql'].split()[0] for q in queries if 'SAVEPOINT' not in q['sql']]
+        # jobs, summary cache, upsert, inserted ids, refresh
+        self.assertEqual(statements, ["SELECT", "SELECT", "INSERT", "SELECT", "UPDATE"])
+        self.assertEqual(saved, 2)
+        new_one = Job.objects.get(title="New One")
+        self.assertEqual((new_one.source, new_one.salary, new_one.summary_status),
+                         ("JustJoinIt", "10 000 - 12 000 PLN", Job.SUMMARY_PENDING))
+        self.assertEqual(Job.objects.get(title="New Two").summary_status, Job.SUMMARY_DONE)  # nothing to summarize
+        enqueue_summaries.assert_called_once_with([new_one.pk])
+        for job in (same_url, reposted):
+            job.refresh_from_db()
+            self.assertGreater(job.scraped_date, old_date)
+        self.assertFalse(Job.objects.filter(title="Unknown Board").exists())
+
+    @mock.patch('jobs.tasks.enqueue_summaries')
+    def test_concurrent_insert_only_refreshes_date(self, enqueue_summaries):
+        scraper = JustJoinScraper(request_limit=1)
+        # Another worker saves the posting between the existence check and the insert
+        with mock.patch.object(scraper, '_split_existing_jobs', side_effect=lambda jobs: (jobs, [])), \
+                self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(scraper.save_jobs({"Python Developer": self.job_data("python")}), 1)
+            self.assertEqual(scraper.save_jobs({"Python Developer (copy)": self.job_data("python")}), 0)
+        self.assertEqual(list(Job.objects.values_list('title', flat=True)), ["Python Developer"])
+        enqueue_summaries.assert_called_once_with([Job.objects.get().pk])
+
+
+class FakeRedis:
+    """The Redis bitmap and hash commands used by SeenUrlFilter, in memory."""
+
+    def __init__(self):
+        self.bitmaps, self.hashes = {}, {}
+
+    def pipeline(self, transaction=True):
+        return FakeRedisPipeline(self)
+
+    def setbit(self, key, offset, value):
+        bits = self.bitmaps.setdefault(key, set())
+        old = int(offset in bits)
+        (bits.add if value else bits.discard)(offset)
+        return old
+
+    def getbit(self, key, offset):
+        return int(offset in self.bitmaps.get(key, ()))
+
+    def bitcount(self, key):
+        return len(self.bitmaps.get(key, ()))
+
+    def strlen(self, key):
+        return max(self.bitmaps.get(key, {-1})) // 8 + 1
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = str(value).encode()
+
+    def hincrby(self, key, field, amount):
+        fields = self.hashes.setdefault(key, {})
+        fields[field] = str(int(fields.get(field, 0)) + amount).encode()
+
+    def hgetall(self, key):
+        return {field.encode(): value for field, value in self.hashes.get(key, {}).items()}
+
+    def delete(self, *keys):
+        for key in keys:
+            self.bitmaps.pop(key, None)
+            self.hashes.pop(key, None)
+
+
+class FakeRedisPipeline:
+    def __init__(self, client):
+        self.client, self.calls = client, []
+
+    def __getattr__(self, command):
+        return lambda *args: self.calls.append((command, args))
+
+    def execute(self):
+        return [getattr(self.client, command)(*args) for command, args in self.calls]
+
+
+class TestSeenUrlFilter(TestCase):
+    BASE = "https://nofluffjobs.com/pl/job"
+
+    def setUp(self):
+        self.seen_filter = SeenUrlFilter(FakeRedis(), capacity=2000, error_rate=0.01)
+
+    def test_false_positive_rate_and_memory(self):
+        self.assertIsNone(self.seen_filter.contains_many([f"{self.BASE}/a"]))  # not seeded yet
+        added = [f"{self.BASE}/added-{i}" for i in range(2000)]
+        self.seen_filter.add_many(added)
+        self.seen_filter.mark_ready()
+
+        self.assertTrue(all(self.seen_filter.contains_many(added)))
+        false_positives = sum(self.seen_filter.contains_many([f"{self.BASE}/other-{i}" for i in range(10000)]))
+        self.assertLess(false_positives / 10000, 0.02)
+
+        stats = self.seen_filter.stats()
+        self.assertAlmostEqual(stats.estimated_items, 2000, delta=100)
+        self.assertAlmostEqual(stats.estimated_fp_rate, 0.01, delta=0.005)
+        self.assertLessEqual(stats.memory_bytes, self.seen_filter.size // 8 + 1)
+
+    def test_scraper_only_checks_possible_hits_in_database(self):
+        Job.objects.create(title="Job 0", experience="Mid", skills={}, url=f"{self.BASE}/job-0")
+        Requested.objects.create(url=f"{self.BASE}/job-0", title="Job 0")
+        self.seen_filter.add_many([f"{self.BASE}/job-0"])
+        self.seen_filter.mark_ready()
+        scraper = NoFluffScraper(request_limit=10)
+        scraper.seen_filter = self.seen_filter
+        listings = {f"Job {i}": {"link": f"{self.BASE}/job-{i}"} for i in range(5)}
+
+        with CaptureQueriesContext(connection) as queries:
+            to_fetch = scraper.select_jobs_to_fetch([listings, {"Job 9": {"link": f"{self.BASE}/job-9"}}])
+
+        self.assertEqual([title for title, _ in to_fetch], ["Job 1", "Job 2", "Job 3", "Job 4", "Job 9"])
+        self.assertEqual(len(queries), 2)  # Job and Requested for the first page's hit only
+        stats = self.seen_filter.stats()
+        self.assertEqual((stats.lookups, stats.positives, stats.false_positives), (6, 1, 0))
+
+    def test_seed_command_adds_known_urls_and_marks_ready(self):
+        Job.objects.create(title="Job 0", experience="Mid", skills={}, url=f"{self.BASE}/job-0?s=1")
+        Requested.objects.create(url=f"{self.BASE}/job-1", title="Job 1")
+
+        out = StringIO()
+        with mock.patch.object(SeenUrlFilter, 'from_settings', return_value=self.seen_filter):
+            call_command('seed_seen_filter', stdout=out)
+
+        self.assertIn("Added 2 URLs", out.getvalue())
+        self.assertEqual(self.seen_filter.contains_many([f"{self.BASE}/job-0", f"{self.BASE}/job-1"]), [True, True])
+
+
+class TestRequestedRetention(TestCase):
+    BASE = "https://nofluffjobs.com/pl/job"
+
+    @override_settings(SCRAPER_REQUESTED_FLUSH_SIZE=3)
+    def test_requested_rows_written_in_bulk(self):
+        Requested.objects.create(url=f"{self.BASE}/job-0", title="Job 0")
+        scraper = NoFluffScraper(request_limit=10)
+        with CaptureQueriesContext(connection) as queries:
+            for i in range(4):
+                scraper._buffer_requested(FetchResult(url=f"{self.BASE}/job-{i}?s=1", context=f"Job {i}", text=""))
+            self.assertEqual(Requested.objects.count(), 3)  # the first three, job-0 already there
+            scraper.flush_requested()
+
+        inserts = [q for q in queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 2)
+        self.assertEqual(Requested.objects.count(), 4)
+        self.assertEqual(Requested.objects.get(canonical_url=f"{self.BASE}/job-3").title, "Job 3")
+
+    def test_compact_requested_drops_saved_and_expired_rows(self):
+        Job.objects.create(title="Saved", experience="Mid", skills={}, url=f"{self.BASE}/saved?s=1")
+        Requested.objects.create(url=f"{self.BASE}/saved", title="Saved")
+        Requested.objects.create(url=f"{self.BASE}/old", title="Old")
+        Requested.objects.create(url=f"{self.BASE}/recent", title="Recent")
+        Requested.objects.filter(title="Old").update(created_at=timezone.now() - timedelta(days=40))
+
+        out = StringIO()
+        call_command('compact_requested', days=30, batch_size=1, pause=0, stdout=out)
+
+        self.assertEqual(list(Requested.objects.values_list('title', flat=True)), ["Recent"])
+        self.assertIn("Deleted 2 requested rows, 1 left", out.getvalue())
+
+    def test_saved_job_skipped_without_requested_row(self):
+        Job.objects.create(title="Saved", experience="Mid", skills={}, url=f"{self.BASE}/saved")
+        scraper = NoFluffScraper(request_limit=10)
+        to_fetch = scraper.select_jobs_to_fetch([{"Saved": {"link": f"{self.BASE}/saved"},
+                                                  "New": {"link": f"{self.BASE}/new"}}])
+        self.assertEqual(to_fetch, [("New", f"{self.BASE}/new")])
+
+
+class TestKnownJobPrecheck(TestCase):
+    BASE = "https://nofluffjobs.com/pl/job"
+
+    def listings(self, count):
+        return {f"Job {i}": {"link": f"{self.BASE}/job-{i}?utm=list"} for i in range(count)}
+
+    def create_job(self, slug, scraped_days_ago=0):
+        job = Job.objects.create(title=slug, experience="Mid", skills={}, url=f"{self.BASE}/{slug}")
+        Job.objects.filter(pk=job.pk).update(scraped_date=timezone.now() - timedelta(days=scraped_days_ago))
+        return job
+
+    def test_known_jobs_skipped_with_one_query_per_table(self):
+        self.create_job("job-0")
+        Requested.objects.create(url=f"{self.BASE}/job-0", title="Job 0")
+        stale = self.create_job("job-1", scraped_days_ago=20)
+        Requested.objects.create(url=f"{self.BASE}/job-2?utm=list", title="Job 2")
+        # Shares a prefix with job-3 but is a different posting
+        self.create_job("job-3-senior")
+
+        scraper = NoFluffScraper(request_limit=10)
+        with CaptureQueriesContext(connection) as queries:
+            to_fetch = scraper.select_jobs_to_fetch([self.listings(5)])
+
+        self.assertEqual(to_fetch, [("Job 3", f"{self.BASE}/job-3?utm=list"), ("Job 4", f"{self.BASE}/job-4?utm=list")])
+        self.assertEqual(len(queries), 3)  # Job, Requested and the scraped_date refresh
+        self.assertEqual(scraper.updated_count, 1)
+        stale.refresh_from_db()
+        self.assertGreater(stale.scraped_date, timezone.now() - timedelta(days=1))
+
+    def test_queries_scale_with_pages_not_listings(self):
+        scraper = NoFluffScraper(request_limit=10)
+        with CaptureQueriesContext(connection) as queries:
+            to_fetch = scraper.select_jobs_to_fetch([self.listings(150), self.listings(300)])
+
+        self.assertEqual(len(to_fetch), 300)
+        self.assertEqual(len(queries), 4)
+        self.assertEqual(scraper.precheck_counter.count, 4)
+
+
+class TestParserBackends(TestCase):
+    """Every parser backend must extract exactly what html.parser extracts."""
+    BACKENDS = ['lxml', 'html5lib']
+
+    def extract(self, scraper, html):
+        return scraper._process_single_job("title", FetchResult(url="https://example.com/job", text=html))
+
+    def test_detail_fields_identical_across_backends(self):
+        for name, scraper_class in SCRAPERS.items():
+            transport = ReplayTransport(name)
+            reference = scraper_class(request_limit=0)
+            reference.parser = 'html.parser'
+            for backend in self.BACKENDS:
+                scraper = scraper_class(request_limit=0)
+                scraper.parser = backend
+                for html in transport.pages('detail'):
+                    with self.subTest(scraper=name, backend=backend):
+                        expected = self.extract(reference, html)
+                        self.assertIsNotNone(expected)
+                        self.assertEqual(self.extract(scraper, html), expected)
+
+    def test_listings_identical_across_backends(self):
+        for name, scraper_class in SCRAPERS.items():
+            pages = ReplayTransport(name).pages('listing')
+            reference = scraper_class(request_limit=0)
+            reference.parser = 'html.parser'
+            for backend in self.BACKENDS:
+                with self.subTest(scraper=name, backend=backend):
+                    scraper = scraper_class(request_limit=0)
+                    scraper.parser = backend
+                    self.assertEqual(scraper.get_job_listings(pages), reference.get_job_listings(pages))
+
+    def test_missing_backend_falls_back_to_html_parser(self):
+        with override_settings(SCRAPER_HTML_PARSER='not-a-parser'):
+            self.assertEqual(NoFluffScraper(request_limit=0).parser, 'html.parser')
+
+class TestPartialParsing(TestCase):
+    """Parsing only the selected subtrees must not change what the scrapers extract."""
+
+    def extract_fields(self, scraper, soup):
+        experience = scraper.extract_experience_level(soup)
+        return [scraper.extract_company(soup), scraper.extract_location(soup), scraper.extract_operating_mode(soup),
+                experience, scraper.extract_salary(soup), scraper.extract_description(soup),
+                scraper.process_skills(soup, experience)]
+
+    def test_detail_fields_match_full_parse(self):
+        for name, scraper_class in SCRAPERS.items():
+            scraper = scraper_class(request_limit=0)
+            for html in ReplayTransport(name).pages('detail'):
+                with self.subTest(scraper=name):
+                    partial = scraper.make_soup(html, scraper.get_detail_parse_selectors())
+                    full = scraper.make_soup(html)
+                    self.assertLess(len(partial.find_all(True)), len(full.find_all(True)))
+                    self.assertEqual(self.extract_fields(scraper, partial), self.extract_fields(scraper, full))
+
+    def test_listing_containers_match_full_parse(self):
+        for name, scraper_class in SCRAPERS.items():
+            scraper = scraper_class(request_limit=0)
+            selector = scraper.get_jobs_container_selector()
+            for html in ReplayTransport(name).pages('listing'):
+                with self.subTest(scraper=name):
+                    partial = scraper.make_soup(html, scraper.get_listing_parse_selectors())
+                    full = scraper.make_soup(html)
+                    self.assertEqual([str(c) for c in partial.find_all(**selector)],
+                                     [str(c) for c in full.find_all(**selector)])
+
+    def test_strainer_matches_single_class_token(self):
+        html = '<div class="list-container ng-star-inserted"><a>1</a></div><div class="other"><a>2</a></div>'
+        for parser in ['html.parser', 'lxml']:
+            with self.subTest(parser=parser):
+                scraper = NoFluffScraper(request_limit=0)
+                scraper.parser = parser
+                soup = scraper.make_soup(html, [{'name': 'div', 'attrs': {'class': 'list-container'}}])
+                self.assertEqual([a.text for a in soup.find_all('a')], ['1'])
+
+class TestExtractionPlan(TestCase):
+    def test_plan_matches_plain_soup_in_one_traversal(self):
+        for name, scraper_class in SCRAPERS.items():
+            scraper = scraper_class(request_limit=0)
+            for html in ReplayTransport(name).pages('detail'):
+                with self.subTest(scraper=name):
+                    soup = scraper.make_soup(html, scraper.get_detail_parse_selectors())
+                    anchored = scraper.extraction_plan.run(soup)
+                    self.assertEqual(scraper.extract_job_details(anchored), scraper.extract_job_details(soup))
+                    self.assertEqual(anchored.traversals, 1)
+
+    def test_plan_compiled_per_scraper_class(self):
+        self.assertIsNot(NoFluffScraper.extraction_plan, JustJoinScraper.extraction_plan)
+        # company and location share the same anchor on justjoin.it
+        self.assertEqual(len(JustJoinScraper.extraction_plan.selectors), 5)
+
+    def test_lookups_outside_the_plan_are_delegated(self):
+        plan = ExtractionPlan({'company': [{'name': 'p', 'attrs': {'class': 'company'}}]})
+        anchored = plan.run(BeautifulSoup(
+            '<div><p class="company lead">Acme</p><p class="company">Globex</p><span>x</span></div>', 'html.parser'))
+        self.assertEqual([p.text for p in anchored.find_all('p', {'class': 'company'})], ['Acme', 'Globex'])
+        self.assertEqual(anchored.find('p', class_='company').text, 'Acme')
+        self.assertEqual(anchored.traversals, 1)
+        self.assertEqual(anchored.find('span').text, 'x')
+        self.assertEqual(anchored.traversals, 2)
+
+class TestEmbeddedJson(TestCase):
+    """The embedded JSON path must produce the same job details as the DOM extractors."""
+    STATE_SCRIPT = re.compile(r'<script id="(__NEXT_DATA__|serverApp-state)".*?</script>', re.DOTALL)
+
+    def dom_details(self, scraper, html):
+        return scraper.parse_job_page(self.STATE_SCRIPT.sub('', html))
+
+    def test_embedded_json_matches_dom(self):
+        for name in ['jjit', 'nofluff']:
+            scraper = SCRAPERS[name](request_limit=0)
+            for html in ReplayTransport(name).pages('detail'):
+                with self.subTest(scraper=name):
+                    embedded = scraper.parse_embedded_json(html)
+                    self.assertIsNotNone(embedded)
+                    self.assertEqual(embedded, self.dom_details(scraper, html))
+
+    def test_falls_back_to_dom(self):
+        scraper = JustJoinScraper(request_limit=0)
+        html = ReplayTransport('jjit').pages('detail')[0]
+        expected = self.dom_details(scraper, html)
+        broken_pages = {
+            'missing': self.STATE_SCRIPT.sub('', html),
+            'invalid': self.STATE_SCRIPT.sub('<script id="__NEXT_DATA__">{"props": </script>', html),
+            'unknown': self.STATE_SCRIPT.sub('<script id="__NEXT_DATA__">{"props": {}}</script>', html),
+        }
+        for case, page in broken_pages.items():
+            with self.subTest(case=case):
+                self.assertIsNone(scraper.parse_embedded_json(page))
+                self.assertEqual(scraper.parse_job_page(page), expected)
+
+    def test_foreign_currency_offer_shown_in_pln(self):
+        scraper = JustJoinScraper(request_limit=0)
+        html = ReplayTransport('jjit').pages('detail')[0]
+        state = re.search(r'(<script id="__NEXT_DATA__"[^>]*>)(.*?)(</script>)', html, re.DOTALL)
+        employment_types = {
+            "hourly EUR": ([{"type": "b2b", "from": 25, "to": 30, "currency": "eur", "unit": "hour",
+                             "fromPln": 108, "toPln": 129}], "108 - 129 PLN/h", 18144, "hour"),
+            "no PLN amounts": ([{"type": "permanent", "from": None, "to": None, "currency": "usd", "unit": "month"},
+                                {"type": "b2b", "from": 5000, "to": 6000, "currency": "usd", "unit": "month"}],
+                               "20 000 - 24 000 PLN", 20000, "month"),
+        }
+        for case, (types, salary, salary_min, period) in employment_types.items():
+            with self.subTest(case=case):
+                data = json.loads(state.group(2))
+                data["props"]["pageProps"]["offer"]["employmentTypes"] = types
+                page = html.replace(state.group(0), state.group(1) + json.dumps(data) + state.group(3))
+
+                details = scraper.parse_embedded_json(page)
+                self.assertEqual(details["salary"], salary)
+                job = Job()
+                job.set_salary(details["salary"])
+                self.assertEqual((job.salary_min, job.salary_period), (salary_min, period))
+
+    def test_format_salary_range(self):
+        self.assertEqual(WebScraper.format_salary_range(12000, 18000, 'pln'), "12 000 - 18 000 PLN")
+        self.assertEqual(WebScraper.format_salary_range(9000, None, 'EUR'), "9 000 EUR")
+        self.assertEqual(WebScraper.format_salary_range(None, None, 'PLN'), "")
+
+class TestParallelRunScrapers(TestCase):
+    def fake_scraper(self, run):
+        return type('FakeScraper', (), {'__init__': lambda self, request_limit: None, 'run': lambda self: run()})
+
+    def test_boards_run_concurrently_and_failures_are_isolated(self):
+        # Both boards must be inside run() at the same time to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def board(created):
+            def run():
+                barrier.wait()
+                return created
+            return run
+
+        def broken():
+            raise RuntimeError("board is down")
+
+        fake_scrapers = {
+            'fast': self.fake_scraper(board(3)),
+            'slow': self.fake_scraper(board(2)),
+            'broken': self.fake_scraper(broken),
+        }
+        with mock.patch.dict(SCRAPERS, fake_scrapers, clear=True):
+            total = call_command('run_scrapers', parallel=True)
+
+        self.assertEqual(total, "5")
+
+class ReplayPracujScraper(PracujScraper):
+    """Pracuj scraper served from the recordings, failing on one job page."""
+
+    def __init__(self, request_limit):
+        super().__init__(request_limit)
+        self.transport = ReplayTransport('pracuj')
+
+    def scrape_jobs(self, jobs):
+        if "Data Engineer" in [title for title, _ in jobs]:
+            raise RuntimeError("worker lost")
+        return super().scrape_jobs(jobs)
+
+
+@override_settings(SCRAPER_RATE_LIMIT=FAST_RATE_LIMIT, SCRAPER_RETRY=FAST_RETRY, SCRAPER_HTTP_CACHE=None,
+                   SCRAPER_ARCHIVE_DIR=None, SCRAPER_SAVE_BATCH_SIZE=2)
+@mock.patch.dict(RateLimiter.registries, clear=True)
+@mock.patch('jobs.tasks.clear_view_cache')
+class TestCeleryFanOut(TestCase):
+    def setUp(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, 'task_always_eager', False)
+
+    @override_settings(SCRAPER_TASK_CHUNK_SIZE=2)
+    def test_chord_saves_every_chunk_that_did_not_fail(self, clear_view_cache):
+        with mock.patch.dict(SCRAPERS, {'pracuj': ReplayPracujScraper}, clear=True), \
+                mock.patch.object(ReplayPracujScraper, 'create_fetcher', autospec=True,
+                                  side_effect=PracujScraper.create_fetcher) as create_fetcher:
+            run_scrapers_task.delay(request_limit=10)
+
+        self.assertEqual(create_fetcher.call_count, 3)  # the listings, then one per chunk that ran
+
+        self.assertEqual(Requested.objects.count(), 4)
+        self.assertEqual(
+            set(Job.objects.values_list('title', flat=True)),
+            {"Python Developer", "Senior Backend Engineer", "Junior Frontend Developer",
+             "Fullstack JavaScript Developer"},
+        )
+        self.assertEqual(clear_view_cache.call_count, 2)  # after each chunk that saved jobs
+
+    def test_chunks_share_domain_limits(self, _clear_view_cache):
+        fetchers = []
+        original = PracujScraper.create_fetcher
+
+        def create_fetcher(scraper):
+            fetchers.append(original(scraper))
+            return fetchers[-1]
+
+        chunks = [[["Python Developer", "https://it.pracuj.pl/praca/python-developer,oferta,1"]],
+                  [["Data Engineer", "https://www.pracuj.pl/praca/data-engineer,oferta,2"]]]
+        with mock.patch.dict(SCRAPERS, {'pracuj': PracujScraper}, clear=True), \
+                mock.patch.object(PracujScraper, 'create_fetcher', autospec=True, side_effect=create_fetcher), \
+                mock.patch.object(PracujScraper, 'save_jobs_in_batches', return_value=0):
+            for chunk in chunks:
+                scrape_jobs_task.delay('pracuj', chunk)
+
+        first, second = (fetcher.rate_limiter.for_url(link) for fetcher, ((_, link),) in zip(fetchers, chunks))
+        self.assertIs(first.bucket, second.bucket)
+        self.assertIs(first.breaker, second.breaker)
+
+@mock.patch('jobs.tasks.clear_view_cache')
+class TestSummaryQueue(TestCase):
+    def create_job(self, title, status=Job.SUMMARY_PENDING):
+        return Job.objects.create(title=title, experience="Mid", skills={}, description=f"About {title}",
+                                  url=f"https://nofluffjobs.com/pl/job/{title}", summary_status=status)
+
+    def test_summaries_written_back_in_one_update(self, clear_view_cache):
+        jobs = [self.create_job(f"job-{i}") for i in range(3)]
+        done = self.create_job("done", status=Job.SUMMARY_DONE)
+
+        def summarize_many(texts):
+            return [RuntimeError("rate limited") if text == "About job-2"
+                    else SummaryResult(f"Summary of {text}", tokens=100, latency_ms=1000) for text in texts]
+
+        with mock.patch('jobs.summary_cache.SummaryEngine.summarize_many', side_effect=summarize_many) as summarize, \
+                CaptureQueriesContext(connection) as queries:
+            self.assertEqual(summarize_jobs_task([job.id for job in jobs] + [done.id]), 3)
+
+        summarize.assert_called_once()
+        self.assertCountEqual(summarize.call_args.args[0], ["About job-0", "About job-1", "About job-2"])
+        self.assertEqual(len([q for q in queries if q['sql'].startswith('UPDATE')]), 1)
+        self.assertEqual(
+            list(Job.objects.order_by('id').values_list('summary_status', 'summary')),
+            [(Job.SUMMARY_DONE, "Summary of About job-0"), (Job.SUMMARY_DONE, "Summary of About job-1"),
+             (Job.SUMMARY_EXTRACTIVE, "<p>About job-2</p>"), (Job.SUMMARY_DONE, None)],
+        )
+        self.assertEqual(SummaryCache.objects.count(), 2)  # the extractive summary is not cached
+        clear_view_cache.assert_called_once()
+
+    def test_extractive_summaries_upgraded(self, _clear_view_cache):
+        extractive = self.create_job("extractive", status=Job.SUMMARY_EXTRACTIVE)
+        Job.objects.filter(id=extractive.id).update(summary="<p>About extractive</p>")
+        self.create_job("pending")
+
+        with mock.patch.object(summarize_jobs_task, 'delay') as delay:
+            self.assertEqual(upgrade_summaries_task(), 1)
+        delay.assert_called_once_with([extractive.id])
+
+        # Still failing: the extractive summary stays as it is
+        with mock.patch('jobs.summary_cache.SummaryEngine.summarize_many', return_value=[CircuitOpenError()]), \
+                CaptureQueriesContext(connection) as queries:
+            summarize_jobs_task([extractive.id])
+        self.assertFalse([q for q in queries if q['sql'].startswith('UPDATE')])
+
+        with mock.patch('jobs.summary_cache.SummaryEngine.summarize_many',
+                        return_value=[SummaryResult("<p>OpenAI summary</p>", tokens=100, latency_ms=1000)]):
+            summarize_jobs_task([extractive.id])
+        extractive.refresh_from_db()
+        self.assertEqual((extractive.summary_status, extractive.summary), (Job.SUMMARY_DONE, "<p>OpenAI summary</p>"))
+
+    @override_settings(SUMMARY_BATCH_SIZE=2)
+    def test_pending_jobs_requeued_in_batches(self, _clear_view_cache):
+        jobs = [self.create_job(f"job-{i}") for i in range(3)]
+        self.create_job("fresh")
+        Job.objects.filter(id__in=[job.id for job in jobs]).update(created_at=timezone.now() - timedelta(hours=1))
+
+        with mock.patch.object(summarize_jobs_task, 'delay') as delay:
+            self.assertEqual(summarize_pending_jobs_task(), 3)
+        self.assertEqual([call.args[0] for call in delay.call_args_list],
+                         [[jobs[0].id, jobs[1].id], [jobs[2].id]])
+
+
+class TestExtractiveSummarizer(TestCase):
+    DESCRIPTION = """
+        We are looking for a Python developer to build Django services for our data platform.
+        - You will design Django REST APIs used by the data platform teams
+        - You will maintain Python data pipelines and Postgres databases
+        Free fruit and coffee every Monday.
+        Our Python developers own the platform services from design to production.
+    """
+
+    def test_backend_must_implement_summarize_many(self):
+        class Incomplete(Summarizer):
+            name = 'incomplete'
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_summary_structure(self):
+        skills = {"Docker": "nice to have", "Django": "regular", "Python": "senior", "<Kafka>": "nice to have"}
+        result = ExtractiveSummarizer(overview_sentences=2).summarize_many([self.DESCRIPTION], [skills])[0]
+
+        self.assertEqual(result.tokens, 0)
+        overview, rest = result.summary.split("</p>\n")
+        self.assertTrue(overview.startswith("<p>We are looking for a Python developer"))
+        self.assertNotIn("fruit", overview)
+        self.assertEqual(rest, "<strong>Necessary skills:</strong>\n<ul>\n"
+                               "<li><strong>Python</strong></li>\n<li><strong>Django</strong></li>\n</ul>\n"
+                               "<strong>Nice-to-have skills:</strong>\n<ul>\n"
+                               "<li><strong>&lt;Kafka&gt;</strong></li>\n<li><strong>Docker</strong></li>\n</ul>")
+
+    def test_sentences_listed_without_skills(self):
+        summary = ExtractiveSummarizer(overview_sentences=2).summarize_many([self.DESCRIPTION])[0].summary
+
+        self.assertIn("<strong>Necessary skills:</strong>", summary)
+        self.assertEqual(summary.count("<li>"), 3)
+        self.assertNotIn("Nice-to-have", summary)
+        self.assertNotIn("<li>-", summary)
+
+
+class TestSummaryCache(TestCase):
+    DESCRIPTION = "We are looking for a Python Developer.\n\nDjango, Postgres."
+
+    def setUp(self):
+        cache.clear()
+
+    @mock.patch('jobs.summary_cache.SummaryEngine.summarize_many',
+                return_value=[SummaryResult("summary", tokens=900, latency_ms=2500)])
+    def test_identical_descriptions_summarized_once(self, summarize_many):
+        summarizer = CachedSummarizer()
+        variant = "  we are looking for a python developer. django,   postgres. "
+        self.assertEqual(summarizer.summarize_many([self.DESCRIPTION]), {self.DESCRIPTION: "summary"})
+        self.assertEqual(summarizer.summarize_many([variant]), {variant: "summary"})
+        cache.clear()  # the table still has it once Redis dropped it
+        self.assertEqual(summarizer.summarize_many([self.DESCRIPTION]), {self.DESCRIPTION: "summary"})
+
+        summarize_many.assert_called_once()
+        self.assertEqual((summarizer.stats.hits, summarizer.stats.misses), (2, 1))
+        self.assertEqual((summarizer.stats.tokens_saved, summarizer.stats.latency_saved_ms), (1800, 5000))
+        self.assertEqual(SummaryCache.objects.get().hits, 2)
+
+        with mock.patch('jobs.summary_cache.PROMPT_VERSION', 3):
+            self.assertEqual(summarizer.lookup([self.DESCRIPTION]), {})
+
+    @mock.patch('jobs.tasks.enqueue_summaries')
+    def test_saved_job_reuses_cached_summary(self, enqueue_summaries):
+        SummaryCache.objects.create(description_hash=description_hash(self.DESCRIPTION), prompt_version=1,
+                                    summary="cached summary", tokens=900, latency_ms=2500)
+        scraper = NoFluffScraper(request_limit=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            scraper.save_jobs({"Python Developer": {"link": "https://nofluffjobs.com/pl/job/python", "experience": "Mid",
+                                                    "skills": {}, "description": self.DESCRIPTION}})
+
+        job = Job.objects.get()
+        self.assertEqual((job.summary, job.summary_status), ("cached summary", Job.SUMMARY_DONE))
+        enqueue_summaries.assert_not_called()
+        self.assertIn("1 hits, 0 misses (100% hit ratio), 900 tokens and 2.5s saved", str(scraper.summarizer.stats))
+
+
+@mock.patch('jobs.summary_cache.SummaryEngine.summarize_many',
+            return_value=[SummaryResult("<p>summary</p>", tokens=900, latency_ms=2500)])
+class TestLazySummaries(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.job = Job.objects.create(title="Python Developer", experience="Mid", skills={}, description="About it",
+                                      url="https://nofluffjobs.com/pl/job/python", summary_status=Job.SUMMARY_LAZY)
+
+    @override_settings(SUMMARY_MODE='lazy')
+    @mock.patch('jobs.tasks.enqueue_summaries')
+    def test_save_jobs_skips_summaries(self, enqueue_summaries, summarize_many):
+        scraper = NoFluffScraper(request_limit=1)
+        with self.captureOnCommitCallbacks(execute=True):
+            scraper.save_jobs({"Go Developer": {"link": "https://nofluffjobs.com/pl/job/go", "experience": "Mid",
+                                                "skills": {}, "description": "About Go"}})
+
+        self.assertEqual(Job.objects.get(title="Go Developer").summary_status, Job.SUMMARY_LAZY)
+        self.assertEqual(scraper.summarizer.stats.misses, 0)
+        enqueue_summaries.assert_not_called()
+
+    @mock.patch('jobs.tasks.clear_view_cache')
+    @mock.patch('jobs.tasks.enqueue_summaries')
+    def test_summary_queued_on_first_view(self, enqueue_summaries, _clear_view_cache, summarize_many):
+        for _ in range(2):
+            response = self.client.get(f"/api/jobs/{self.job.id}/summary")
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.json()["summary_status"], Job.SUMMARY_PENDING)
+        enqueue_summaries.assert_called_once_with([self.job.id])
+        summarize_many.assert_not_called()
+
+        summarize_jobs_task(*enqueue_summaries.call_args.args)
+        response = self.client.get(f"/api/jobs/{self.job.id}/summary")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"id": self.job.id, "summary": "<p>summary</p>",
+                                           "summary_status": Job.SUMMARY_DONE})
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(f"/api/jobs/{self.job.id}/summary").json()["summary"], "<p>summary</p>")
+        summarize_many.assert_called_once()
+
+    @mock.patch('jobs.tasks.enqueue_summaries')
+    def test_pending_job_not_queued_again_and_unknown_job(self, enqueue_summaries, summarize_many):
+        Job.objects.filter(id=self.job.id).update(summary_status=Job.SUMMARY_PENDING)
+
+        self.assertEqual(self.client.get(f"/api/jobs/{self.job.id}/summary").status_code, 202)
+        self.assertEqual(self.client.get("/api/jobs/0/summary").status_code, 404)
+        enqueue_summaries.assert_not_called()
+        summarize_many.assert_not_called()
+
+
+class TestSalaryColumns(TestCase):
+    def create_job(self, title, salary):
+        job = Job(title=title, experience="Mid", skills={}, url=f"https://nofluffjobs.com/pl/job/{title}")
+        job.set_salary(salary)
+        job.save()
+        return job
+
+    def setUp(self):
+        cache.clear()
+
+    def test_parse_salary(self):
+        self.assertEqual(parse_salary("25 - 30 EUR/h"), SalaryRange(18060, 21672, "EUR", "hour"))
+        self.assertEqual(parse_salary("120 000 USD / year"), SalaryRange(40000, 40000, "USD", "year"))
+        self.assertEqual(parse_salary("12\xa0000 – 15\xa0000 zł"), SalaryRange(12000, 15000, "PLN", "month"))
+        self.assertEqual(parse_salary("100 - 140 PLN"), SalaryRange(16800, 23520, "PLN", "hour"))
+        self.assertEqual(parse_salary("12.000 - 15.000 zł"), SalaryRange(12000, 15000, "PLN", "month"))
+        self.assertEqual(parse_salary("1.500,00 EUR/day"), SalaryRange(135450, 135450, "EUR", "day"))
+        self.assertIsNone(parse_salary("invalid salary"))
+
+    def test_displayed_salary_unchanged(self):
+        # Only the columns convert currencies, the text stays what standardize_salary always showed
+        self.assertEqual(standardize_salary("5000 USD"), "")
+        self.assertEqual(standardize_salary("25 - 30 EUR/h"), "")
+        self.assertEqual(standardize_salary("100 - 140 PLN"), "16 800 - 23 520 PLN")
+        self.assertEqual(standardize_salary("10 000,00 - 12 000,00 PLN"), "10 000 - 12 000 PLN")
+
+    def test_columns_filled_at_save(self):
+        NoFluffScraper(request_limit=1).save_jobs({
+            "Python Developer": {"link": "https://nofluffjobs.com/pl/job/python", "experience": "Mid", "skills": {},
+                                 "salary": "4 000 - 5 000 EUR"},
+        })
+        job = Job.objects.get()
+        self.assertEqual((job.salary, job.salary_min, job.salary_max, job.salary_currency, job.salary_period),
+                         ("17 200 - 21 500 PLN", 17200, 21500, "EUR", "month"))
+
+    def test_shown_salary_matches_columns(self):
+        usd = self.create_job("usd", "5000 USD")
+        hourly = self.create_job("hourly", "25 - 30 EUR/h")
+        unparsed = self.create_job("unparsed", "Undisclosed")
+
+        self.assertEqual((usd.salary, usd.salary_min, usd.salary_max), ("20 000 PLN", 20000, 20000))
+        self.assertEqual((hourly.salary, hourly.salary_min), ("18 060 - 21 672 PLN", 18060))
+        self.assertEqual((unparsed.salary, unparsed.salary_min), (None, None))
+
+    def test_range_filters_and_sorting_in_sql(self):
+        self.create_job("low", "8 000 - 10 000 PLN")
+        self.create_job("mid", "12 000 - 15 000 PLN")
+        self.create_job("high", "20 000 - 25 000 PLN")
+        self.create_job("undisclosed", None)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/jobs/filter?salary_min__gte=9000&salary_max__lte=20000&ordering=-salary")
+        self.assertEqual([job["title"] for job in response.json()["results"]], ["mid"])
+        self.assertIn('"salary_min" >=', queries[-1]['sql'])
+
+        response = self.client.get("/api/jobs/filter?ordering=-salary")
+        self.assertEqual([job["title"] for job in response.json()["results"]], ["high", "mid", "low", "undisclosed"])
+        response = self.client.get("/api/jobs/filter?ordering=salary")
+        self.assertEqual([job["title"] for job in response.json()["results"]], ["low", "mid", "high", "undisclosed"])
+
+    def test_stats_average_salary(self):
+        self.create_job("low", "8 000 - 10 000 PLN")
+        self.create_job("high", "12 000 - 20 000 PLN")
+        self.create_job("undisclosed", None)
+
+        self.assertEqual(self.client.get("/api/jobs/stats").json()["salary_stats"], "10000 - 15000 PLN")
+
+    def test_backfill(self):
+        Job.objects.bulk_create([
+            Job(title="legacy", experience="Mid", skills={}, url="https://nofluffjobs.com/pl/job/legacy",
+                salary="10 000 - 15 000 PLN"),
+            Job(title="unparsed", experience="Mid", skills={}, url="https://nofluffjobs.com/pl/job/unparsed",
+                salary="Undisclosed"),
+        ])
+        out = StringIO()
+        call_command('backfill_salary_columns', stdout=out)
+
+        self.assertEqual(Job.objects.get(title="legacy").salary_max, 15000)
+        self.assertIn("Updated 1 jobs", out.getvalue())
+        self.assertIn("1 salaries could not be parsed", out.getvalue())
+
+
+class TestSalaryNormalizer(TestCase):
+    SALARIES = ["4 000 - 5 000 EUR", "10 000,00 - 12 000,00 PLN", "Undisclosed", "16 800 PLN", "25 - 30 EUR/h",
+                "120 000 USD / year", "100 - 140 PLN", "800 - 1 000 PLN/day"]
+
+    def setUp(self):
+        cache.clear()
+        Job.objects.bulk_create([
+            Job(title=f"job-{i}", experience="Mid", skills={}, url=f"https://nofluffjobs.com/pl/job/{i}", salary=salary)
+            for i, salary in enumerate(self.SALARIES)
+        ])
+
+    def test_chunk_parsed_like_parse_salary(self):
+        expected = [parse_salary(salary) for salary in self.SALARIES]
+        self.assertEqual(SalaryNormalizer('test').normalize(self.SALARIES + self.SALARIES[::-1]),
+                         expected + expected[::-1])
+
+    def test_cleanup_in_short_transactions(self):
+        out = StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command('cleanup_salaries', '--batch_size', '3', stdout=out)
+
+        self.assertEqual(
+            list(Job.objects.order_by('id').values_list('salary', 'salary_min', 'salary_currency', 'salary_period'))[:4],
+            [("17 200 - 21 500 PLN", 17200, "EUR", "month"), ("10 000 - 12 000 PLN", 10000, "PLN", "month"),
+             ("Undisclosed", None, None, None), ("16 800 PLN", 16800, "PLN", "month")],
+        )
+        self.assertEqual(len([q for q in queries if q['sql'].startswith('UPDATE')]), 3)
+        self.assertIn("Total jobs processed: 8", out.getvalue())
+        self.assertIn("Unparsed salaries left as they are: 1", out.getvalue())
+        self.assertIn("rows/s", out.getvalue())
+
+    def test_second_run_changes_nothing(self):
+        job = Job.objects.create(title="tiny", experience="Mid", skills={}, url="https://nofluffjobs.com/pl/job/tiny",
+                                 salary="5 - 6 EUR/year")
+        call_command('cleanup_salaries', stdout=StringIO())
+        first = list(Job.objects.order_by('id').values_list('salary', 'salary_min', 'salary_max'))
+        out = StringIO()
+        call_command('cleanup_salaries', stdout=out)
+
+        # "2 PLN" has no period any more, parsing it again would take it as an hourly rate
+        self.assertEqual(Job.objects.get(id=job.id).salary, "2 PLN")
+        self.assertEqual(list(Job.objects.order_by('id').values_list('salary', 'salary_min', 'salary_max')), first)
+        self.assertIn("Updated: 0", out.getvalue())
+
+    def test_identical_salaries_updated_together(self):
+        Job.objects.bulk_create([
+            Job(title=f"same-{i}", experience="Mid", skills={}, url=f"https://nofluffjobs.com/pl/job/same-{i}",
+                salary="4 000 - 5 000 EUR")
+            for i in range(5)
+        ])
+        with CaptureQueriesContext(connection) as queries:
+            SalaryNormalizer('test').run()
+
+        # The 6 EUR salaries in one UPDATE, the 6 other changed rows in one bulk_update
+        self.assertEqual(len([q for q in queries if q['sql'].startswith('UPDATE')]), 2)
+        self.assertEqual(Job.objects.filter(salary="17 200 - 21 500 PLN", salary_currency="EUR").count(), 6)
+
+    def test_resume_after_interruption(self):
+        first = SalaryNormalizer('test', batch_size=2).run(limit=3)
+        rest = SalaryNormalizer('test', batch_size=2).run(resume=True)
+
+        self.assertEqual((first.rows, rest.rows), (3, 5))
+        self.assertFalse(Job.objects.filter(salary_min__isnull=True).exclude(salary="Undisclosed").exists())
+
+    def test_dry_run(self):
+        out = StringIO()
+        call_command('test_salary_standardization', stdout=out)
+
+        self.assertIn("Would update 7 salaries", out.getvalue())
+        self.assertIn("Old salary: 4 000 - 5 000 EUR\nNew salary: 17 200 - 21 500 PLN (EUR, per month)", out.getvalue())
+        self.assertEqual(Job.objects.get(title="job-0").salary, "4 000 - 5 000 EUR")
+
+
+class StubOpenAIHandler(BaseHTTPRequestHandler):
+    """
+    Answers chat completions after a short delay, recording the peak number
+    of requests in flight, and runs Batch API batches instantly.
+    """
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+    prompts = []
+    batch_requests = []
+
+    def completion(self, body):
+        prompt = body["messages"][-1]["content"]
+        return {"id": "chatcmpl-1", "object": "chat.completion", "created": 0, "model": body["model"],
+                "choices": [{"index": 0, "finish_reason": "stop",
+                             "message": {"role": "assistant", "content": f"Summary of {prompt[:20]}"}}],
+                "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150}}
+
+    def batch(self):
+        return {"id": "batch-1", "object": "batch", "endpoint": "/v1/chat/completions", "input_file_id": "file-in",
+                "completion_window": "24h", "created_at": 0, "status": "completed", "output_file_id": "file-out"}
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/v1/chat/completions":
+            cls = type(self)
+            with cls.lock:
+                cls.in_flight += 1
+                cls.peak = max(cls.peak, cls.in_flight)
+            time.sleep(0.05)
+            with cls.lock:
+                cls.in_flight -= 1
+            request = json.loads(body)
+            cls.prompts.append(request["messages"][-1]["content"])
+            self.respond(self.completion(request))
+        elif self.path == "/v1/files":
+            # The multipart upload holds one JSON request per line
+            self.batch_requests.extend(json.loads(line) for line in body.splitlines()
+                                       if line.startswith(b'{"custom_id"'))
+            self.respond({"id": "file-in", "object": "file", "bytes": len(body), "created_at": 0,
+                          "filename": "summaries.jsonl", "purpose": "batch", "status": "processed"})
+        else:
+            self.respond(self.batch())
+
+    def do_GET(self):
+        if self.path == "/v1/files/file-out/content":
+            lines = [json.dumps({"id": f"response-{i}", "custom_id": request["custom_id"], "error": None,
+                                 "response": {"status_code": 200, "body": self.completion(request["body"])}})
+                     for i, request in enumerate(self.batch_requests)]
+            self.respond("\n".join(lines).encode(), content_type="application/jsonl")
+        else:
+            self.respond(self.batch())
+
+    def respond(self, payload, content_type="application/json"):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestSummaryEngine(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubOpenAIHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}/v1"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        StubOpenAIHandler.peak = 0
+        StubOpenAIHandler.prompts = []
+        StubOpenAIHandler.batch_requests = []
+
+    def test_concurrency_is_bounded(self):
+        engine = SummaryEngine(base_url=self.base_url, concurrency=2)
+        results = engine.summarize_many([f"Description {i}" for i in range(6)])
+
+        self.assertEqual([result.summary for result in results], [f"Summary of Description {i}" for i in range(6)])
+        self.assertEqual(results[0].tokens, 150)
+        self.assertEqual(StubOpenAIHandler.peak, 2)
+
+    def test_token_budget_shared_by_engines(self):
+        cost = SummaryEngine(base_url=self.base_url).prepare("Description 0")[1]
+        sleep = mock.AsyncMock()
+        with mock.patch.object(SummaryEngine, 'budgets', {}), mock.patch('jobs.summarizer.asyncio.sleep', sleep):
+            SummaryEngine(base_url=self.base_url, tokens_per_minute=cost).summarize_many(["Description 0"])
+            sleep.assert_not_called()
+            # A later task builds a new engine, which must not start with a fresh minute of budget
+            SummaryEngine(base_url=self.base_url, tokens_per_minute=cost).summarize_many(["Description 1"])
+
+        sleep.assert_awaited_once()
+        self.assertAlmostEqual(sleep.await_args.args[0], 60, delta=1)
+
+    def test_circuit_breaker_skips_failing_provider(self):
+        with socket.socket() as closed:
+            closed.bind(("127.0.0.1", 0))
+            port = closed.getsockname()[1]
+        engine = SummaryEngine(base_url=f"http://127.0.0.1:{port}/v1", concurrency=1)
+        engine.max_retries = 0
+
+        with mock.patch.object(SummaryEngine, 'breaker', CircuitBreaker(failure_threshold=2, reset_timeout=300)):
+            results = engine.summarize_many([f"Description {i}" for i in range(4)])
+
+        self.assertNotIsInstance(results[1], CircuitOpenError)
+        self.assertIsInstance(results[1], Exception)
+        self.assertIsInstance(results[2], CircuitOpenError)
+        self.assertIsInstance(results[3], CircuitOpenError)
+
+    def test_long_description_truncated(self):
+        engine = SummaryEngine(base_url=self.base_url, max_input_tokens=50)
+        text, budget = engine.prepare("python " * 500)
+
+        self.assertLessEqual(engine.counter.count(text), 50)
+        self.assertEqual(budget, engine.system_tokens + 50 + engine.max_output_tokens)
+        engine.summarize_many(["python " * 500])
+        self.assertEqual(StubOpenAIHandler.prompts, [text])
+
+    def test_batch_backfill(self):
+        jobs = [Job.objects.create(title=f"job-{i}", experience="Mid", skills={}, description=f"About job-{i}",
+                                   url=f"https://nofluffjobs.com/pl/job/{i}", summary_status=Job.SUMMARY_FAILED)
+                for i in range(3)]
+        Job.objects.filter(id=jobs[2].id).update(description="About job-0")
+        out = StringIO()
+
+        with override_settings(OPENAI_BASE_URL=self.base_url):
+            call_command('summarize_batch', '--submit', stdout=out)
+            cache.clear()  # nothing but the batch itself is needed to collect it
+            call_command('summarize_batch', '--collect', 'batch-1', stdout=out)
+            with self.assertRaises(CommandError):
+                call_command('summarize_batch', '--submit', '--status', Job.SUMMARY_PENDING)
+
+        self.assertEqual(len(StubOpenAIHandler.batch_requests), 2)
+        self.assertIn("Submitted batch batch-1 with 2 descriptions", out.getvalue())
+        self.assertIn("Saved 2 summaries to 3 jobs", out.getvalue())
+        self.assertEqual(
+            list(Job.objects.order_by('id').values_list('summary_status', 'summary')),
+            [(Job.SUMMARY_DONE, "Summary of About job-0")] + [(Job.SUMMARY_DONE, "Summary of About job-1")]
+            + [(Job.SUMMARY_DONE, "Summary of About job-0")],
+        )
+        self.assertEqual(SummaryCache.objects.count(), 2)
+
+
+class TestRateLimiter(TestCase):
+    def test_token_bucket_spaces_reservations(self):
+        bucket = TokenBucket(rate=2, capacity=1)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.5, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 1.0, places=2)
+
+    def test_token_bucket_adapts_rate(self):
+        bucket = TokenBucket(rate=1, min_rate=0.25, max_rate=1.1, increase_step=0.5)
+        bucket.on_success()
+        self.assertEqual(bucket.rate, 1.1)
+        bucket.on_throttle()
+        bucket.on_throttle()
+        bucket.on_throttle()
+        self.assertEqual(bucket.rate, 0.25)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(RetryPolicy.parse_retry_after("120"), 120)
+        self.assertEqual(RetryPolicy.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+        self.assertIsNone(RetryPolicy.parse_retry_after(None))
@@ -0,0 +1,17 @@
+class QueryCounter:
+    """
+    Database execute wrapper that counts queries.
+
+    Usage:
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            ...
+        counter.count
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
@@ -0,0 +1,165 @@
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import QuerySet
+
+from jobs.models import Job
+from jobs.utils.salary_standardizer import (HOUR, MONTH, MONTHLY_FACTORS, PLN_RATES, SalaryRange, extract_salary,
+                                            format_salary)
+
+PERIODS = list(MONTHLY_FACTORS)
+CURRENCIES = list(PLN_RATES)
+PERIOD_FACTORS = np.array([MONTHLY_FACTORS[period] for period in PERIODS])
+CURRENCY_RATES = np.array([PLN_RATES[currency] for currency in CURRENCIES])
+SALARY_FIELDS = ['salary_min', 'salary_max', 'salary_currency', 'salary_period']
+
+
+@dataclass
+class NormalizationStats:
+    """Progress of a `SalaryNormalizer` run."""
+    rows: int = 0
+    changed: int = 0
+    unparsed: int = 0
+    last_id: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        return (f"{self.rows} rows up to id {self.last_id} in {self.seconds:.1f}s ({self.rows_per_second:.0f} rows/s), "
+                f"{self.changed} changed, {self.unparsed} unparsed")
+
+
+class SalaryNormalizer:
+    """
+    Normalizes the salaries of the whole Job table in chunks.
+
+    Rows are streamed in id order with `iterator()`. Salaries repeat a lot,
+    so each chunk is reduced to its distinct texts with `np.unique`, only
+    those are parsed with the precompiled regexes of salary_standardizer,
+    and the conversion to monthly PLN runs over NumPy arrays before being
+    indexed back to the rows. The changed rows are written back in one short
+    transaction: one UPDATE per distinct result shared by several rows
+    (Django's CASE-based `bulk_update` costs about as much as the rows it
+    touches), and one `bulk_update` for the rest. The last committed id is
+    checkpointed in the cache under `checkpoint` after every chunk, so an
+    interrupted run continues where it stopped with `resume=True`.
+
+    With `update_salary` the standardized text replaces `salary`, otherwise
+    only the numeric salary columns are filled. Rows whose columns are
+    already filled are skipped, their text is already monthly PLN and would
+    be converted twice. Salaries that cannot be parsed keep their text.
+    """
+
+    def __init__(self, checkpoint: str, batch_size: int = 2000, update_salary: bool = True, dry_run: bool = False):
+        self.checkpoint_key = f"salary_normalizer:{checkpoint}:last_id"
+        self.batch_size = batch_size
+        self.update_salary = update_salary
+        self.dry_run = dry_run
+        self.fields = (['salary'] if update_salary else []) + SALARY_FIELDS
+
+    def normalize(self, salaries: list[str]) -> list[Optional[SalaryRange]]:
+        """The parsed salaries of a chunk, the same as `parse_salary` for each of them."""
+        if not salaries:
+            return []
+        distinct, inverse = np.unique(np.array([salary or '' for salary in salaries], dtype=str),
+                                      return_inverse=True)
+        extracted = [extract_salary(salary) for salary in distinct.tolist()]
+
+        lows = np.array([row[0] if row else 0 for row in extracted], dtype=np.float64)
+        highs = np.array([row[1] if row else 0 for row in extracted], dtype=np.float64)
+        currency_index = np.array([CURRENCIES.index(row[2]) if row else 0 for row in extracted])
+        explicit = np.array([PERIODS.index(row[3]) if row and row[3] else -1 for row in extracted])
+        # Like parse_salary, amounts of at most 3 digits without a period are hourly rates
+        period_index = np.where(explicit >= 0, explicit,
+                                np.where(lows < 1000, PERIODS.index(HOUR), PERIODS.index(MONTH)))
+        factors = PERIOD_FACTORS[period_index] * CURRENCY_RATES[currency_index]
+        mins = np.rint(lows * factors).astype(np.int64)
+        maxs = np.rint(highs * factors).astype(np.int64)
+
+        ranges = [SalaryRange(low, high, CURRENCIES[currency], PERIODS[period]) if row else None
+                  for row, low, high, currency, period in zip(extracted, mins.tolist(), maxs.tolist(),
+                                                              currency_index.tolist(), period_index.tolist())]
+        return [ranges[i] for i in inverse.tolist()]
+
+    def run(self, queryset: Optional[QuerySet] = None, start_id: int = 0, resume: bool = False,
+            limit: Optional[int] = None, on_chunk: Optional[Callable[[NormalizationStats], None]] = None,
+            on_change: Optional[Callable[[Job, str], None]] = None) -> NormalizationStats:
+        """
+        Normalizes the jobs of `queryset` (every job with a salary by default)
+        that have no salary columns yet, with an id above `start_id`, or above the checkpoint with `resume`.
+        `on_chunk` gets the stats after every chunk and `on_change` every
+        changed job with its previous salary text.
+        """
+        if resume:
+            start_id = max(start_id, cache.get(self.checkpoint_key) or 0)
+        if queryset is None:
+            queryset = Job.objects.exclude(salary__isnull=True).exclude(salary='')
+        rows = queryset.filter(id__gt=start_id, salary_min__isnull=True).order_by('id').only('id', 'salary', *SALARY_FIELDS)
+        if limit:
+            rows = rows[:limit]
+
+        stats = NormalizationStats(last_id=start_id)
+        started = time.perf_counter()
+        for chunk in self._chunks(rows.iterator(chunk_size=self.batch_size)):
+            self._normalize_chunk(chunk, stats, on_change)
+            stats.seconds = time.perf_counter() - started
+            if on_chunk:
+                on_chunk(stats)
+        return stats
+
+    def _normalize_chunk(self, chunk: list[Job], stats: NormalizationStats,
+                         on_change: Optional[Callable[[Job, str], None]]):
+        changed = []
+        for job, parsed in zip(chunk, self.normalize([job.salary for job in chunk])):
+            if parsed is None:
+                stats.unparsed += 1
+                continue
+            previous = (job.salary, *(getattr(job, field) for field in SALARY_FIELDS))
+            if self.update_salary:
+                job.salary = format_salary(parsed.min, parsed.max)
+            job.salary_min, job.salary_max = parsed.min, parsed.max
+            job.salary_currency, job.salary_period = parsed.currency, parsed.period
+            if (job.salary, *(getattr(job, field) for field in SALARY_FIELDS)) != previous:
+                changed.append(job)
+                if on_change:
+                    on_change(job, previous[0])
+
+        if changed and not self.dry_run:
+            self._write(changed)
+        stats.rows += len(chunk)
+        stats.changed += len(changed)
+        stats.last_id = chunk[-1].id
+        if not self.dry_run:
+            cache.set(self.checkpoint_key, stats.last_id, timeout=None)
+
+    def _write(self, jobs: list[Job]):
+        by_values = defaultdict(list)
+        for job in jobs:
+            by_values[tuple(getattr(job, field) for field in self.fields)].append(job)
+        with transaction.atomic():
+            unique = []
+            for values, group in by_values.items():
+                if len(group) > 1:
+                    Job.objects.filter(id__in=[job.id for job in group]).update(**dict(zip(self.fields, values)))
+                else:
+                    unique.extend(group)
+            if unique:
+                Job.objects.bulk_update(unique, self.fields)
+
+    def _chunks(self, rows: Iterable[Job]) -> Iterable[list[Job]]:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.batch_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
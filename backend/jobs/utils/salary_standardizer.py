@@ -1,9 +1,92 @@
 import re
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+HOUR = 'hour'
+DAY = 'day'
+MONTH = 'month'
+YEAR = 'year'
+PERIOD_CHOICES = [(HOUR, 'Hour'), (DAY, 'Day'), (MONTH, 'Month'), (YEAR, 'Year')]
+# Multipliers from a period's amount to a monthly one
+MONTHLY_FACTORS = {HOUR: 168, DAY: 21, MONTH: 1, YEAR: 1 / 12}
+
+# PLN per unit, salaries are compared and displayed in PLN
+PLN_RATES = {'PLN': 1.0, 'EUR': 4.30, 'USD': 4.00, 'GBP': 5.00, 'CHF': 4.50}
+CURRENCY_CHOICES = [(currency, currency) for currency in PLN_RATES]
+
+CURRENCY_SYMBOLS = {'zł': 'PLN', '€': 'EUR', '$': 'USD', '£': 'GBP'}
+CURRENCY = re.compile(r'\b(PLN|EUR|USD|GBP|CHF)\b|zł|€|\$|£', re.IGNORECASE)
+PERIODS = [
+    (HOUR, re.compile(r'/\s*h\b|\bhour|\bgodz|\bh\s*$', re.IGNORECASE)),
+    (DAY, re.compile(r'\bday\b|/\s*d\b|\bdzie|\bdaily', re.IGNORECASE)),
+    (YEAR, re.compile(r'\byear|\brok|\brocz|\bannual', re.IGNORECASE)),
+    (MONTH, re.compile(r'\bmonth|\bmth|\bmies|\bmsc', re.IGNORECASE)),
+]
+DECIMALS = re.compile(r'(?<=\d)[,.]\d{1,2}(?!\d)')
+# Thousands may be separated by spaces, dots or commas ("12 000", "12.000", "12,000"), decimals are dropped first
+AMOUNT = re.compile(r'\d{1,3}(?:[ .,]\d{3})+(?!\d)|\d+')
+
+
+@dataclass(frozen=True)
+class SalaryRange:
+    """A salary as monthly PLN amounts, with the currency and period the offer was given in."""
+    min: int
+    max: int
+    currency: str
+    period: str
+
+
+def extract_salary(salary: Optional[str]) -> Optional[Tuple[int, int, str, Optional[str]]]:
+    """
+    The amounts, currency and explicitly given period (or None) of a salary
+    text, before any conversion. None when there is no amount.
+    """
+    if not salary:
+        return None
+    cleaned = DECIMALS.sub('', ' '.join(salary.split()))
+    amounts = [int(re.sub(r'[ .,]', '', amount)) for amount in AMOUNT.findall(cleaned)][:2]
+    if not amounts:
+        return None
+
+    match = CURRENCY.search(cleaned)
+    currency = (CURRENCY_SYMBOLS.get(match.group(0).lower()) or match.group(0).upper()) if match else 'PLN'
+    period = next((period for period, pattern in PERIODS if pattern.search(cleaned)), None)
+    return min(amounts), max(amounts), currency, period
+
+
+def parse_salary(salary: Optional[str]) -> Optional[SalaryRange]:
+    """
+    Parses a salary like "10 000 - 15 000 PLN", "12.000 zł", "25-30 EUR/h" or
+    "120 000 USD / year" into monthly PLN amounts. Without an explicit period,
+    amounts of at most 3 digits are taken as hourly rates. None when there
+    is no amount.
+    """
+    if (extracted := extract_salary(salary)) is None:
+        return None
+    low, high, currency, period = extracted
+    period = period or (HOUR if low < 1000 else MONTH)
+
+    factor = MONTHLY_FACTORS[period] * PLN_RATES[currency]
+    return SalaryRange(round(low * factor), round(high * factor), currency, period)
+
+
+def format_salary(min_num: int, max_num: int) -> str:
+    """Formats monthly PLN amounts like "10 000 - 15 000 PLN", or "10 000 PLN" for a single amount."""
+    # Format with thousands separator
+    min_formatted = f"{int(min_num):,}".replace(",", " ")
+    max_formatted = f"{int(max_num):,}".replace(",", " ")
+
+    if min_formatted == max_formatted:
+        return f"{min_formatted} PLN"
+
+    return f"{min_formatted} - {max_formatted} PLN"
 
 
 def standardize_salary(salary: str) -> str:
     """
     Standardizes salary format and converts hourly to monthly if needed.
+    This is the salary text shown to users, other currencies are only
+    converted in the numeric columns (see parse_salary).
     """
     try:
         min_num, max_num = average_salary(salary)
@@ -11,21 +94,13 @@ def standardize_salary(salary: str) -> str:
         if len(str(min_num)) <= 3:
             min_num *= 168
             max_num *= 168
-            
-        # Format with thousands separator
-        min_formatted = f"{int(min_num):,}".replace(",", " ")
-        max_formatted = f"{int(max_num):,}".replace(",", " ")
-        
-        if min_formatted == max_formatted:
-            return f"{min_formatted} PLN"
-        
-        return f"{min_formatted} - {max_formatted} PLN"
-    
+
+        return format_salary(min_num, max_num)
+
     except (IndexError, ValueError):
         return ""
 
 
-    
 def average_salary(salary):
     try:
         if not salary:
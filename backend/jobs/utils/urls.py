@@ -0,0 +1,12 @@
+from urllib.parse import urlsplit, urlunsplit
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Identity of a job posting URL: scheme and host lowercased, query string,
+    fragment and trailing slash dropped. Boards add tracking and display
+    parameters (?targetCurrency=pln, ?s=...) to the same posting.
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, '', ''))
@@ -1,4 +1,5 @@
-import { useState } from "react";
+import { useEffect, useRef, useState } from "react";
+import api from "../api";
 import "../styles/Job.css";
 import { Calendar } from "lucide-react";
 import DOMPurify from "dompurify";
@@ -6,10 +7,43 @@ import { useLanguage } from "../contexts/LanguageContext";
 import { formatDate } from "../config/DateFormater";
 import { ApplyButton } from "./ApplyButton";
 
+// The summary endpoint answers 202 while the summaries worker generates it
+const SUMMARY_POLL_INTERVAL = 2000;
+const SUMMARY_MAX_POLLS = 30;
+
 function Job({ job }) {
   const [showSummary, setShowSummary] = useState(false);
+  const [summary, setSummary] = useState(job.summary);
+  const [loadingSummary, setLoadingSummary] = useState(false);
+  const pollTimer = useRef(null);
   const { t, language } = useLanguage();
 
+  useEffect(() => () => clearTimeout(pollTimer.current), []);
+
+  const fetchSummary = async (polls = 0) => {
+    try {
+      const response = await api.get(`api/jobs/${job.id}/summary`);
+      if (response.status === 202 && polls < SUMMARY_MAX_POLLS) {
+        pollTimer.current = setTimeout(() => fetchSummary(polls + 1), SUMMARY_POLL_INTERVAL);
+        return;
+      }
+      setSummary(response.data.summary);
+    } catch (error) {
+      console.error("Error fetching summary:", error);
+    }
+    setLoadingSummary(false);
+  };
+
+  // Jobs saved in lazy summary mode are summarized on first view
+  const toggleSummary = () => {
+    setShowSummary(!showSummary);
+    if (showSummary || summary || loadingSummary || !["lazy", "pending"].includes(job.summary_status)) {
+      return;
+    }
+    setLoadingSummary(true);
+    fetchSummary();
+  };
+
   return (
     <div className="job-container">
       <div className="job-header">
@@ -43,17 +77,21 @@ function Job({ job }) {
       </div>
 
       <button
-        onClick={() => setShowSummary(!showSummary)}
+        onClick={toggleSummary}
         className="toggle-button"
       >
         {showSummary ? t("hide_summary") : t("show_summary")}
       </button>
 
-      {showSummary && job.summary && (
+      {showSummary && loadingSummary && !summary && (
+        <div className="job-summary">{t("loading")}</div>
+      )}
+
+      {showSummary && summary && (
         <div
           className="job-summary"
           dangerouslySetInnerHTML={{
-            __html: DOMPurify.sanitize(job.summary, {
+            __html: DOMPurify.sanitize(summary, {
               ALLOWED_TAGS: ["strong", "ul", "li", "br", "p"],
               ALLOWED_ATTR: [],
             }),